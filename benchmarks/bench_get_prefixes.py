@@ -0,0 +1,37 @@
+"""Compare the per-prefix substring scan and the tokenizing `get_prefixes` on large VALUES blocks.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_get_prefixes --values 90 5000
+"""
+
+import argparse
+import timeit
+
+from pandasaurus.utils.query_utils import get_backend, get_prefixes
+from pandasaurus.utils.sparql_queries import get_simple_enrichment_query
+
+
+def substring_scan(text, prefix_map):
+    """The previous implementation, kept here as the baseline."""
+    return [prefix for prefix in prefix_map if f"{prefix}:" in text]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--values", type=int, nargs="+", default=[90, 1000, 5000], help="CURIEs per VALUES block")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    backend = get_backend()
+    prefix_map = backend.prefix_map()
+    print(f"{len(prefix_map)} known prefixes")
+    for size in args.values:
+        curies = [f"CL:{i:07d}" for i in range(size)]
+        query = get_simple_enrichment_query(curies, curies, ["rdfs:subClassOf", "BFO:0000050"])
+        old = timeit.timeit(lambda: substring_scan(query, prefix_map.keys()), number=args.repeat) / args.repeat
+        new = timeit.timeit(lambda: get_prefixes(query, backend.known_prefixes()), number=args.repeat) / args.repeat
+        print(f"{size:>6} CURIEs  scan={old * 1e3:8.3f}ms  tokenize={new * 1e3:8.3f}ms  speedup={old / new:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
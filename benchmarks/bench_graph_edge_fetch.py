@@ -0,0 +1,63 @@
+"""Compare SPARQL request counts and wall time of graph edge retrieval strategies.
+
+The Ubergraph endpoint is replaced by a stub with a fixed per-request latency, so the numbers reflect round trips
+rather than server-side work. Run from the repository root:
+
+    python -m benchmarks.bench_graph_edge_fetch --terms 2000 --latency 0.05
+"""
+
+import argparse
+import time
+from unittest import mock
+
+from pandasaurus.query import Query
+from pandasaurus.utils.query_utils import chunks
+from pandasaurus.utils.sparql_queries import get_simple_enrichment_query
+
+
+def fake_endpoint(latency: float, counter: list):
+    def run(query: str):
+        counter.append(query)
+        time.sleep(latency)
+        return iter([])
+
+    return run
+
+
+def pairwise_strategy(query: Query, term_list):
+    """The previous implementation: every 45-term subject chunk against every 45-term object chunk."""
+    for s_chunk in chunks(term_list, 45):
+        query._batched_enrichment_results(
+            term_list,
+            lambda o_chunk: get_simple_enrichment_query(s_chunk, o_chunk, query._enrichment_property_list),
+            chunk_size=45,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--terms", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.01, help="Simulated seconds per SPARQL request")
+    args = parser.parse_args()
+    term_list = [f"CL:{i:07d}" for i in range(args.terms)]
+
+    with mock.patch(
+        "pandasaurus.curie_validator.run_sparql_query",
+        side_effect=lambda _: iter([{"term": term_list[0], "label": "cell"}]),
+    ):
+        query = Query(term_list[:1])
+
+    for name, strategy in [
+        ("pairwise (45x45)", lambda: pairwise_strategy(query, term_list)),
+        ("subject-bound", lambda: query.mirror_enrichment_for_graph_generation(term_list)),
+    ]:
+        requests = []
+        with mock.patch("pandasaurus.query.run_sparql_query", side_effect=fake_endpoint(args.latency, requests)):
+            start = time.perf_counter()
+            strategy()
+            elapsed = time.perf_counter() - start
+        print(f"{name:<18} requests={len(requests):>6} wall={elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Compare the row-wise and columnar builds of `GraphGenerator.generate_enrichment_graph`, and the SPARQL and
+indexed predicate existence checks of `apply_transitive_reduction`.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_graph_generation --edges 100000
+"""
+
+import argparse
+import random
+import time
+
+import pandas as pd
+from rdflib import OWL, RDF, RDFS, Graph, Literal, Namespace
+
+from pandasaurus.graph.graph_generator import GraphGenerator
+
+
+def make_enriched_df(edge_count: int, term_count: int) -> pd.DataFrame:
+    rng = random.Random(0)
+    rows = []
+    for _ in range(edge_count):
+        s, o = rng.sample(range(term_count), 2)
+        rows.append((f"CL:{s:07d}", f"cell {s}", "rdfs:subClassOf", f"CL:{o:07d}", f"cell {o}"))
+    return pd.DataFrame(rows, columns=["s", "s_label", "p", "o", "o_label"])
+
+
+def iterrows_build(enriched_df: pd.DataFrame) -> Graph:
+    """The previous implementation, kept here as the baseline."""
+    graph = Graph()
+    cl_namespace = Namespace("http://purl.obolibrary.org/obo/CL_")
+    for _, row in enriched_df.iterrows():
+        s = cl_namespace[row["s"].split(":")[-1]]
+        o = cl_namespace[row["o"].split(":")[-1]]
+        graph.add((s, RDFS.label, Literal(row["s_label"])))
+        graph.add((s, RDF.type, OWL.Class))
+        graph.add((o, RDFS.label, Literal(row["o_label"])))
+        graph.add((o, RDF.type, OWL.Class))
+        graph.add((s, RDFS.subClassOf, o))
+    return graph
+
+
+def sparql_predicate_exists(graph: Graph, predicate_uri) -> bool:
+    """The previous existence check, kept here as the baseline."""
+    from rdflib.plugins.sparql import prepareQuery
+
+    ask_query = prepareQuery("SELECT ?s ?p WHERE { ?s ?p ?o }")
+    return bool(graph.query(ask_query, initBindings={"p": predicate_uri}, initNs={"rdfs": RDFS}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--edges", type=int, default=100_000)
+    parser.add_argument("--terms", type=int, default=5_000)
+    args = parser.parse_args()
+    enriched_df = make_enriched_df(args.edges, args.terms)
+
+    timings = {}
+    for name, build in [("iterrows", iterrows_build), ("columnar", GraphGenerator.generate_enrichment_graph)]:
+        start = time.perf_counter()
+        graph = build(enriched_df)
+        timings[name] = time.perf_counter() - start
+        print(f"{name:<9} triples={len(graph):>8} time={timings[name]:.2f}s")
+    print(f"speedup   {timings['iterrows'] / timings['columnar']:.1f}x")
+
+    predicate_uris = [RDFS.subClassOf, GraphGenerator._normalize_predicate("BFO:0000050")]
+    for name, exists in [("sparql", sparql_predicate_exists), ("indexed", GraphGenerator._predicate_exists)]:
+        start = time.perf_counter()
+        for predicate_uri in predicate_uris:
+            exists(graph, predicate_uri)
+        elapsed = time.perf_counter() - start
+        share = elapsed / (timings["columnar"] + elapsed)
+        print(
+            f"{name:<9} existence check of {len(predicate_uris)} predicates time={elapsed:.4f}s ({share:.1%} of build)"
+        )
+
+
+if __name__ == "__main__":
+    main()
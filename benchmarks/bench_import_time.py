@@ -0,0 +1,46 @@
+"""Report the import time of pandasaurus entry points and their slowest dependencies.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_import_time --top 10
+"""
+
+import argparse
+import subprocess
+import sys
+
+ENTRY_POINTS = ["pandasaurus.resources.term", "pandasaurus.curie_validator", "pandasaurus.query"]
+
+
+def import_profile(module: str):
+    """Returns (cumulative microseconds, depth, name) rows of `python -X importtime` for the entry point."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                rows.append((int(cumulative), (len(name) - len(name.lstrip()) - 1) // 2, name.strip()))
+    # Nested imports are printed before their parent, so the entry point's block ends with its own line and
+    # starts after the previous top-level line.
+    end = next(i for i, row in enumerate(rows) if row[1] == 0 and row[2] == module)
+    start = max((i for i, row in enumerate(rows[:end]) if row[1] == 0), default=-1) + 1
+    return rows[start : end + 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=5, help="Number of slowest top-level imports to list")
+    args = parser.parse_args()
+    for module in ENTRY_POINTS:
+        rows = import_profile(module)
+        print(f"{module:<36} {rows[-1][0] / 1e6:.3f}s")
+        dependencies = [(cumulative, name) for cumulative, depth, name in rows if depth == 1]
+        for cumulative, name in sorted(dependencies, reverse=True)[: args.top]:
+            print(f"    {name:<32} {cumulative / 1e6:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Compare the previous row-dict path from SPARQL JSON results to a DataFrame with the columnar TSV path.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_result_parsing --rows 1000000
+"""
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+
+import pandas as pd
+import requests
+
+from pandasaurus.backends.http_backend import HttpSparqlBackend
+from pandasaurus.utils.columnar import ColumnarResultBuilder
+
+PREFIX_MAP = {"CL": "http://purl.obolibrary.org/obo/CL_", "rdfs": "http://www.w3.org/2000/01/rdf-schema#"}
+COLUMNS = ["s", "s_label", "p", "o", "o_label"]
+OBO = "http://purl.obolibrary.org/obo/CL_"
+PREDICATES = ["http://www.w3.org/2000/01/rdf-schema#subClassOf", "http://purl.obolibrary.org/obo/BFO_0000050"]
+
+
+def make_rows(row_count: int, term_count: int):
+    rng = random.Random(0)
+    for _ in range(row_count):
+        s, o = rng.randrange(term_count), rng.randrange(term_count)
+        yield f"{OBO}{s:07d}", f"cell {s}", rng.choice(PREDICATES), f"{OBO}{o:07d}", f"cell {o}"
+
+
+def json_body(row_count: int, term_count: int) -> bytes:
+    bindings = [
+        {
+            "s": {"type": "uri", "value": s},
+            "s_label": {"type": "literal", "value": s_label},
+            "p": {"type": "uri", "value": p},
+            "o": {"type": "uri", "value": o},
+            "o_label": {"type": "literal", "value": o_label},
+        }
+        for s, s_label, p, o, o_label in make_rows(row_count, term_count)
+    ]
+    return json.dumps({"head": {"vars": COLUMNS}, "results": {"bindings": bindings}}).encode("utf-8")
+
+
+def tsv_body(row_count: int, term_count: int) -> bytes:
+    lines = ["\t".join(f"?{column}" for column in COLUMNS)]
+    lines.extend(
+        f'<{s}>\t"{s_label}"@en\t<{p}>\t<{o}>\t"{o_label}"@en'
+        for s, s_label, p, o, o_label in make_rows(row_count, term_count)
+    )
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class StubSession:
+    """Answers every query with the same pre-rendered response body."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def post(self, url, data=None, headers=None, timeout=None):
+        response = requests.Response()
+        response.status_code = 200
+        response.encoding = "utf-8"
+        response._content = self.body
+        return response
+
+
+def row_dataframe(backend: HttpSparqlBackend) -> pd.DataFrame:
+    """The previous implementation, kept here as the baseline: SPARQL JSON bindings contracted cell by cell into one
+    dict per row, collected in a list and copied into a DataFrame."""
+    response = backend.session.post(backend.endpoint)
+    rows = (
+        {variable: backend._contract(binding["value"]) for variable, binding in row.items()}
+        for row in response.json()["results"]["bindings"]
+    )
+    return pd.DataFrame([res for res in rows], columns=COLUMNS)
+
+
+def columnar_dataframe(backend: HttpSparqlBackend, categorical: bool) -> pd.DataFrame:
+    builder = ColumnarResultBuilder(COLUMNS)
+    builder.add_rows(backend.query("SELECT * WHERE { ?s ?p ?o }"))
+    return builder.to_frame(categorical=categorical)
+
+
+def measure(label: str, func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    df = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size = df.memory_usage(deep=True).sum()
+    print(f"{label:<28} {elapsed:7.2f}s  peak={peak / 2**20:8.1f} MiB  frame={size / 2**20:8.1f} MiB")
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--terms", type=int, default=20_000)
+    args = parser.parse_args()
+    json_backend = HttpSparqlBackend(
+        prefix_map=PREFIX_MAP, session=StubSession(json_body(args.rows, args.terms)), result_format="json"
+    )
+    tsv_backend = HttpSparqlBackend(prefix_map=PREFIX_MAP, session=StubSession(tsv_body(args.rows, args.terms)))
+    print(f"{args.rows} rows over {args.terms} terms")
+    baseline = measure("JSON rows -> DataFrame", lambda: row_dataframe(json_backend))
+    columnar = measure("TSV -> columns (object)", lambda: columnar_dataframe(tsv_backend, categorical=False))
+    measure("TSV -> columns (category)", lambda: columnar_dataframe(tsv_backend, categorical=True))
+    pd.testing.assert_frame_equal(baseline, columnar)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Compare the networkx round trip previously used for transitive reduction with the native reduction engine.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_transitive_reduction --edges 50000
+"""
+
+import argparse
+import random
+import time
+
+import pandas as pd
+from rdflib import RDFS, Graph, URIRef
+
+from pandasaurus.graph.graph_generator import GraphGenerator
+from pandasaurus.graph.transitive_reduction import transitive_reduction_df
+
+
+def make_enriched_df(edge_count: int, term_count: int) -> pd.DataFrame:
+    """Random subClassOf DAG: edges always point from a higher to a lower term number."""
+    rng = random.Random(0)
+    edges = set()
+    while len(edges) < edge_count:
+        s, o = rng.sample(range(term_count), 2)
+        edges.add((max(s, o), min(s, o)))
+    rows = [(f"CL:{s:07d}", f"cell {s}", "rdfs:subClassOf", f"CL:{o:07d}", f"cell {o}") for s, o in edges]
+    return pd.DataFrame(rows, columns=["s", "s_label", "p", "o", "o_label"])
+
+
+def networkx_reduction(graph: Graph) -> Graph:
+    """The previous implementation, kept here as the baseline."""
+    import networkx as nx
+
+    subgraph = Graph()
+    for triple in graph.triples((None, RDFS.subClassOf, None)):
+        subgraph.add(triple)
+    nx_graph = nx.DiGraph()
+    for s, p, o in subgraph:
+        if isinstance(o, URIRef):
+            nx_graph.add_edge(str(s), str(o), label="subClassOf")
+    reduced = nx.transitive_reduction(nx_graph)
+    for source, target in set(nx_graph.edges) - set(reduced.edges):
+        graph.remove((URIRef(source), RDFS.subClassOf, URIRef(target)))
+    return graph
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--edges", type=int, default=50_000)
+    parser.add_argument("--terms", type=int, default=5_000)
+    args = parser.parse_args()
+    enriched_df = make_enriched_df(args.edges, args.terms)
+
+    start = time.perf_counter()
+    graph = networkx_reduction(GraphGenerator.generate_enrichment_graph(enriched_df))
+    baseline = time.perf_counter() - start
+    print(f"networkx   triples={len(graph):>8} time={baseline:.2f}s")
+
+    start = time.perf_counter()
+    graph = GraphGenerator.apply_transitive_reduction(
+        GraphGenerator.generate_enrichment_graph(enriched_df), ["rdfs:subClassOf"]
+    )
+    on_graph = time.perf_counter() - start
+    print(f"native     triples={len(graph):>8} time={on_graph:.2f}s (reduction on the rdflib graph)")
+
+    start = time.perf_counter()
+    graph = GraphGenerator.generate_enrichment_graph(transitive_reduction_df(enriched_df))
+    on_df = time.perf_counter() - start
+    print(f"native-df  triples={len(graph):>8} time={on_df:.2f}s (reduction on the DataFrame, as Query.graph does)")
+    print(f"speedup    {baseline / on_graph:.1f}x / {baseline / on_df:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
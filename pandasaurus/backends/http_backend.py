@@ -0,0 +1,154 @@
+import io
+import re
+from typing import Dict, Iterator, List, Mapping, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from pandasaurus.backends.sparql_backend import SparqlBackend
+
+UBERGRAPH_SPARQL_ENDPOINT = "https://ubergraph.apps.renci.org/sparql"
+_RESULT_MEDIA_TYPES = {"json": "application/sparql-results+json", "tsv": "text/tab-separated-values"}
+_TSV_ESCAPE = re.compile(r"\\(.)")
+_TSV_UNESCAPES = {"t": "\t", "n": "\n", "r": "\r", "b": "\b", "f": "\f"}
+_UNDECODED = object()
+
+
+class HttpSparqlBackend(SparqlBackend):
+    """Backend posting queries straight to a SPARQL endpoint over a pooled, keep-alive HTTP session.
+
+    Connections (and their TLS handshakes) are reused across queries, responses are requested gzip-compressed, and
+    URIs in the results are contracted to CURIEs the same way oaklib does, so it is a drop-in replacement for
+    `UbergraphBackend`. Point `endpoint` at a mirror or a local mock server for testing.
+
+    Results are requested as SPARQL TSV by default and parsed one line at a time, so no document tree of the whole
+    result is built, and every distinct term is decoded and contracted only once per query.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = UBERGRAPH_SPARQL_ENDPOINT,
+        prefix_map: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+        pool_size: int = 10,
+        session: Optional[requests.Session] = None,
+        result_format: str = "tsv",
+    ):
+        """
+        Args:
+            endpoint: SPARQL endpoint URL.
+            prefix_map: CURIE prefix map used for PREFIX declarations and URI contraction. Defaults to the OBO prefix
+                map oaklib uses for Ubergraph.
+            timeout: Optional per-request timeout in seconds.
+            pool_size: Number of keep-alive connections kept open; match it to the number of concurrent workers.
+            session: Optional preconfigured session, e.g. with authentication or a mounted mock adapter.
+            result_format: "tsv" for SPARQL TSV results, or "json" for SPARQL JSON results.
+        """
+        if result_format not in _RESULT_MEDIA_TYPES:
+            raise ValueError(f"result_format must be one of {', '.join(_RESULT_MEDIA_TYPES)}")
+        self.endpoint = endpoint
+        self.result_format = result_format
+        self.timeout = timeout
+        self.session = session if session is not None else self._create_session(pool_size)
+        self._prefix_map: Optional[Dict[str, str]] = dict(prefix_map) if prefix_map is not None else None
+        self._converter = None
+
+    def query(self, query: str, prefixes: Optional[List[str]] = None) -> Iterator[Dict[str, str]]:
+        """Posts a SPARQL query to the endpoint.
+
+        Args:
+            query: SPARQL query text
+            prefixes: CURIE prefixes to declare in front of the query
+
+        Returns:
+            Iterator of result rows with URIs contracted to CURIEs
+
+        """
+        prefix_map = self.prefix_map()
+        declarations = "".join(f"PREFIX {prefix}: <{prefix_map[prefix]}>\n" for prefix in prefixes or [])
+        response = self.session.post(
+            self.endpoint,
+            data={"query": declarations + query},
+            headers={"Accept": _RESULT_MEDIA_TYPES[self.result_format]},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        if self.result_format == "tsv":
+            return self._parse_tsv(response.text)
+        contracted: Dict[str, str] = {}
+        return (
+            {variable: self._contract_once(binding["value"], contracted) for variable, binding in row.items()}
+            for row in response.json()["results"]["bindings"]
+        )
+
+    def prefix_map(self) -> Dict[str, str]:
+        """Returns the CURIE prefix map used for PREFIX declarations and URI contraction."""
+        if self._prefix_map is None:
+            from oaklib.interfaces.basic_ontology_interface import (
+                get_default_prefix_map,
+            )
+
+            self._prefix_map = dict(get_default_prefix_map())
+        return self._prefix_map
+
+    def close(self) -> None:
+        """Closes the pooled connections."""
+        self.session.close()
+
+    def _parse_tsv(self, text: str) -> Iterator[Dict[str, str]]:
+        lines = io.StringIO(text, newline="\n")
+        header = next(lines, "").rstrip("\r\n")
+        if not header:
+            return
+        variables = [name[1:] if name[:1] in "?$" else name for name in header.split("\t")]
+        # Terms repeat heavily across rows, so each distinct field is decoded once and the string is shared.
+        decoded: Dict[str, Optional[str]] = {"": None}
+        for line in lines:
+            line = line.rstrip("\r\n")
+            if not line:
+                continue
+            row = {}
+            for variable, field in zip(variables, line.split("\t")):
+                value = decoded.get(field, _UNDECODED)
+                if value is _UNDECODED:
+                    value = decoded[field] = self._decode_tsv_term(field)
+                if value is not None:
+                    row[variable] = value
+            yield row
+
+    def _decode_tsv_term(self, field: str) -> str:
+        if field[0] == "<":
+            return self._contract(field[1:-1])
+        if field[0] == '"':
+            # Language tags and datatypes follow the closing quote and are dropped, as in the JSON results.
+            value = field[1 : field.rindex('"')]
+            if "\\" in value:
+                value = _TSV_ESCAPE.sub(lambda match: _TSV_UNESCAPES.get(match.group(1), match.group(1)), value)
+            return self._contract(value)
+        if field.startswith("_:"):
+            return field[2:]
+        return field
+
+    def _contract_once(self, value: str, contracted: Dict[str, str]) -> str:
+        result = contracted.get(value)
+        if result is None:
+            result = contracted[value] = self._contract(value)
+        return result
+
+    def _contract(self, value: str) -> str:
+        if not value.startswith("http://"):
+            return value
+        if self._converter is None:
+            import curies
+
+            self._converter = curies.Converter.from_prefix_map(self.prefix_map(), strict=False)
+        return self._converter.compress(value) or value
+
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Accept": "application/sparql-results+json", "Accept-Encoding": "gzip, deflate"})
+        return session
@@ -0,0 +1,430 @@
+import re
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from pandasaurus.backends.sparql_backend import SparqlBackend
+
+SUBCLASS_OF = "rdfs:subClassOf"
+PART_OF = "BFO:0000050"
+HAS_PART = "BFO:0000051"
+CELL = "CL:0000000"
+
+_VALUES_BLOCK = re.compile(r"VALUES \?(\w+) \{([^}]*)\}")
+_QUOTED_LITERAL = re.compile(r"'([^']*)'")
+_DEFINED_BY = re.compile(r"rdfs:isDefinedBy <http://purl\.obolibrary\.org/obo/(\w+)\.owl>")
+
+
+class OntologySnapshot:
+    """In-memory, integer-indexed copy of an ontology's relationship graph.
+
+    Terms are mapped to consecutive integers and the direct (non-redundant) relationships of each predicate are
+    stored as CSR adjacency arrays. The redundant graph that Ubergraph materialises (subClassOf closure and
+    existential relationships propagated over subClassOf) is computed on demand and memoized per term.
+    """
+
+    def __init__(
+        self,
+        edges: pd.DataFrame,
+        terms: pd.DataFrame,
+        synonyms: Optional[pd.DataFrame] = None,
+        subsets: Optional[pd.DataFrame] = None,
+        transitive_predicates: Iterable[str] = (PART_OF, HAS_PART),
+    ):
+        """
+        Args:
+            edges: Direct relationships with columns 's', 'p' and 'o' holding CURIEs, e.g. 'rdfs:subClassOf' or
+                'BFO:0000050' predicates from a relation-graph or Ubergraph non-redundant export.
+            terms: Term metadata with columns 'id' and 'label', and optionally 'replaced_by' (CURIE of the term
+                replacing an obsoleted term) and 'deprecated'.
+            synonyms: Optional synonyms with columns 'id', 'type' ('exact', 'narrow', 'related' or 'broad') and
+                'name'.
+            subsets: Optional subset membership with columns 'id' and 'subset' (the subset label).
+            transitive_predicates: Predicates other than subClassOf that are closed transitively.
+        """
+        self._ids: List[str] = list(pd.unique(pd.concat([terms["id"], edges["s"], edges["o"]], ignore_index=True)))
+        self._index: Dict[str, int] = {curie: i for i, curie in enumerate(self._ids)}
+        term_count = len(self._ids)
+
+        self._labels: List[Optional[str]] = [None] * term_count
+        for curie, label in zip(terms["id"], terms["label"]):
+            if isinstance(label, str):
+                self._labels[self._index[curie]] = label
+
+        self._replaced_by: Dict[int, int] = {}
+        if "replaced_by" in terms.columns:
+            deprecated = terms["deprecated"] if "deprecated" in terms.columns else terms["replaced_by"].notna()
+            for curie, new_curie, is_deprecated in zip(terms["id"], terms["replaced_by"], deprecated):
+                if is_deprecated and isinstance(new_curie, str) and new_curie in self._index:
+                    self._replaced_by[self._index[curie]] = self._index[new_curie]
+
+        self._adjacency: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for predicate, predicate_edges in edges.groupby("p", sort=False):
+            s_idx = predicate_edges["s"].map(self._index).to_numpy(dtype=np.int64)
+            o_idx = predicate_edges["o"].map(self._index).to_numpy(dtype=np.int64)
+            self._adjacency[predicate] = self._build_csr(s_idx, o_idx, term_count)
+
+        self._synonyms: Dict[int, List[Tuple[str, str]]] = {}
+        if synonyms is not None:
+            for curie, synonym_type, name in zip(synonyms["id"], synonyms["type"], synonyms["name"]):
+                if curie in self._index:
+                    self._synonyms.setdefault(self._index[curie], []).append((synonym_type, name))
+
+        self._subsets: Dict[str, List[int]] = {}
+        if subsets is not None:
+            for curie, subset in zip(subsets["id"], subsets["subset"]):
+                if curie in self._index:
+                    self._subsets.setdefault(subset, []).append(self._index[curie])
+
+        self._transitive_predicates = frozenset(transitive_predicates)
+        self._closures: Dict[str, Dict[int, FrozenSet[int]]] = {}
+
+    @classmethod
+    def from_files(
+        cls,
+        edges_path: str,
+        terms_path: str,
+        synonyms_path: Optional[str] = None,
+        subsets_path: Optional[str] = None,
+        **kwargs,
+    ) -> "OntologySnapshot":
+        """Loads a snapshot from Parquet, CSV or TSV exports (chosen by file extension).
+
+        Args:
+            edges_path: Table with 's', 'p' and 'o' columns
+            terms_path: Table with 'id', 'label' and optionally 'replaced_by' and 'deprecated' columns
+            synonyms_path: Optional table with 'id', 'type' and 'name' columns
+            subsets_path: Optional table with 'id' and 'subset' columns
+
+        Returns:
+            OntologySnapshot
+
+        """
+        return cls(
+            _read_table(edges_path),
+            _read_table(terms_path),
+            synonyms=_read_table(synonyms_path) if synonyms_path else None,
+            subsets=_read_table(subsets_path) if subsets_path else None,
+            **kwargs,
+        )
+
+    @classmethod
+    def from_oak(cls, selector: str, **kwargs) -> "OntologySnapshot":
+        """Loads a snapshot through any oaklib adapter, e.g. an OBO, OWL or OBO Graphs JSON file.
+
+        Args:
+            selector: oaklib input selector, e.g. 'cl.obo', 'pronto:cl.obo' or 'sqlite:obo:cl'
+
+        Returns:
+            OntologySnapshot
+
+        """
+        from oaklib.selector import get_adapter
+
+        adapter = get_adapter(selector)
+        entities = [curie for curie in adapter.entities(filter_obsoletes=False)]
+        edges = pd.DataFrame(list(adapter.relationships(entities)), columns=["s", "p", "o"])
+        terms = pd.DataFrame(list(adapter.labels(entities)), columns=["id", "label"])
+        obsoletes = set(adapter.obsoletes())
+        terms["deprecated"] = terms["id"].isin(obsoletes)
+        terms["replaced_by"] = [
+            next(iter(adapter.entity_metadata_map(curie).get("IAO:0100001", [])), None) if curie in obsoletes else None
+            for curie in terms["id"]
+        ]
+        synonyms = pd.DataFrame(
+            [
+                (curie, predicate.split("has")[-1].replace("Synonym", "").lower(), name)
+                for curie in entities
+                for predicate, name in adapter.alias_relationships(curie, exclude_labels=True)
+                if predicate.startswith("oio:has") and predicate.endswith("Synonym")
+            ],
+            columns=["id", "type", "name"],
+        )
+        subsets = pd.DataFrame(
+            [
+                (curie, adapter.label(subset) or subset.split(":")[-1])
+                for subset in adapter.subsets()
+                for curie in adapter.subset_members(subset)
+            ],
+            columns=["id", "subset"],
+        )
+        return cls(edges, terms, synonyms=synonyms, subsets=subsets, **kwargs)
+
+    def __contains__(self, curie: str) -> bool:
+        return curie in self._index
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def label(self, curie: str) -> Optional[str]:
+        """Returns the label of a term, or None if the term is unknown or unlabelled."""
+        index = self._index.get(curie)
+        return self._labels[index] if index is not None else None
+
+    def simple_enrichment(
+        self, s_iri_list: List[str], o_iri_list: Optional[List[str]], property_list: List[str]
+    ) -> List[Dict[str, str]]:
+        """Returns redundant-graph edges from subjects to objects, as `get_simple_enrichment_query` does.
+
+        Args:
+            s_iri_list: Subject CURIEs
+            o_iri_list: Object CURIEs, or None to return edges to every labelled object
+            property_list: Predicate CURIEs
+
+        Returns:
+            Rows with 's', 's_label', 'p', 'o' and 'o_label' keys
+
+        """
+        objects = None if o_iri_list is None else self._indices(o_iri_list)
+        rows = []
+        for s in self._indices(s_iri_list):
+            if self._labels[s] is None:
+                continue
+            for predicate in property_list:
+                for o in self._closure(s, predicate):
+                    if o != s and self._labels[o] is not None and (objects is None or o in objects):
+                        rows.append(self._edge_row(s, predicate, o))
+        return rows
+
+    def full_enrichment(self, s_iri_list: List[str], o_iri_list: List[str]) -> List[Dict[str, str]]:
+        """Returns intermediate classes between subjects and objects, as `get_full_enrichment_query` does.
+
+        Args:
+            s_iri_list: Subject CURIEs
+            o_iri_list: Object CURIEs
+
+        Returns:
+            Rows with 's', 's_label', 'x', 'x_label', 'o' and 'o_label' keys
+
+        """
+        objects = self._indices(o_iri_list)
+        rows = []
+        for s in self._indices(s_iri_list):
+            for x in self._closure(s, SUBCLASS_OF):
+                if x == s:
+                    continue
+                for o in self._closure(x, SUBCLASS_OF) & objects:
+                    if None not in (self._labels[s], self._labels[x], self._labels[o]):
+                        rows.append(
+                            {
+                                "s": self._ids[s],
+                                "s_label": self._labels[s],
+                                "x": self._ids[x],
+                                "x_label": self._labels[x],
+                                "o": self._ids[o],
+                                "o_label": self._labels[o],
+                            }
+                        )
+        return rows
+
+    def contextual_members(self, context_list: List[str]) -> List[Dict[str, str]]:
+        """Returns cell types that are part of any context term, as `get_contextual_enrichment_query` does.
+
+        Args:
+            context_list: Anatomical structure CURIEs
+
+        Returns:
+            Rows with 'context', 'term' and 'label' keys
+
+        """
+        contexts = self._indices(context_list)
+        cell = self._index.get(CELL)
+        rows = []
+        for term, label in enumerate(self._labels):
+            if label is None or cell is None or cell not in self._closure(term, SUBCLASS_OF):
+                continue
+            for context in self._closure(term, PART_OF) & contexts:
+                rows.append({"context": self._ids[context], "term": self._ids[term], "label": label})
+        return rows
+
+    def ancestor_paths(self, seed_list: List[str], step_count: int, prefix: Optional[str] = None) -> List[dict]:
+        """Returns direct subClassOf paths of up to `step_count` hops, as `get_ancestor_enrichment_query` does.
+
+        Args:
+            seed_list: Seed CURIEs
+            step_count: Maximum number of hops
+            prefix: Only walk through ancestors with this CURIE prefix, e.g. 'CL'
+
+        Returns:
+            Rows with 's' and 'o0' ... 'o{step_count - 1}' keys, one per maximal path
+
+        """
+        rows = []
+
+        def walk(path: List[int]):
+            parents = [] if len(path) > step_count else self._neighbours(path[-1], SUBCLASS_OF)
+            parents = [p for p in parents if prefix is None or self._ids[p].startswith(f"{prefix}:")]
+            if not parents and len(path) > 1:
+                row = {"s": self._ids[path[0]]}
+                row.update({f"o{step}": self._ids[node] for step, node in enumerate(path[1:])})
+                rows.append(row)
+            for parent in parents:
+                walk(path + [parent])
+
+        for s in self._indices(seed_list):
+            walk([s])
+        return rows
+
+    def term_labels(self, term_list: List[str]) -> List[Dict[str, str]]:
+        """Returns known terms with their labels, as `get_label_query` does."""
+        rows = []
+        for term in self._indices(term_list):
+            row = {"term": self._ids[term]}
+            if self._labels[term] is not None:
+                row["label"] = self._labels[term]
+            rows.append(row)
+        return rows
+
+    def term_validation(self, term_list: List[str]) -> List[Dict[str, str]]:
+        """Returns known terms with their labels and replacements, as `get_term_validation_query` does."""
+        replacements = {row["term"]: row for row in self.replacements(term_list)}
+        return [{**row, **replacements.get(row["term"], {})} for row in self.term_labels(term_list)]
+
+    def replacements(self, term_list: List[str]) -> List[Dict[str, str]]:
+        """Returns obsoleted terms and their replacements, as `get_replaced_by_query` does."""
+        rows = []
+        for term in self._indices(term_list):
+            new_term = self._replaced_by.get(term)
+            if new_term is not None and None not in (self._labels[term], self._labels[new_term]):
+                rows.append(
+                    {
+                        "term": self._ids[term],
+                        "label": self._labels[term],
+                        "depr_status": "true",
+                        "new_term": self._ids[new_term],
+                        "new_term_label": self._labels[new_term],
+                    }
+                )
+        return rows
+
+    def synonyms(self, term_list: List[str]) -> List[Dict[str, str]]:
+        """Returns one row per synonym, as `get_synonym_query` does."""
+        return [
+            {"s": self._ids[term], f"{synonym_type}_synonym": name}
+            for term in self._indices(term_list)
+            for synonym_type, name in self._synonyms.get(term, [])
+        ]
+
+    def slim_members(self, slim_name: str) -> List[Dict[str, str]]:
+        """Returns members of a subset, as `get_slim_members_query` does."""
+        return [{"term": self._ids[term]} for term in self._subsets.get(slim_name, [])]
+
+    def _indices(self, curie_list: Iterable[str]) -> FrozenSet[int]:
+        return frozenset(self._index[curie] for curie in curie_list if curie in self._index)
+
+    def _neighbours(self, node: int, predicate: str) -> np.ndarray:
+        adjacency = self._adjacency.get(predicate)
+        if adjacency is None:
+            return np.empty(0, dtype=np.int64)
+        indptr, indices = adjacency
+        return indices[indptr[node] : indptr[node + 1]]
+
+    def _closure(self, node: int, predicate: str) -> FrozenSet[int]:
+        """Targets of `node` in the redundant graph; the subClassOf closure is reflexive."""
+        memo = self._closures.setdefault(predicate, {})
+        closure = memo.get(node)
+        if closure is None:
+            if predicate == SUBCLASS_OF:
+                closure = self._reachable([node], lambda n: self._neighbours(n, SUBCLASS_OF))
+            else:
+                # P edges of any superclass, followed by subClassOf (and P again when P is transitive)
+                starts = [t for a in self._closure(node, SUBCLASS_OF) for t in self._neighbours(a, predicate)]
+                transitive = predicate in self._transitive_predicates
+
+                def successors(n: int) -> Iterable[int]:
+                    yield from self._neighbours(n, SUBCLASS_OF)
+                    if transitive:
+                        yield from self._neighbours(n, predicate)
+
+                closure = self._reachable(starts, successors)
+            memo[node] = closure
+        return closure
+
+    @staticmethod
+    def _reachable(starts: Iterable[int], successors: Callable[[int], Iterable[int]]) -> FrozenSet[int]:
+        seen = set(int(node) for node in starts)
+        stack = list(seen)
+        while stack:
+            for successor in successors(stack.pop()):
+                successor = int(successor)
+                if successor not in seen:
+                    seen.add(successor)
+                    stack.append(successor)
+        return frozenset(seen)
+
+    @staticmethod
+    def _build_csr(s_idx: np.ndarray, o_idx: np.ndarray, node_count: int) -> Tuple[np.ndarray, np.ndarray]:
+        order = np.argsort(s_idx, kind="stable")
+        indptr = np.zeros(node_count + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(np.bincount(s_idx, minlength=node_count))
+        return indptr, o_idx[order]
+
+    def _edge_row(self, s: int, predicate: str, o: int) -> Dict[str, str]:
+        return {
+            "s": self._ids[s],
+            "s_label": self._labels[s],
+            "p": predicate,
+            "o": self._ids[o],
+            "o_label": self._labels[o],
+        }
+
+
+class SnapshotBackend(SparqlBackend):
+    """Backend answering the queries of `pandasaurus.utils.sparql_queries` in-process from an `OntologySnapshot`.
+
+    Queries are recognised by their template and their VALUES blocks are evaluated against the snapshot, so no
+    SPARQL engine is involved. Queries that do not come from a supported template raise NotImplementedError.
+    """
+
+    def __init__(self, snapshot: OntologySnapshot):
+        self.snapshot = snapshot
+        # Ordered from the most to the least specific marker
+        self._handlers: List[Tuple[str, Callable[[str, Dict[str, List[str]]], List[dict]]]] = [
+            ("rdfs:subClassOf* ?x", lambda q, v: self.snapshot.full_enrichment(v["s"], v["o"])),
+            ("BFO:0000050 ?context", lambda q, v: self.snapshot.contextual_members(v["context"])),
+            ("OPTIONAL { ?term owl:deprecated", lambda q, v: self.snapshot.term_validation(v["term"])),
+            ("IAO:0100001", lambda q, v: self.snapshot.replacements(v["term"])),
+            ("?term rdf:type owl:Class", lambda q, v: self.snapshot.term_labels(v["term"])),
+            ("rdfs:subClassOf ?o0", self._ancestor_paths),
+            ("oio:hasExactSynonym", lambda q, v: self.snapshot.synonyms(v["s"])),
+            ("?slim rdfs:label ?slim_name", self._slim_members),
+            ("?slim rdfs:label ?slim_label", self._slim_members),
+            (
+                "GRAPH <http://reasoner.renci.org/redundant>",
+                lambda q, v: self.snapshot.simple_enrichment(v["s"], v.get("o"), v["p"]),
+            ),
+        ]
+
+    def query(self, query: str, prefixes: Optional[List[str]] = None) -> Iterator[Dict[str, str]]:
+        """Answers a query built by `pandasaurus.utils.sparql_queries` from the snapshot."""
+        values = {variable: block.split() for variable, block in _VALUES_BLOCK.findall(query)}
+        for marker, handler in self._handlers:
+            if marker in query:
+                return iter(handler(query, values))
+        raise NotImplementedError(f"The ontology snapshot backend cannot answer this query: {query}")
+
+    def prefix_map(self) -> Dict[str, str]:
+        """Returns an empty prefix map; snapshot terms are already CURIEs."""
+        return {}
+
+    def _ancestor_paths(self, query: str, values: Dict[str, List[str]]) -> List[dict]:
+        defined_by = _DEFINED_BY.search(query)
+        prefix = defined_by.group(1).upper() if defined_by else None
+        return self.snapshot.ancestor_paths(values["s"], query.count("OPTIONAL") + 1, prefix)
+
+    def _slim_members(self, query: str, values: Dict[str, List[str]]) -> List[dict]:
+        # Slim names are the quoted literals of either the FILTER or the VALUES ?slim_name block
+        return [
+            {"slim_name": slim_name, **row}
+            for slim_name in _QUOTED_LITERAL.findall(query)
+            for row in self.snapshot.slim_members(slim_name)
+        ]
+
+
+def _read_table(path: str) -> pd.DataFrame:
+    suffix = Path(path).suffix.lower()
+    if suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path, sep="," if suffix == ".csv" else "\t")
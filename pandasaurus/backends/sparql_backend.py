@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from oaklib.implementations import UbergraphImplementation
+
+
+class SparqlBackend(ABC):
+    """Executes the SPARQL queries built in `pandasaurus.utils.sparql_queries`.
+
+    `run_sparql_query` delegates to the active backend, so swapping backends changes where queries are answered
+    without touching `Query`, `CurieValidator` or `SlimManager`.
+    """
+
+    @abstractmethod
+    def query(self, query: str, prefixes: Optional[List[str]] = None) -> Iterator[Dict[str, str]]:
+        """Runs a SPARQL query.
+
+        Args:
+            query: SPARQL query text
+            prefixes: CURIE prefixes referenced in the query
+
+        Returns:
+            Iterator of result rows, mapping variable names to CURIEs or literal values
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def prefix_map(self) -> Dict[str, str]:
+        """Returns the CURIE prefix map known to the backend."""
+        raise NotImplementedError
+
+    def known_prefixes(self) -> FrozenSet[str]:
+        """Returns the prefixes of `prefix_map`, computed once per backend."""
+        known_prefixes = self.__dict__.get("_known_prefixes")
+        if known_prefixes is None:
+            known_prefixes = self._known_prefixes = frozenset(self.prefix_map())
+        return known_prefixes
+
+
+class UbergraphBackend(SparqlBackend):
+    """Backend answering queries remotely on Ubergraph through oaklib."""
+
+    def __init__(self, implementation: Optional["UbergraphImplementation"] = None):
+        if implementation is None:
+            # oaklib takes seconds to import, so it is only loaded once this backend is actually used
+            from oaklib.implementations import UbergraphImplementation
+
+            implementation = UbergraphImplementation()
+        self.implementation = implementation
+
+    def query(self, query: str, prefixes: Optional[List[str]] = None) -> Iterator[Dict[str, str]]:
+        """Runs a SPARQL query on Ubergraph."""
+        return self.implementation.query(query=query, prefixes=prefixes)
+
+    def prefix_map(self) -> Dict[str, str]:
+        """Returns the oaklib prefix map used to expand and contract Ubergraph IRIs."""
+        return self.implementation.prefix_map()
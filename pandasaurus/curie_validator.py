@@ -1,10 +1,15 @@
 from abc import abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 
 from pandasaurus.resources.term import Term
 from pandasaurus.utils.pandasaurus_exceptions import InvalidTerm, ObsoletedTerm
-from pandasaurus.utils.query_utils import chunks, run_sparql_query
-from pandasaurus.utils.sparql_queries import get_label_query, get_replaced_by_query
+from pandasaurus.utils.query_utils import map_chunks, run_sparql_query
+from pandasaurus.utils.sparql_queries import (
+    get_label_query,
+    get_replaced_by_query,
+    get_term_validation_query,
+)
+from pandasaurus.utils.term_registry import TermRegistry
 
 
 class CurieValidator:
@@ -12,7 +17,24 @@ class CurieValidator:
     replacements for obsoleted slim terms.
     """
 
-    _CURIE_CHUNK_SIZE = 90
+    # Fixed number of CURIEs per query; None leaves the size to the installed chunk sizer (90 without one)
+    _CURIE_CHUNK_SIZE: Optional[int] = None
+    _term_registry: Optional[TermRegistry] = None
+
+    @staticmethod
+    def set_term_registry(term_registry: Optional[TermRegistry]) -> None:
+        """Installs a process-wide term registry so that validate_terms only queries CURIEs it has not seen.
+
+        Args:
+            term_registry: Registry instance, or None to always query every CURIE
+
+        """
+        CurieValidator._term_registry = term_registry
+
+    @staticmethod
+    def get_term_registry() -> Optional[TermRegistry]:
+        """Returns the active term registry, if any."""
+        return CurieValidator._term_registry
 
     @staticmethod
     @abstractmethod
@@ -49,10 +71,9 @@ class CurieValidator:
 
         """
         result_dict: Dict[str, Optional[str]] = {}
-        for chunk in chunks(curie_list, CurieValidator._CURIE_CHUNK_SIZE):
-            # Large lists are split up to avoid massive VALUES blocks in SPARQL queries.
-            query_string = get_label_query(chunk)
-            for res in run_sparql_query(query_string):
+        # Large lists are split up to avoid massive VALUES blocks in SPARQL queries.
+        for chunk_result in CurieValidator._map_chunks(get_label_query, curie_list):
+            for res in chunk_result:
                 term = res.get("term")
                 if term:
                     result_dict[term] = res.get("label")
@@ -82,14 +103,57 @@ class CurieValidator:
 
         """
         result_dict: Dict[str, Dict[str, Any]] = {}
-        for chunk in chunks(curie_list, CurieValidator._CURIE_CHUNK_SIZE):
-            query_string = get_replaced_by_query(chunk)
-            for res in run_sparql_query(query_string):
+        for chunk_result in CurieValidator._map_chunks(get_replaced_by_query, curie_list):
+            for res in chunk_result:
                 term = res.get("term")
                 if term:
                     result_dict[term] = res
         return result_dict
 
+    @staticmethod
+    def validate_terms(curie_list: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Reports whether the CURIEs are valid, and the replacement of obsoleted ones, with a single query per chunk
+        instead of running validate_curie_list and find_obsolete_terms separately.
+
+        Args:
+            curie_list: List of CURIEs
+
+        Examples:
+            | An example output that shows 1 valid, 1 obsoleted and 1 invalid CURIEs:
+            | {'CL:0000084': {'label': 'T cell', 'valid': True, 'new_term': None, 'new_term_label': None},
+            |  'CL:0011107': {'label': 'obsolete Muller cell', 'valid': True, 'new_term': 'CL:0000636',
+            |  'new_term_label': 'Mueller cell'},
+            |  'CL:1234567': {'label': None, 'valid': False, 'new_term': None, 'new_term_label': None}}
+
+        Returns:
+            Label, validation status and replacement term of each CURIE
+
+        """
+        term_registry = CurieValidator._term_registry
+        cached = term_registry.get_many(curie_list) if term_registry is not None else {}
+        unseen_curies = [curie for curie in dict.fromkeys(curie_list) if curie not in cached]
+        result_dict: Dict[str, Dict[str, Any]] = {}
+        for chunk_result in CurieValidator._map_chunks(get_term_validation_query, unseen_curies):
+            for res in chunk_result:
+                term = res.get("term")
+                if not term:
+                    continue
+                entry = result_dict.setdefault(
+                    term, {"label": None, "valid": True, "new_term": None, "new_term_label": None}
+                )
+                if res.get("label"):
+                    entry["label"] = res.get("label")
+                if res.get("depr_status") and res.get("new_term"):
+                    entry["new_term"] = res.get("new_term")
+                    entry["new_term_label"] = res.get("new_term_label")
+        for curie in unseen_curies:
+            cached[curie] = result_dict.get(
+                curie, {"label": None, "valid": False, "new_term": None, "new_term_label": None}
+            )
+        if term_registry is not None:
+            term_registry.update({curie: cached[curie] for curie in unseen_curies})
+        return {curie: dict(cached[curie]) for curie in curie_list}
+
     @staticmethod
     @abstractmethod
     def find_obsolete_term_replacement(curie_list: Dict[str, str]) -> Dict[str, str]:
@@ -129,7 +193,7 @@ class CurieValidator:
 
     @staticmethod
     def construct_term_list(seed_list) -> List[Term]:
-        """Returns list of Term objects after running validate_curie_list and find_obsolete_terms methods.
+        """Returns list of Term objects after running the validate_terms method.
 
         Args:
             seed_list: A list of seed terms where each term is a CURIE string
@@ -138,18 +202,13 @@ class CurieValidator:
             List of Term objects
 
         """
-        term_validation = CurieValidator.validate_curie_list(seed_list)
-        term_obsoletion = CurieValidator.find_obsolete_terms(seed_list)
-        term_list: List[Term] = list()
-        for seed in seed_list:
-            validation_entry = term_validation.get(seed, {"label": None, "valid": False})
-            obsoletion_entry = term_obsoletion.get(seed, {})
-            term = Term(
-                validation_entry.get("label"),
-                seed,
-                bool(validation_entry.get("valid")),
-                obsoletion_entry.get("new_term_label"),
-                obsoletion_entry.get("new_term"),
-            )
-            term_list.append(term)
-        return term_list
+        return Term.from_validation(seed_list, CurieValidator.validate_terms(seed_list))
+
+    @staticmethod
+    def _map_chunks(query_builder: Callable[[List[str]], str], curie_list: List[str]) -> Iterator[List[Dict[str, str]]]:
+        """Runs the query built for each chunk of CURIEs and yields the result rows of each chunk."""
+        return map_chunks(
+            lambda chunk: list(run_sparql_query(query_builder(chunk))),
+            curie_list,
+            chunk_size=CurieValidator._CURIE_CHUNK_SIZE,
+        )
@@ -1,10 +1,11 @@
-from typing import List
+import time
+from typing import Dict, List
 
-import networkx as nx
+import numpy as np
 import pandas as pd
 from rdflib import OWL, RDF, RDFS, Graph, Literal, Namespace, URIRef
-from rdflib.plugins.sparql import prepareQuery
 
+from pandasaurus.graph.transitive_reduction import redundant_edge_mask
 from pandasaurus.utils.logging_config import configure_logger
 
 # Set up logger
@@ -27,16 +28,27 @@ class GraphGenerator:
                 Each subject is linked to its corresponding object using the 'subClassOf' relationship,
                 and labels are associated with subjects and objects using the 'label' relationship.
         """
+        start = time.perf_counter()
         graph = Graph()
+        if enriched_df.empty:
+            return graph
         cl_namespace = Namespace("http://purl.obolibrary.org/obo/CL_")
-        for _, row in enriched_df.iterrows():
-            s = cl_namespace[row["s"].split(":")[-1]]
-            o = cl_namespace[row["o"].split(":")[-1]]
-            graph.add((s, RDFS.label, Literal(row["s_label"])))
-            graph.add((s, RDF.type, OWL.Class))
-            graph.add((o, RDFS.label, Literal(row["o_label"])))
-            graph.add((o, RDF.type, OWL.Class))
-            graph.add((s, RDFS.subClassOf, o))
+        # Deduplicate nodes and edges once instead of re-adding label/type triples for every row
+        nodes = pd.concat(
+            [
+                enriched_df[["s", "s_label"]].set_axis(["id", "label"], axis=1),
+                enriched_df[["o", "o_label"]].set_axis(["id", "label"], axis=1),
+            ]
+        ).drop_duplicates()
+        edges = enriched_df[["s", "o"]].drop_duplicates()
+        uris = {curie: cl_namespace[curie.split(":")[-1]] for curie in nodes["id"].unique()}
+
+        graph.addN(
+            (uris[curie], RDFS.label, Literal(label), graph) for curie, label in zip(nodes["id"], nodes["label"])
+        )
+        graph.addN((uri, RDF.type, OWL.Class, graph) for uri in uris.values())
+        graph.addN((uris[s], RDFS.subClassOf, uris[o], graph) for s, o in zip(edges["s"], edges["o"]))
+        logger.debug(f"Enrichment graph with {len(graph)} triples built in {time.perf_counter() - start:.4f}s")
         return graph
 
     @staticmethod
@@ -61,16 +73,19 @@ class GraphGenerator:
               relationship.
         """
         invalid_predicates = []
+        existence_check_time = reduction_time = 0.0
         for predicate in predicate_list:
             predicate_uri = GraphGenerator._normalize_predicate(predicate)
-            if not GraphGenerator._predicate_exists(graph, predicate_uri):
+            start = time.perf_counter()
+            predicate_exists = GraphGenerator._predicate_exists(graph, predicate_uri)
+            existence_check_time += time.perf_counter() - start
+            if not predicate_exists:
                 invalid_predicates.append(predicate)
                 continue
 
-            subgraph = GraphGenerator._add_outgoing_edges_to_subgraph(graph, predicate_uri)
-            nx_graph = GraphGenerator._build_networkx_graph(subgraph, predicate)
-            redundant_edges = GraphGenerator._compute_redundant_edges(nx_graph)
-            GraphGenerator._remove_redundant_triples(graph, redundant_edges, predicate_uri)
+            start = time.perf_counter()
+            GraphGenerator._remove_redundant_triples(graph, predicate_uri)
+            reduction_time += time.perf_counter() - start
             # TODO Temporarily disabling this log message
             # logger.info(f"Transitive reduction has been applied on {predicate} for graph generation.")
 
@@ -81,6 +96,10 @@ class GraphGenerator:
                 else f"The predicates {' ,'.join(invalid_predicates)} do not exist in the graph"
             )
             logger.error(error_msg)
+        logger.debug(
+            f"Transitive reduction of {len(predicate_list)} predicate(s): existence checks took "
+            f"{existence_check_time:.4f}s, reductions took {reduction_time:.4f}s"
+        )
 
         return graph
 
@@ -91,47 +110,23 @@ class GraphGenerator:
 
     @staticmethod
     def _predicate_exists(graph: Graph, predicate_uri: URIRef) -> bool:
-        """Check whether the predicate occurs in the graph before processing."""
-        ask_query = prepareQuery("SELECT ?s ?p WHERE { ?s ?p ?o }")
-        return bool(graph.query(ask_query, initBindings={"p": predicate_uri}, initNs={"rdfs": RDFS}))
+        """Check whether the predicate occurs in the graph before processing.
 
-    @staticmethod
-    def _build_networkx_graph(subgraph: Graph, predicate: str) -> nx.DiGraph:
-        """Convert the rdflib subgraph into a networkx DiGraph for reduction."""
-        nx_graph = nx.DiGraph()
-        for s, p, o in subgraph:
-            if isinstance(o, URIRef) and p != RDF.type:
-                GraphGenerator._add_edge(nx_graph, s, predicate, o)
-        return nx_graph
+        The triple pattern is answered from the store's predicate index and stops at the first match.
+        """
+        return (None, predicate_uri, None) in graph
 
     @staticmethod
-    def _compute_redundant_edges(nx_graph: nx.DiGraph) -> List[tuple]:
-        """Return the edges that should be removed after a transitive reduction."""
-        transitive_reduction_graph = nx.transitive_reduction(nx_graph)
-        transitive_reduction_graph.add_edges_from(
-            (u, v, nx_graph.edges[u, v]) for u, v in transitive_reduction_graph.edges
+    def _remove_redundant_triples(graph: Graph, predicate_uri: URIRef) -> None:
+        """Remove the triples of the predicate that are implied by longer paths of the same predicate."""
+        edges = [(s, o) for s, o in graph.subject_objects(predicate_uri) if isinstance(o, URIRef)]
+        node_ids: Dict[URIRef, int] = {}
+        sources = np.fromiter(
+            (node_ids.setdefault(s, len(node_ids)) for s, _ in edges), dtype=np.int64, count=len(edges)
         )
-        return list(set(nx_graph.edges) - set(transitive_reduction_graph.edges))
-
-    @staticmethod
-    def _remove_redundant_triples(graph: Graph, redundant_edges: List[tuple], predicate_uri: URIRef) -> None:
-        """Remove redundant triples from the rdflib graph using the computed edge list."""
-        for source, target in redundant_edges:
-            graph.remove((URIRef(source), predicate_uri, URIRef(target)))
-
-    @staticmethod
-    def _add_edge(nx_graph, subject, predicate, obj):
-        edge_data = {"label": str(predicate).split("#")[-1] if "#" in predicate else str(predicate).split("/")[-1]}
-        nx_graph.add_edge(
-            str(subject),
-            str(obj),
-            **edge_data,
+        targets = np.fromiter(
+            (node_ids.setdefault(o, len(node_ids)) for _, o in edges), dtype=np.int64, count=len(edges)
         )
-
-    @staticmethod
-    def _add_outgoing_edges_to_subgraph(graph, predicate_uri=None):
-        subgraph = Graph()
-        for s, p, o in graph.triples((None, predicate_uri, None)):
-            subgraph.add((s, p, o))
-
-        return subgraph
+        redundant = redundant_edge_mask(sources, targets, len(node_ids))
+        for index in np.flatnonzero(redundant):
+            graph.remove((edges[index][0], predicate_uri, edges[index][1]))
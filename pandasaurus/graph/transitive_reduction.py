@@ -0,0 +1,114 @@
+from collections import deque
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def redundant_edge_mask(sources: np.ndarray, targets: np.ndarray, node_count: int) -> np.ndarray:
+    """Flags the edges of a directed acyclic graph that are implied by a longer path, i.e. the edges a transitive
+    reduction removes.
+
+    Nodes are integer ids in `range(node_count)` and edges must be unique. The graph is stored as a CSR adjacency
+    array and visited once in reverse topological order, keeping the nodes reachable from each node as a bitset, so
+    no per-edge graph traversal is needed.
+
+    Args:
+        sources: Source node id of each edge
+        targets: Target node id of each edge
+        node_count: Number of nodes
+
+    Returns:
+        Boolean array that is True for redundant edges
+
+    Raises:
+        ValueError: If the graph contains a cycle.
+
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    redundant = np.zeros(len(sources), dtype=bool)
+    if len(sources) == 0:
+        return redundant
+
+    edge_order = np.argsort(sources, kind="stable")
+    sorted_targets = targets[edge_order]
+    indptr = np.zeros(node_count + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum(np.bincount(sources, minlength=node_count))
+
+    topological_order = _topological_order(indptr, sorted_targets, node_count)
+    # Bit positions follow the reverse topological order, so nodes close to the sinks get the low bits and the
+    # bitsets of nodes reaching few others stay small.
+    bit = np.empty(node_count, dtype=np.int64)
+    bit[topological_order[::-1]] = np.arange(node_count)
+    bit_list = bit.tolist()
+    indptr_list = indptr.tolist()
+    target_list = sorted_targets.tolist()
+
+    reachable = [0] * node_count
+    redundant_sorted = np.zeros(len(sources), dtype=bool)
+    for node in reversed(topological_order.tolist()):
+        start, end = indptr_list[node], indptr_list[node + 1]
+        if start == end:
+            continue
+        children = target_list[start:end]
+        # Nodes reachable from a child through at least one edge; a direct edge to any of them is redundant.
+        indirect = 0
+        for child in children:
+            indirect |= reachable[child]
+        for position, child in enumerate(children, start):
+            if indirect >> bit_list[child] & 1:
+                redundant_sorted[position] = True
+        direct = 0
+        for child in children:
+            direct |= 1 << bit_list[child]
+        reachable[node] = indirect | direct
+
+    redundant[edge_order] = redundant_sorted
+    return redundant
+
+
+def transitive_reduction_df(edge_df: pd.DataFrame, source_column: str = "s", target_column: str = "o") -> pd.DataFrame:
+    """Returns the rows of an edge DataFrame that are not implied by longer paths.
+
+    Duplicate edges are collapsed to their first row before the reduction.
+
+    Args:
+        edge_df: DataFrame with one edge per row, e.g. an enrichment DataFrame
+        source_column: Column holding the source term of each edge
+        target_column: Column holding the target term of each edge
+
+    Returns:
+        DataFrame with the redundant edges removed
+
+    Raises:
+        ValueError: If the edges contain a cycle.
+
+    """
+    edge_df = edge_df.drop_duplicates(subset=[source_column, target_column])
+    sources, targets, node_count = _encode_edges(edge_df[source_column], edge_df[target_column])
+    return edge_df[~redundant_edge_mask(sources, targets, node_count)]
+
+
+def _encode_edges(sources: pd.Series, targets: pd.Series) -> Tuple[np.ndarray, np.ndarray, int]:
+    codes, uniques = pd.factorize(pd.concat([sources.astype(object), targets.astype(object)], ignore_index=True))
+    return codes[: len(sources)], codes[len(sources) :], len(uniques)
+
+
+def _topological_order(indptr: np.ndarray, targets: np.ndarray, node_count: int) -> np.ndarray:
+    """Kahn's algorithm over the CSR adjacency; every node comes before the nodes it points to."""
+    in_degree = np.bincount(targets, minlength=node_count).tolist()
+    indptr_list = indptr.tolist()
+    target_list = targets.tolist()
+    queue = deque(node for node in range(node_count) if in_degree[node] == 0)
+    order = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for target in target_list[indptr_list[node] : indptr_list[node + 1]]:
+            in_degree[target] -= 1
+            if in_degree[target] == 0:
+                queue.append(target)
+    if len(order) != node_count:
+        raise ValueError("Transitive reduction only uniquely defined on directed acyclic graphs.")
+    return np.array(order, dtype=np.int64)
@@ -1,20 +1,42 @@
-from typing import List, Optional
+from collections import defaultdict
+from itertools import chain
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+)
 
+import numpy as np
 import pandas as pd
 from rdflib import Graph
 
 from pandasaurus.curie_validator import CurieValidator
 from pandasaurus.graph.graph_generator import GraphGenerator
+from pandasaurus.graph.transitive_reduction import transitive_reduction_df
 from pandasaurus.resources.term import Term
 from pandasaurus.slim_manager import SlimManager
+from pandasaurus.utils.checkpoint import EnrichmentCheckpoint
+from pandasaurus.utils.columnar import ColumnarResultBuilder
 from pandasaurus.utils.pandasaurus_exceptions import InvalidTerm, ObsoletedTerm
-from pandasaurus.utils.query_utils import chunks, run_sparql_query
+from pandasaurus.utils.query_utils import (
+    DEFAULT_CHUNK_SIZE,
+    chunks,
+    map_chunks,
+    run_sparql_query,
+)
 from pandasaurus.utils.sparql_queries import (
     get_ancestor_enrichment_query,
     get_contextual_enrichment_query,
     get_full_enrichment_query,
     get_most_specific_objects_query,
     get_most_specific_subjects_query,
+    get_outgoing_edges_query,
     get_simple_enrichment_query,
     get_synonym_query,
 )
@@ -27,14 +49,24 @@ class Query:
     Attributes:
         enriched_df: DataFrame that is enriched with synonyms and inferred relationships between terms in
         the seed. It will be used in further filtered queries.
+        graph_df: DataFrame of the edges between all terms of the latest enrichment. Fetched on first access.
+        graph: rdflib Graph built from graph_df with transitive reduction applied. Built on first access.
 
     """
 
+    _STRING_COLUMNS = ["s", "s_label", "p", "o", "o_label"]
+    # Row count from which "auto" string_dtype switches enrichment DataFrames to categorical columns
+    _CATEGORICAL_MIN_ROWS = 100_000
+
     def __init__(
         self,
         seed_list: List[str],
         enrichment_property_list: Optional[List[str]] = None,
         force_fail: bool = False,
+        max_workers: int = 1,
+        query_timeout: Optional[float] = None,
+        string_dtype: Optional[str] = "auto",
+        checkpoint_dir: Optional[str] = None,
     ):
         """A Query object is initialised by passing a list of seed terms (where each term is a CURIE string,
         e.g. CL:0000001; all OBO standard CURIESs are recognised). It generates a pandas DataFrame that enriches the
@@ -45,29 +77,79 @@ class Query:
         Args:
             seed_list: A list of seed terms where each term is a CURIE string
             enrichment_property_list: Optional list of property IRIs to extend enrichment queries.
+            force_fail: Raise a ValueError when the seed list contains invalid or obsoleted terms.
+            max_workers: Maximum number of chunked enrichment queries sent to Ubergraph concurrently.
+            query_timeout: Seconds each chunked enrichment query may take before it is split and retried.
+            string_dtype: dtype of the term and label columns of enrichment DataFrames, e.g. "category" or
+                "string[pyarrow]". "auto" uses "category" for DataFrames of at least 100,000 rows and keeps plain
+                object columns otherwise; None always keeps object columns.
+            checkpoint_dir: Optional job directory in which the rows of every completed enrichment chunk are
+                persisted. Rerunning an interrupted enrichment with the same directory resumes from the finished
+                chunks instead of querying them again.
 
         """
         # Might be unnecessary
         self._seed_list = seed_list
         self._enrichment_property_list = enrichment_property_list if enrichment_property_list else ["rdfs:subClassOf"]
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+        self._max_workers = max_workers
+        self._query_timeout = query_timeout
+        self._string_dtype = string_dtype
+        self._checkpoint = EnrichmentCheckpoint(checkpoint_dir) if checkpoint_dir is not None else None
         self._term_list: List[Term] = CurieValidator.construct_term_list(seed_list)
+        # IRIs of the term list, derived once and shared by the enrichment methods
+        self._term_iris: Optional[List[str]] = None
         self.enriched_df = pd.DataFrame()
-        self.graph_df = pd.DataFrame()
-        self.graph = Graph()
+        self._graph_df: Optional[pd.DataFrame] = pd.DataFrame()
+        self._graph: Optional[Graph] = Graph()
+        self._graph_object_list: List[str] = []
+        # Normalized label/synonym to CURIEs index used by query, with the enriched_df it was built from
+        self._name_index: Optional[Dict[str, Set[str]]] = None
+        self._name_index_df: Optional[pd.DataFrame] = None
+        # How the latest enrichment derives objects from added seeds, and whether it used the full enrichment query
+        self._new_objects_for: Optional[Callable[[List[str]], List[str]]] = None
+        self._full_enrichment = False
         # Validation and reporting
-        try:
-            CurieValidator.get_validation_report(self._term_list)
-        except InvalidTerm as e:
-            print(e.message)
-            if force_fail:
-                raise ValueError("Check your seed list! It contains invalid terms")
-        except ObsoletedTerm as e:
-            print(e.message)
-            if force_fail:
-                raise ValueError(
-                    "Check your seed list! It contains obsoleted terms. Use update_obsoleted_terms "
-                    "method to update all obsoleted term"
-                )
+        self._report_validation(self._term_list, force_fail)
+
+    @property
+    def _term_iri_list(self) -> List[str]:
+        """IRIs of the (possibly updated) seed terms; callers must not modify the returned list."""
+        if self._term_iris is None:
+            self._term_iris = [term.get_iri() for term in self._term_list]
+        return self._term_iris
+
+    @property
+    def graph_df(self) -> pd.DataFrame:
+        """Edges between the terms of the latest enrichment, fetched from Ubergraph on first access."""
+        if self._graph_df is None:
+            self.mirror_enrichment_for_graph_generation(self._graph_object_list)
+        return self._graph_df
+
+    @graph_df.setter
+    def graph_df(self, graph_df: pd.DataFrame) -> None:
+        self._graph_df = graph_df
+        self._graph = None
+
+    @property
+    def graph(self) -> Graph:
+        """Transitively reduced rdflib Graph of the latest enrichment, built on first access."""
+        if self._graph is None:
+            predicate_list = self.enriched_df["p"].unique().tolist()
+            graph_df = self.graph_df
+            if "rdfs:subClassOf" in predicate_list:
+                # Every edge becomes a subClassOf triple, so redundant ones are dropped before building the graph.
+                graph_df = transitive_reduction_df(graph_df)
+            graph = GraphGenerator.generate_enrichment_graph(graph_df)
+            self._graph = GraphGenerator.apply_transitive_reduction(
+                graph, [predicate for predicate in predicate_list if predicate != "rdfs:subClassOf"]
+            )
+        return self._graph
+
+    @graph.setter
+    def graph(self, graph: Graph) -> None:
+        self._graph = graph
 
     def simple_enrichment(self) -> pd.DataFrame:
         """Returns a DataFrame that is enriched with synonyms and inferred relationships between terms in the seed.
@@ -77,18 +159,12 @@ class Query:
              Enriched DataFrame
 
         """
-        source_list = [term.get_iri() for term in self._term_list]
+        source_list = self._term_iri_list
         object_list = source_list
         query_string = get_simple_enrichment_query(source_list, object_list, self._enrichment_property_list)
-        self.enriched_df = (
-            pd.DataFrame(
-                [res for res in run_sparql_query(query_string)],
-                columns=["s", "s_label", "p", "o", "o_label"],
-            )
-            .sort_values("s")
-            .reset_index(drop=True)
-        )
+        self.enriched_df = self._sorted_enrichment_df(self._to_enrichment_df(run_sparql_query(query_string)))
         self._generate_enrichment_graph(object_list)
+        self._record_enrichment(lambda new_seeds: new_seeds)
 
         return self.enriched_df
 
@@ -104,18 +180,15 @@ class Query:
             Enriched DataFrame
 
         """
-        source_list = [term.get_iri() for term in self._term_list]
-        object_list = list(set(source_list + SlimManager.get_slim_members(slim_list)))
+        source_list = self._term_iri_list
+        object_list = self._slim_object_list(slim_list)
         s_result = self._batched_enrichment_results(
             object_list,
             lambda chunk: get_simple_enrichment_query(source_list, chunk, self._enrichment_property_list),
         )
-        self.enriched_df = (
-            pd.DataFrame(s_result, columns=["s", "s_label", "p", "o", "o_label"])
-            .sort_values("s")
-            .reset_index(drop=True)
-        )
+        self.enriched_df = self._sorted_enrichment_df(self._to_enrichment_df(s_result))
         self._generate_enrichment_graph(object_list)
+        self._record_enrichment(lambda new_seeds: new_seeds)
 
         return self.enriched_df
 
@@ -132,21 +205,16 @@ class Query:
              Enriched DataFrame
 
         """
-        source_list = [term.get_iri() for term in self._term_list]
-        object_list = list(set(source_list + SlimManager.get_slim_members(slim_list)))
+        source_list = self._term_iri_list
+        object_list = self._slim_object_list(slim_list)
         s_result = self._batched_enrichment_results(
             object_list,
             lambda chunk: get_full_enrichment_query(source_list, chunk),
         )
 
-        self.enriched_df = (
-            pd.DataFrame(s_result, columns=["s", "s_label", "p", "x", "x_label"])
-            .rename(columns={"x": "o", "x_label": "o_label"})
-            .fillna({"p": "rdfs:subClassOf"})
-            .sort_values("s")
-            .reset_index(drop=True)
-        )
+        self.enriched_df = self._sorted_enrichment_df(self._to_enrichment_df(s_result, full=True))
         self._generate_enrichment_graph(object_list)
+        self._record_enrichment(lambda new_seeds: new_seeds, full=True)
 
         return self.enriched_df
 
@@ -163,21 +231,16 @@ class Query:
             Enriched DataFrame
 
         """
-        # TODO add a curie checking mechanism for context list
-        query_string = get_contextual_enrichment_query(context)
-        source_list = [term.get_iri() for term in self._term_list]
-        object_list = list(set(source_list + [res.get("term") for res in run_sparql_query(query_string)]))
+        source_list = self._term_iri_list
+        object_list = self._contextual_object_list(context)
         s_result = self._batched_enrichment_results(
             object_list,
             lambda chunk: get_simple_enrichment_query(source_list, chunk, self._enrichment_property_list),
         )
 
-        self.enriched_df = (
-            pd.DataFrame(s_result, columns=["s", "s_label", "p", "o", "o_label"])
-            .sort_values("s")
-            .reset_index(drop=True)
-        )
+        self.enriched_df = self._sorted_enrichment_df(self._to_enrichment_df(s_result))
         self._generate_enrichment_graph(object_list)
+        self._record_enrichment(lambda new_seeds: new_seeds)
 
         return self.enriched_df
 
@@ -201,24 +264,16 @@ class Query:
         includes more distant ancestors.
 
         """
-        if not isinstance(step_count, int):
-            raise TypeError("step_count must be an integer")
-        if step_count < 1:
-            raise ValueError("step_count must be a positive integer")
-        source_list = [term.get_iri() for term in self._term_list]
-        query_string = get_ancestor_enrichment_query(source_list, step_count)
-        object_list = list(set(uri for res in run_sparql_query(query_string) for uri in res.values()))
+        source_list = self._term_iri_list
+        object_list = self._ancestor_object_list(step_count)
         s_result = self._batched_enrichment_results(
             object_list,
             lambda chunk: get_simple_enrichment_query(source_list, chunk, self._enrichment_property_list),
         )
 
-        self.enriched_df = (
-            pd.DataFrame(s_result, columns=["s", "s_label", "p", "o", "o_label"])
-            .sort_values("s")
-            .reset_index(drop=True)
-        )
+        self.enriched_df = self._sorted_enrichment_df(self._to_enrichment_df(s_result))
         self._generate_enrichment_graph(object_list)
+        self._record_enrichment(lambda new_seeds: self._ancestor_object_list(step_count, new_seeds))
 
         return self.enriched_df
 
@@ -242,6 +297,106 @@ class Query:
         """
         self.ancestor_enrichment(1)
 
+    def iter_simple_enrichment(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Streaming variant of `simple_enrichment` that yields one DataFrame per chunk of objects as soon as its
+        query returns, so results can be written out incrementally with bounded memory.
+
+        Chunks are not sorted with respect to each other, and `enriched_df` and `graph` are left untouched.
+
+        Args:
+            chunk_size: Number of object terms bound per query. Defaults to the installed chunk sizer, or 90.
+
+        Returns:
+            Iterator of enriched DataFrames
+
+        """
+        source_list = self._term_iri_list
+        return self._iter_enrichment_dfs(
+            source_list,
+            lambda chunk: get_simple_enrichment_query(source_list, chunk, self._enrichment_property_list),
+            chunk_size=chunk_size,
+        )
+
+    def iter_minimal_slim_enrichment(
+        self, slim_list: List[str], chunk_size: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Streaming variant of `minimal_slim_enrichment`, see `iter_simple_enrichment`.
+
+        Args:
+            slim_list: List 'subset' tags that consists of classes tagged with some specified ‘subset’ axiom
+            chunk_size: Number of object terms bound per query. Defaults to the installed chunk sizer, or 90.
+
+        Returns:
+            Iterator of enriched DataFrames
+
+        """
+        source_list = self._term_iri_list
+        return self._iter_enrichment_dfs(
+            self._slim_object_list(slim_list),
+            lambda chunk: get_simple_enrichment_query(source_list, chunk, self._enrichment_property_list),
+            chunk_size=chunk_size,
+        )
+
+    def iter_full_slim_enrichment(
+        self, slim_list: List[str], chunk_size: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Streaming variant of `full_slim_enrichment`, see `iter_simple_enrichment`.
+
+        Args:
+            slim_list: List 'subset' tags that consists of classes tagged with some specified ‘subset’ axiom
+            chunk_size: Number of object terms bound per query. Defaults to the installed chunk sizer, or 90.
+
+        Returns:
+            Iterator of enriched DataFrames
+
+        """
+        source_list = self._term_iri_list
+        return self._iter_enrichment_dfs(
+            self._slim_object_list(slim_list),
+            lambda chunk: get_full_enrichment_query(source_list, chunk),
+            chunk_size=chunk_size,
+            full=True,
+        )
+
+    def iter_contextual_slim_enrichment(
+        self, context: List[str], chunk_size: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Streaming variant of `contextual_slim_enrichment`, see `iter_simple_enrichment`.
+
+        Args:
+            context: Organ/tissue/multicellular anatomical structure list to determine the redundant graph via
+            existential restrictions. It must be a valid CURIE.
+            chunk_size: Number of object terms bound per query. Defaults to the installed chunk sizer, or 90.
+
+        Returns:
+            Iterator of enriched DataFrames
+
+        """
+        source_list = self._term_iri_list
+        return self._iter_enrichment_dfs(
+            self._contextual_object_list(context),
+            lambda chunk: get_simple_enrichment_query(source_list, chunk, self._enrichment_property_list),
+            chunk_size=chunk_size,
+        )
+
+    def iter_ancestor_enrichment(self, step_count: int, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Streaming variant of `ancestor_enrichment`, see `iter_simple_enrichment`.
+
+        Args:
+            step_count: The number of hops to consider when enriching terms.
+            chunk_size: Number of object terms bound per query. Defaults to the installed chunk sizer, or 90.
+
+        Returns:
+            Iterator of enriched DataFrames
+
+        """
+        source_list = self._term_iri_list
+        return self._iter_enrichment_dfs(
+            self._ancestor_object_list(step_count),
+            lambda chunk: get_simple_enrichment_query(source_list, chunk, self._enrichment_property_list),
+            chunk_size=chunk_size,
+        )
+
     def synonym_lookup(self) -> pd.DataFrame:
         """Return labels plus synonym rows for every seed term.
 
@@ -286,7 +441,7 @@ class Query:
             DataFrame capturing subject, predicate, and object labels.
 
         """
-        subject_list = [term.get_iri() for term in self._term_list]
+        subject_list = self._term_iri_list
         query_string = get_most_specific_objects_query(subject_list, predicate, ontology)
         return (
             pd.DataFrame(
@@ -313,7 +468,7 @@ class Query:
             DataFrame capturing subject, predicate, and object labels.
 
         """
-        object_list = [term.get_iri() for term in self._term_list]
+        object_list = self._term_iri_list
         query_string = get_most_specific_subjects_query(object_list, predicate, ontology)
         return (
             pd.DataFrame(
@@ -324,58 +479,417 @@ class Query:
             .reset_index(drop=True)
         )
 
-    def query(self, column_name: str, query_term: str) -> pd.DataFrame:
+    def query(self, column_name: str, query_term: str, df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """Returns filtered dataframe via join on column to subject of enriched_df, looking up of object name or
         synonym via query of name_lookup.
 
+        The query term is resolved to CURIEs through an index from normalized (case and whitespace insensitive) labels
+        and synonyms, built once per enrichment from enriched_df and the synonyms of the seed terms. Rows are kept
+        when their CURIE in `column_name` is one of those terms or is enriched with one of them as object.
+
         Args:
-            column_name: Column name
+            column_name: Column name holding CURIEs, in `df` or in enriched_df
             query_term: Object label or synonym
+            df: Optional DataFrame to filter, e.g. cell annotations. Defaults to enriched_df.
+
+        Examples:
+            | Keep all annotations of T cells, including its subclasses in the enrichment:
+            | query.query("cell_type_id", "T cell", annotation_df)
 
         Returns:
             Filtered DataFrame
 
+        Raises:
+            ValueError: If `df` is not given and no enrichment has run yet, or `column_name` is not a column of the
+                filtered DataFrame.
+
         """
-        # TODO Add missing implementation
-        raise NotImplementedError
+        if df is None and self.enriched_df.columns.empty:
+            raise ValueError("No enrichment has run yet! Run an enrichment first or pass the DataFrame to filter")
+        data = df if df is not None else self.enriched_df
+        if column_name not in data.columns:
+            raise ValueError(f"Column {column_name!r} not found in the DataFrame to filter")
+        matched_terms = self._get_name_index().get(self._normalize_name(query_term), set())
+        if not matched_terms or self.enriched_df.empty:
+            return data[data[column_name].isin(matched_terms)]
+        matched_subjects = self.enriched_df["s"][self.enriched_df["o"].isin(matched_terms)]
+        return data[data[column_name].isin(matched_terms.union(matched_subjects))]
 
     def update_obsoleted_terms(self):
         """Replaces all obsoleted terms in the term list with the new term that obsoletes them."""
         [getattr(term, "update_obsoleted_term")() for term in self._term_list]
+        self._term_iris = None
+        self._name_index = None
+
+    def add_seeds(self, seed_list: List[str], force_fail: bool = False) -> pd.DataFrame:
+        """Adds terms to the seed list and extends the latest enrichment with them.
+
+        Only the added terms are validated, and only the rows involving them are queried: added subjects against
+        every object, and previous subjects against the added objects. The rows are merged into enriched_df. If
+        graph_df was already fetched, only the edges of the added terms are fetched and merged into it; graph is
+        rebuilt locally on next access.
+
+        Args:
+            seed_list: Terms to add, as CURIE strings. Terms already in the seed list are ignored.
+            force_fail: Raise a ValueError when the added terms contain invalid or obsoleted terms.
+
+        Returns:
+            Enriched DataFrame
+
+        """
+        known_seeds = set(self._term_iri_list)
+        new_term_list = CurieValidator.construct_term_list(
+            [seed for seed in dict.fromkeys(seed_list) if seed not in known_seeds]
+        )
+        if not new_term_list:
+            return self.enriched_df
+        self._report_validation(new_term_list, force_fail)
+
+        source_list = self._term_iri_list
+        self._seed_list = self._seed_list + [term.get_iri() for term in new_term_list]
+        self._term_list = self._term_list + new_term_list
+        self._term_iris = None
+        if self._new_objects_for is None:
+            return self.enriched_df
+
+        new_source_list = [term.get_iri() for term in new_term_list]
+        object_list = self._graph_object_list
+        known_objects = set(object_list)
+        new_object_list = [
+            term for term in dict.fromkeys(self._new_objects_for(new_source_list)) if term not in known_objects
+        ]
+        all_object_list = object_list + new_object_list
+        s_result = self._batched_enrichment_results(
+            all_object_list, lambda chunk: self._enrichment_query(new_source_list, chunk)
+        ) + self._batched_enrichment_results(new_object_list, lambda chunk: self._enrichment_query(source_list, chunk))
+        if s_result:
+            self.enriched_df = self._sorted_enrichment_df(
+                pd.concat([self.enriched_df, self._to_enrichment_df(s_result, full=self._full_enrichment)])
+            )
+
+        graph_df = self._graph_df
+        self._generate_enrichment_graph(all_object_list)
+        if graph_df is not None:
+            new_edges = self._new_graph_edges(object_list, new_object_list)
+            self.graph_df = (
+                self._sorted_enrichment_df(pd.concat([graph_df, self._to_enrichment_df(new_edges)]))
+                if new_edges
+                else graph_df
+            )
+        return self.enriched_df
+
+    @classmethod
+    def batch_enrichment(
+        cls,
+        seed_lists: Mapping[Hashable, List[str]],
+        slim_list: Optional[List[str]] = None,
+        chunk_size: Optional[int] = None,
+        **query_kwargs,
+    ) -> Dict[Hashable, pd.DataFrame]:
+        """Enriches many independent seed lists, e.g. one per dataset, at the cost of a single enrichment.
+
+        The seed lists are merged into one deduplicated seed list, which is validated and enriched once. The result
+        of every seed list is then sliced out of the merged enrichment locally: it holds the rows whose subject is
+        one of its seeds and whose object is one of its seeds or, with `slim_list`, a member of the slims. This is
+        exactly what `simple_enrichment` (or `minimal_slim_enrichment`) returns for that seed list on its own.
+
+        The merged seed list can hold tens of thousands of terms, so both subjects and objects are bound in chunks,
+        and every chunk goes through the same concurrency, retry and checkpoint handling as the other batched
+        enrichments.
+
+        Args:
+            seed_lists: Seed lists keyed by an identifier, e.g. the dataset name
+            slim_list: Optional list of slims to run `minimal_slim_enrichment` instead of `simple_enrichment`
+            chunk_size: Number of subject and object terms bound per query. Defaults to 90 subjects per query with
+                objects cut by the installed chunk sizer, or to the chunk size of the checkpoint.
+            **query_kwargs: Keyword arguments passed to the `Query` constructor, e.g. `max_workers`. Validation
+                and `force_fail` apply to the merged seed list.
+
+        Returns:
+            Enriched DataFrame of every seed list, under the same keys
+
+        """
+        union = list(dict.fromkeys(curie for seed_list in seed_lists.values() for curie in seed_list))
+        query = cls(union, **query_kwargs)
+        source_list = query._term_iri_list
+        if slim_list:
+            object_list = query._slim_object_list(slim_list)
+            extra_objects = SlimManager.get_slim_members(slim_list)
+        else:
+            object_list = source_list
+            extra_objects = []
+        rows = query._pairwise_enrichment_results(source_list, object_list, chunk_size)
+        enriched_df = query._sorted_enrichment_df(query._to_enrichment_df(rows))
+        slices = cls._slice_enrichment(enriched_df, seed_lists.values(), extra_objects)
+        return {key: query._with_string_dtype(df) for key, df in zip(seed_lists, slices)}
+
+    def mirror_enrichment_for_graph_generation(self, term_list: List[str], chunk_size: Optional[int] = None) -> None:
+        """Populate `graph_df` with all pairwise enrichment edges for graph output.
+
+        Only subjects are bound in the SPARQL queries; objects outside `term_list` are dropped locally, so the induced
+        subgraph is fetched with one request per chunk of subjects instead of one per subject/object chunk pair.
+        """
+        term_set = set(term_list)
+        s_result = [
+            res
+            for res in self._batched_enrichment_results(
+                term_list,
+                lambda s_chunk: get_outgoing_edges_query(s_chunk, self._enrichment_property_list),
+                chunk_size=chunk_size,
+            )
+            if res.get("o") in term_set
+        ]
+        self.graph_df = self._sorted_enrichment_df(self._to_enrichment_df(s_result))
+
+    def _generate_enrichment_graph(self, object_list: List[str]) -> None:
+        """Reset the Graph representation backing the enrichment results.
+
+        Nothing is queried here; `graph_df` and `graph` are built from `object_list` on first access, so
+        DataFrame-only callers pay nothing for graph construction.
+        """
+        self._graph_object_list = object_list
+        self._graph_df = None
+        self._graph = None
+
+    def _record_enrichment(self, new_objects_for: Callable[[List[str]], List[str]], full: bool = False) -> None:
+        """Remember how the latest enrichment derives its objects, so that add_seeds can extend it."""
+        self._new_objects_for = new_objects_for
+        self._full_enrichment = full
+
+    def _enrichment_query(self, s_iri_list: List[str], o_iri_list: List[str]) -> str:
+        """Query of the latest enrichment kind between the given subjects and objects."""
+        if self._full_enrichment:
+            return get_full_enrichment_query(s_iri_list, o_iri_list)
+        return get_simple_enrichment_query(s_iri_list, o_iri_list, self._enrichment_property_list)
+
+    def _new_graph_edges(self, object_list: List[str], new_object_list: List[str]) -> List[dict]:
+        """Edges of graph_df that involve the added objects: their outgoing edges and the edges pointing to them."""
+        term_set = set(object_list + new_object_list)
+        outgoing_edges = [
+            res
+            for res in self._batched_enrichment_results(
+                new_object_list, lambda s_chunk: get_outgoing_edges_query(s_chunk, self._enrichment_property_list)
+            )
+            if res.get("o") in term_set
+        ]
+        incoming_edges = self._batched_enrichment_results(
+            object_list,
+            lambda s_chunk: get_simple_enrichment_query(s_chunk, new_object_list, self._enrichment_property_list),
+        )
+        return outgoing_edges + incoming_edges
 
-    def mirror_enrichment_for_graph_generation(self, term_list: List[str]) -> None:
-        """Populate `graph_df` with all pairwise enrichment edges for graph output."""
-        # TODO definitely need a refactoring later on
-        s_result = []
-        for s_chunk in chunks(term_list, 45):
-            s_result.extend(
-                self._batched_enrichment_results(
-                    term_list,
-                    lambda o_chunk: get_simple_enrichment_query(s_chunk, o_chunk, self._enrichment_property_list),
-                    chunk_size=45,
+    @staticmethod
+    def _report_validation(term_list: List[Term], force_fail: bool) -> None:
+        try:
+            CurieValidator.get_validation_report(term_list)
+        except InvalidTerm as e:
+            print(e.message)
+            if force_fail:
+                raise ValueError("Check your seed list! It contains invalid terms")
+        except ObsoletedTerm as e:
+            print(e.message)
+            if force_fail:
+                raise ValueError(
+                    "Check your seed list! It contains obsoleted terms. Use update_obsoleted_terms "
+                    "method to update all obsoleted term"
                 )
+
+    def _get_name_index(self) -> Dict[str, Set[str]]:
+        """Index from normalized labels and synonyms to CURIEs, rebuilt when enriched_df is replaced."""
+        if self._name_index is None or self._name_index_df is not self.enriched_df:
+            name_index: Dict[str, Set[str]] = defaultdict(set)
+            for term in self._term_list:
+                if term.get_label():
+                    name_index[self._normalize_name(term.get_label())].add(term.get_iri())
+            for term_column, label_column in (("s", "s_label"), ("o", "o_label")):
+                if term_column in self.enriched_df.columns:
+                    pairs = self.enriched_df[[term_column, label_column]].drop_duplicates().dropna()
+                    for term, label in zip(pairs[term_column], pairs[label_column]):
+                        name_index[self._normalize_name(label)].add(term)
+            seed_iri_list = self._term_iri_list
+            for res in run_sparql_query(get_synonym_query(seed_iri_list)) if seed_iri_list else []:
+                for key, name in res.items():
+                    if key.endswith("synonym") and name:
+                        name_index[self._normalize_name(name)].add(res.get("s"))
+            self._name_index = dict(name_index)
+            self._name_index_df = self.enriched_df
+        return self._name_index
+
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        return " ".join(str(name).casefold().split())
+
+    def _slim_object_list(self, slim_list: List[str]) -> List[str]:
+        """Seed terms extended with the members of the given slims."""
+        source_list = self._term_iri_list
+        return sorted(set(source_list + SlimManager.get_slim_members(slim_list)))
+
+    def _contextual_object_list(self, context: List[str]) -> List[str]:
+        """Seed terms extended with the terms that are part of the given contexts."""
+        # TODO add a curie checking mechanism for context list
+        query_string = get_contextual_enrichment_query(context)
+        source_list = self._term_iri_list
+        return sorted(set(source_list + [res.get("term") for res in run_sparql_query(query_string)]))
+
+    def _ancestor_object_list(self, step_count: int, source_list: Optional[List[str]] = None) -> List[str]:
+        """Seed terms (or the given terms) and their ancestors within `step_count` hops."""
+        if not isinstance(step_count, int):
+            raise TypeError("step_count must be an integer")
+        if step_count < 1:
+            raise ValueError("step_count must be a positive integer")
+        source_list = self._term_iri_list if source_list is None else source_list
+        query_string = get_ancestor_enrichment_query(source_list, step_count)
+        return sorted(set(uri for res in run_sparql_query(query_string) for uri in res.values()))
+
+    @staticmethod
+    def _slice_enrichment(
+        enriched_df: pd.DataFrame, seed_lists: Iterable[List[str]], extra_objects: List[str]
+    ) -> Iterator[pd.DataFrame]:
+        """Yield the rows of an enrichment between the terms of each seed list, keeping the order of its rows.
+
+        Rows are grouped by subject once, so each slice only visits the rows of its own subjects instead of scanning
+        the whole enrichment.
+        """
+        row_count = len(enriched_df)
+        codes, terms = pd.factorize(
+            pd.concat([enriched_df["s"].astype(object), enriched_df["o"].astype(object)], ignore_index=True)
+        )
+        s_codes, o_codes = codes[:row_count], codes[row_count:]
+        rows_by_subject = np.argsort(s_codes, kind="stable")
+        bounds = np.searchsorted(s_codes[rows_by_subject], np.arange(len(terms) + 1))
+        term_index = pd.Index(terms)
+        extra_mask = np.zeros(len(terms), dtype=bool)
+        extra_codes = term_index.get_indexer(extra_objects)
+        extra_mask[extra_codes[extra_codes >= 0]] = True
+        for seed_list in seed_lists:
+            seed_codes = np.unique(term_index.get_indexer(seed_list))
+            seed_codes = seed_codes[seed_codes >= 0]
+            is_object = extra_mask.copy()
+            is_object[seed_codes] = True
+            rows = np.concatenate(
+                [rows_by_subject[bounds[code] : bounds[code + 1]] for code in seed_codes] + [np.empty(0, dtype=int)]
             )
-        self.graph_df = (
-            pd.DataFrame(s_result, columns=["s", "s_label", "p", "o", "o_label"])
-            .sort_values("s")
-            .reset_index(drop=True)
+            rows.sort()
+            rows = rows[is_object[o_codes[rows]]]
+            yield enriched_df.iloc[rows].reset_index(drop=True)
+
+    def _sorted_enrichment_df(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert the term and label columns to the configured string dtype, then sort the DataFrame by subject."""
+        return self._with_string_dtype(df).sort_values("s").reset_index(drop=True)
+
+    def _with_string_dtype(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert the term and label columns to the configured string dtype.
+
+        Repeated CURIEs, labels and predicates are stored once per category, which shrinks large results
+        several-fold and makes sorting, merging and grouping on them faster. Categorical columns only keep the
+        categories they use, so a DataFrame cut out of a larger one has the dtypes it would have had on its own.
+        """
+        string_dtype = self._string_dtype
+        if string_dtype == "auto":
+            string_dtype = "category" if len(df) >= Query._CATEGORICAL_MIN_ROWS else None
+        columns = [column for column in Query._STRING_COLUMNS if column in df.columns]
+        if string_dtype is None:
+            return df.astype(
+                {column: object for column in columns if isinstance(df[column].dtype, pd.CategoricalDtype)}
+            )
+        df = df.astype({column: string_dtype for column in columns})
+        if string_dtype == "category":
+            df = df.assign(**{column: df[column].cat.remove_unused_categories() for column in columns})
+        return df
+
+    def _to_enrichment_df(self, rows: Iterable[dict], full: bool = False) -> pd.DataFrame:
+        """Build an enrichment DataFrame from SPARQL result rows, renaming the intermediate terms of the full
+        enrichment query to objects.
+
+        Rows are consumed one at a time into dictionary-encoded columns, which become categorical columns directly
+        when the configured string dtype asks for them.
+        """
+        builder = ColumnarResultBuilder(
+            ["s", "s_label", "p", "o", "o_label"], fill_values={"p": "rdfs:subClassOf"} if full else None
+        )
+        builder.add_rows(rows, variables=["s", "s_label", "p", "x", "x_label"] if full else None)
+        string_dtype = self._string_dtype
+        categorical = string_dtype == "category" or (
+            string_dtype == "auto" and len(builder) >= Query._CATEGORICAL_MIN_ROWS
         )
+        return builder.to_frame(categorical=categorical)
 
-    def _generate_enrichment_graph(self, object_list: List[str]) -> None:
-        """Build the Graph representation backing the enrichment results."""
-        self.mirror_enrichment_for_graph_generation(object_list)
-        self.graph = GraphGenerator.generate_enrichment_graph(self.graph_df)
-        self.graph = GraphGenerator.apply_transitive_reduction(self.graph, self.enriched_df["p"].unique().tolist())
+    def _iter_enrichment_dfs(
+        self,
+        object_list: List[str],
+        query_builder: Callable[[List[str]], str],
+        chunk_size: Optional[int] = None,
+        full: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        for chunk_result in self._iter_batched_enrichment_results(object_list, query_builder, chunk_size):
+            yield self._sorted_enrichment_df(self._to_enrichment_df(chunk_result, full=full))
+
+    def _iter_batched_enrichment_results(
+        self,
+        object_list: List[str],
+        query_builder: Callable[[List[str]], str],
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[List[dict]]:
+        """Execute enrichment queries in batches to avoid oversized SPARQL VALUES blocks, yielding the rows of each
+        chunk in chunk order.
+
+        Chunks are sent concurrently when the Query was created with `max_workers` > 1; at most `max_workers` chunk
+        results are held in memory at a time. With a checkpoint directory, finished chunks are read back from it;
+        chunks are then cut at the checkpoint's fixed chunk size rather than by the chunk sizer, so that a rerun cuts
+        the same chunks.
+        """
+        checkpoint = self._checkpoint
+        if checkpoint is not None and chunk_size is None:
+            chunk_size = checkpoint.chunk_size
+
+        def fetch(chunk: List[str]) -> List[dict]:
+            query = query_builder(chunk)
+            if checkpoint is None:
+                return [res for res in run_sparql_query(query)]
+            return checkpoint.rows(query, lambda: list(run_sparql_query(query)))
+
+        return map_chunks(
+            fetch,
+            object_list,
+            chunk_size=chunk_size,
+            max_workers=self._max_workers,
+            timeout=self._query_timeout,
+        )
+
+    def _pairwise_enrichment_results(
+        self, source_list: List[str], object_list: List[str], chunk_size: Optional[int] = None
+    ) -> Iterator[dict]:
+        """Yield the simple enrichment rows between all subjects and objects, chunking the subjects as well as the
+        objects so that neither VALUES block grows with the input."""
+        if chunk_size is not None:
+            subject_chunk_size = chunk_size
+        elif self._checkpoint is not None:
+            subject_chunk_size = self._checkpoint.chunk_size
+        else:
+            subject_chunk_size = DEFAULT_CHUNK_SIZE
+        for subject_chunk in chunks(source_list, subject_chunk_size):
+            yield from chain.from_iterable(
+                self._iter_batched_enrichment_results(
+                    object_list,
+                    lambda chunk, subjects=subject_chunk: get_simple_enrichment_query(
+                        subjects, chunk, self._enrichment_property_list
+                    ),
+                    chunk_size,
+                )
+            )
 
     def _batched_enrichment_results(
         self,
         object_list: List[str],
-        query_builder,
-        chunk_size: int = 90,
-    ):
-        """Execute enrichment queries in batches to avoid oversized SPARQL VALUES blocks."""
+        query_builder: Callable[[List[str]], str],
+        chunk_size: Optional[int] = None,
+    ) -> List[dict]:
+        """Execute enrichment queries in batches to avoid oversized SPARQL VALUES blocks.
+
+        Chunks are sent concurrently when the Query was created with `max_workers` > 1; results are always merged in
+        chunk order.
+        """
         results = []
-        for chunk in chunks(object_list, chunk_size):
-            query_string = query_builder(chunk)
-            results.extend([res for res in run_sparql_query(query_string)])
+        for chunk_result in self._iter_batched_enrichment_results(object_list, query_builder, chunk_size):
+            results.extend(chunk_result)
         return results
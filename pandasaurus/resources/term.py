@@ -1,8 +1,13 @@
-from typing import Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 
 class Term:
-    """Represents ontology terms."""
+    """Represents ontology terms.
+
+    Attributes are stored in slots rather than a per-instance dict, so large seed lists stay compact.
+    """
+
+    __slots__ = ("__label", "__iri", "__is_valid", "__new_label", "__new_iri", "__is_obsolete")
 
     def __init__(
         self,
@@ -28,6 +33,32 @@ class Term:
         self.__new_iri = new_iri
         self.__is_obsolete: bool = True if new_label and new_iri else False
 
+    @classmethod
+    def from_validation(cls, curie_list: List[str], term_validation: Mapping[str, Dict[str, Any]]) -> List["Term"]:
+        """Builds terms in bulk from the output of `CurieValidator.validate_terms`.
+
+        Args:
+            curie_list: CURIEs in the order the terms are returned
+            term_validation: Label, validation status and replacement term of each CURIE
+
+        Returns:
+            List of Term objects
+
+        """
+        term_list = []
+        for curie in curie_list:
+            entry = term_validation[curie]
+            term_list.append(
+                cls(
+                    entry.get("label"),
+                    curie,
+                    bool(entry.get("valid")),
+                    entry.get("new_term_label"),
+                    entry.get("new_term"),
+                )
+            )
+        return term_list
+
     def get_label(self) -> Optional[str]:
         """Returns term label.
 
@@ -1,4 +1,6 @@
-from typing import Dict, List
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from pandasaurus.resources.slim import Slim
 from pandasaurus.utils.pandasaurus_exceptions import InvalidOntology
@@ -6,15 +8,23 @@ from pandasaurus.utils.query_utils import run_sparql_query
 from pandasaurus.utils.sparql_queries import (
     get_ontology_list_query,
     get_slim_list_query,
-    get_slim_members_query,
+    get_slim_members_batch_query,
 )
 
 
 class SlimManager:
     """SlimManager responsible for slim operations such as finding available slim in given ontologies and showing slim
     content.
+
+    Ontology titles, slim catalogs and slim members are memoized process-wide for `cache_ttl` seconds. Use
+    `set_cache_ttl` to change the lifetime and `clear_cache` to force a refresh.
     """
 
+    cache_ttl: Optional[float] = 24 * 60 * 60
+    # Memoized query results keyed by ("ontologies",), ("slims", ontology) or ("members", slim_name)
+    _cache: Dict[Tuple[str, ...], Tuple[float, Any]] = {}
+    _lock = threading.RLock()
+
     # Might not be needed
     @staticmethod
     def get_slim_list(ontology: str) -> List[Dict[str, str]]:
@@ -29,11 +39,20 @@ class SlimManager:
         """
         ontology_list = SlimManager._get_ontology_list()
         if ontology in ontology_list:
-            slim_list: Dict[str, Slim] = dict()
-            result = run_sparql_query(get_slim_list_query(ontology))
-            for res in result:
-                slim_list.update({res.get("label"): Slim(name=res.get("label"), description=res.get("comment"))})
-            return [{"name": slim.get_name(), "description": slim.get_description()} for slim in slim_list.values()]
+            with SlimManager._lock:
+                slim_catalog = SlimManager._get_cached(("slims", ontology))
+                if slim_catalog is None:
+                    slim_list: Dict[str, Slim] = dict()
+                    result = run_sparql_query(get_slim_list_query(ontology))
+                    for res in result:
+                        slim_list.update(
+                            {res.get("label"): Slim(name=res.get("label"), description=res.get("comment"))}
+                        )
+                    slim_catalog = [
+                        {"name": slim.get_name(), "description": slim.get_description()} for slim in slim_list.values()
+                    ]
+                    SlimManager._set_cached(("slims", ontology), slim_catalog)
+            return [dict(slim) for slim in slim_catalog]
         raise InvalidOntology(ontology, ontology_list)
 
     @staticmethod
@@ -47,11 +66,62 @@ class SlimManager:
             Term IRIs of the slim members
 
         """
-        return [
-            term.get("term") for slim_name in slim_list for term in run_sparql_query(get_slim_members_query(slim_name))
-        ]
+        with SlimManager._lock:
+            members: Dict[str, List[str]] = {}
+            for slim_name in dict.fromkeys(slim_list):
+                cached = SlimManager._get_cached(("members", slim_name))
+                if cached is not None:
+                    members[slim_name] = cached
+            missing_slims = [slim_name for slim_name in dict.fromkeys(slim_list) if slim_name not in members]
+            if missing_slims:
+                # All slims that are not memoized yet are fetched with a single query.
+                fetched: Dict[str, List[str]] = {slim_name: [] for slim_name in missing_slims}
+                for res in run_sparql_query(get_slim_members_batch_query(missing_slims)):
+                    fetched.setdefault(res.get("slim_name"), []).append(res.get("term"))
+                for slim_name, terms in fetched.items():
+                    SlimManager._set_cached(("members", slim_name), terms)
+                members.update(fetched)
+            return [term for slim_name in slim_list for term in members[slim_name]]
+
+    @staticmethod
+    def set_cache_ttl(ttl: Optional[float]) -> None:
+        """Sets how long memoized ontology titles, slim catalogs and slim members are reused.
+
+        Args:
+            ttl: Lifetime in seconds, or None to keep them for the lifetime of the process
+
+        """
+        SlimManager.cache_ttl = ttl
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forgets memoized ontology titles, slim catalogs and slim members so that the next calls query Ubergraph
+        again, e.g. after switching to a new Ubergraph release.
+        """
+        with SlimManager._lock:
+            SlimManager._cache.clear()
 
     @staticmethod
     def _get_ontology_list() -> List[str]:
         """Return ontology titles available in Ubergraph."""
-        return [row.get("title") for row in run_sparql_query(get_ontology_list_query())]
+        with SlimManager._lock:
+            ontology_list = SlimManager._get_cached(("ontologies",))
+            if ontology_list is None:
+                ontology_list = [row.get("title") for row in run_sparql_query(get_ontology_list_query())]
+                SlimManager._set_cached(("ontologies",), ontology_list)
+        return list(ontology_list)
+
+    @staticmethod
+    def _get_cached(key: Tuple[str, ...]) -> Optional[Any]:
+        entry = SlimManager._cache.get(key)
+        if entry is None:
+            return None
+        created, value = entry
+        if SlimManager.cache_ttl is not None and time.monotonic() - created > SlimManager.cache_ttl:
+            del SlimManager._cache[key]
+            return None
+        return value
+
+    @staticmethod
+    def _set_cached(key: Tuple[str, ...], value: Any) -> None:
+        SlimManager._cache[key] = (time.monotonic(), value)
@@ -0,0 +1,113 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Set, Union
+
+from pandasaurus.utils.query_utils import DEFAULT_CHUNK_SIZE
+from pandasaurus.utils.sparql_cache import normalize_query
+
+_MANIFEST = "manifest.json"
+_JOURNAL = "manifest.journal"
+_CHUNK_HASH = re.compile(r"[0-9a-f]{64}")
+
+
+class EnrichmentCheckpoint:
+    """Persists the rows of every completed enrichment chunk in a job directory so an interrupted run can resume.
+
+    Each chunk is identified by a hash of its normalized query, which covers both the seed terms and the chunk of
+    objects. Its rows are written atomically to a JSON part file under `parts/`, and the hash is then appended to
+    `manifest.journal`, so recording a chunk costs the same however many chunks finished before. Opening the
+    directory again compacts the journal into `manifest.json`, skipping a line torn by a killed process, so at most
+    one chunk is redone. Rerunning the same enrichment against the same directory reads finished chunks from disk and
+    only queries the others.
+
+    Resuming only finds the finished chunks if the rerun cuts the same chunks, so the chunk size is fixed for the
+    lifetime of the job and recorded in the manifest.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            directory: Job directory; created if missing, resumed from if it holds a manifest.
+            chunk_size: Number of terms per chunk for a new job. A resumed job keeps the chunk size of its manifest.
+        """
+        self.directory = Path(directory)
+        self.chunk_size = chunk_size
+        self._parts = self.directory / "parts"
+        self._parts.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._completed: Set[str] = set()
+        self._journal = self.directory / _JOURNAL
+        manifest = self.directory / _MANIFEST
+        if manifest.exists():
+            content = json.loads(manifest.read_text(encoding="utf-8"))
+            self._completed = set(content["chunks"])
+            self.chunk_size = content.get("chunk_size", chunk_size)
+        if self._journal.exists():
+            lines = self._journal.read_text(encoding="utf-8").splitlines()
+            self._completed.update(line for line in lines if _CHUNK_HASH.fullmatch(line))
+        self._compact()
+
+    @property
+    def completed(self) -> Set[str]:
+        """Hashes of the chunks finished so far."""
+        with self._lock:
+            return set(self._completed)
+
+    def __len__(self) -> int:
+        return len(self._completed)
+
+    @staticmethod
+    def chunk_hash(query: str) -> str:
+        """Returns the hash identifying the chunk answered by a query."""
+        return hashlib.sha256(normalize_query(query).encode("utf-8")).hexdigest()
+
+    def rows(self, query: str, fetch: Callable[[], List[Dict[str, str]]]) -> List[Dict[str, str]]:
+        """Returns the rows of a chunk, from its part file when the chunk finished before and from `fetch` otherwise.
+
+        Args:
+            query: SPARQL query of the chunk
+            fetch: Callable running the query and returning its rows
+
+        Returns:
+            Result rows of the chunk
+
+        """
+        key = self.chunk_hash(query)
+        part = self._parts / f"{key}.json"
+        with self._lock:
+            finished = key in self._completed
+        if finished:
+            return json.loads(part.read_text(encoding="utf-8"))
+        rows = fetch()
+        self._write_atomically(part, rows)
+        with self._lock:
+            self._completed.add(key)
+            with self._journal.open("a", encoding="utf-8") as journal:
+                journal.write(f"{key}\n")
+        return rows
+
+    def clear(self) -> None:
+        """Removes every part file, the manifest and its journal, e.g. once the job's result has been saved."""
+        with self._lock:
+            for part in self._parts.glob("*.json"):
+                part.unlink()
+            (self.directory / _MANIFEST).unlink(missing_ok=True)
+            self._journal.unlink(missing_ok=True)
+            self._completed.clear()
+
+    def _compact(self) -> None:
+        """Writes the chunk size and every finished chunk to the manifest, then empties the journal."""
+        self._write_atomically(
+            self.directory / _MANIFEST, {"chunk_size": self.chunk_size, "chunks": sorted(self._completed)}
+        )
+        self._journal.unlink(missing_ok=True)
+
+    @staticmethod
+    def _write_atomically(path: Path, content) -> None:
+        temporary = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        temporary.write_text(json.dumps(content), encoding="utf-8")
+        os.replace(temporary, path)
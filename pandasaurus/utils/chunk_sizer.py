@@ -0,0 +1,96 @@
+import threading
+import time
+from typing import Callable, Iterator, Optional, Sequence, Sized, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class AdaptiveChunkSizer:
+    """Tunes the number of terms bound per SPARQL VALUES block from observed request outcomes (AIMD).
+
+    Every chunk that comes back within `target_latency` seconds, and with at most `max_rows` result rows, grows the
+    chunk size by `increase_step`. A slow, oversized or failed chunk multiplies it by `decrease_factor`. The size
+    therefore converges just below the point where the endpoint starts to struggle. Install one with
+    `pandasaurus.utils.query_utils.set_chunk_sizer` to share it between every batched caller.
+    """
+
+    def __init__(
+        self,
+        initial_size: int = 90,
+        min_size: int = 10,
+        max_size: int = 1000,
+        target_latency: float = 10.0,
+        max_rows: Optional[int] = None,
+        increase_step: int = 10,
+        decrease_factor: float = 0.5,
+    ):
+        """
+        Args:
+            initial_size: Chunk size used before any request has been observed.
+            min_size: Lower bound of the chunk size.
+            max_size: Upper bound of the chunk size.
+            target_latency: Seconds above which a chunk counts as slow.
+            max_rows: Optional number of result rows above which a chunk counts as oversized.
+            increase_step: Additive increase applied after a successful chunk.
+            decrease_factor: Multiplicative decrease applied after a slow, oversized or failed chunk.
+        """
+        if not 1 <= min_size <= initial_size <= max_size:
+            raise ValueError("Chunk sizes must satisfy 1 <= min_size <= initial_size <= max_size")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.max_rows = max_rows
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self._chunk_size = initial_size
+        self._lock = threading.Lock()
+
+    @property
+    def chunk_size(self) -> int:
+        """Chunk size the next chunk will be cut to."""
+        return self._chunk_size
+
+    def record(self, chunk_size: int, latency: float, row_count: Optional[int] = None, failed: bool = False) -> None:
+        """Adjusts the chunk size from the outcome of one chunk.
+
+        Args:
+            chunk_size: Number of items in the chunk
+            latency: Seconds the request took
+            row_count: Number of result rows, if known
+            failed: Whether the request raised an error
+
+        """
+        with self._lock:
+            oversized = self.max_rows is not None and row_count is not None and row_count > self.max_rows
+            if failed or latency > self.target_latency or oversized:
+                self._chunk_size = max(self.min_size, int(self._chunk_size * self.decrease_factor))
+            elif chunk_size >= self._chunk_size:
+                # Short tail chunks say nothing about larger ones, so only full chunks grow the size.
+                self._chunk_size = min(self.max_size, self._chunk_size + self.increase_step)
+
+    def chunks(self, items: Sequence[T]) -> Iterator[Sequence[T]]:
+        """Yield consecutive slices of `items`, each cut to the chunk size current at the time it is requested."""
+        start = 0
+        while start < len(items):
+            size = self._chunk_size
+            yield items[start : start + size]
+            start += size
+
+    def measure(self, func: Callable[[Sequence[T]], R]) -> Callable[[Sequence[T]], R]:
+        """Wrap a per-chunk callable so that each call is timed and recorded."""
+
+        def measured(chunk: Sequence[T]) -> R:
+            start = time.perf_counter()
+            try:
+                result = func(chunk)
+            except Exception:
+                self.record(len(chunk), time.perf_counter() - start, failed=True)
+                raise
+            row_count = len(result) if isinstance(result, Sized) else None
+            self.record(len(chunk), time.perf_counter() - start, row_count)
+            return result
+
+        return measured
@@ -0,0 +1,78 @@
+from array import array
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class ColumnarResultBuilder:
+    """Collects SPARQL result rows straight into dictionary-encoded columns.
+
+    Every column keeps one integer code per row plus each distinct value once, instead of one dict per row and a
+    copy of every string per cell. `to_frame` turns the codes into categorical columns without expanding them, or
+    into plain object columns.
+    """
+
+    def __init__(self, columns: Sequence[str], fill_values: Optional[Mapping[str, str]] = None):
+        """
+        Args:
+            columns: Names of the DataFrame columns, in order.
+            fill_values: Optional values used for rows where a column is unbound; other unbound cells are NaN.
+        """
+        self.columns = list(columns)
+        fill_values = fill_values or {}
+        self._fill_values = [fill_values.get(column) for column in self.columns]
+        self._codes = [array("i") for _ in self.columns]
+        self._categories: List[Dict[str, int]] = [{} for _ in self.columns]
+
+    def __len__(self) -> int:
+        return len(self._codes[0]) if self._codes else 0
+
+    def add_rows(self, rows: Iterable[Mapping[str, str]], variables: Optional[Sequence[str]] = None) -> None:
+        """Appends result rows.
+
+        Args:
+            rows: Result rows mapping SPARQL variables to values, e.g. from `run_sparql_query`. They are consumed
+                one at a time, so an iterator is never materialized.
+            variables: SPARQL variable of each column, if they differ from the column names.
+
+        """
+        variables = list(variables) if variables is not None else self.columns
+        columns = list(zip(variables, self._fill_values, self._codes, self._categories))
+        for row in rows:
+            for variable, fill_value, codes, categories in columns:
+                value = row.get(variable, fill_value)
+                if value is None:
+                    codes.append(-1)
+                    continue
+                code = categories.get(value)
+                if code is None:
+                    code = categories[value] = len(categories)
+                codes.append(code)
+
+    def to_frame(self, categorical: bool = False) -> pd.DataFrame:
+        """Builds a DataFrame from the collected rows.
+
+        Args:
+            categorical: Whether to return `category` columns, with lexically sorted categories, instead of object
+                columns.
+
+        Returns:
+            DataFrame with one column per configured name
+
+        """
+        data = {}
+        for column, codes, categories in zip(self.columns, self._codes, self._categories):
+            code_array = np.frombuffer(codes, dtype=np.int32) if len(codes) else np.empty(0, dtype=np.int32)
+            values = np.empty(len(categories), dtype=object)
+            values[:] = list(categories)
+            if categorical:
+                # Sort the categories, so sorting by the column orders rows lexically as for object columns.
+                order = np.argsort(values, kind="stable")
+                rank = np.empty(len(values) + 1, dtype=np.int32)
+                rank[order] = np.arange(len(values), dtype=np.int32)
+                rank[-1] = -1
+                data[column] = pd.Categorical.from_codes(rank[code_array], categories=pd.Index(values[order]))
+            else:
+                data[column] = np.append(values, np.nan)[code_array]
+        return pd.DataFrame(data, columns=self.columns, copy=False)
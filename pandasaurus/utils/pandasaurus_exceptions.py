@@ -52,3 +52,18 @@ class InvalidOntology(Exception):
             f"Please use one of the following ontologies: \n{', '.join(ontology_list)}"
         )
         super().__init__(self.message)
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, retry_after: float):
+        """
+        Exception raised instead of querying while the SPARQL endpoint is considered down.
+
+        Args:
+            retry_after (float): Seconds until the next query is let through.
+        """
+        self.retry_after = retry_after
+        self.message = (
+            f"The SPARQL endpoint failed repeatedly; queries are suspended for another {retry_after:.1f} seconds"
+        )
+        super().__init__(self.message)
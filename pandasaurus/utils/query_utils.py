@@ -1,20 +1,133 @@
 import os
-from typing import Iterable, Iterator, List, Sequence, TypeVar
+import re
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import (
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
 
 import certifi
-from oaklib.implementations import UbergraphImplementation
+
+from pandasaurus.backends.sparql_backend import SparqlBackend
+from pandasaurus.utils.chunk_sizer import AdaptiveChunkSizer
+from pandasaurus.utils.resilience import ResiliencePolicy
+from pandasaurus.utils.sparql_cache import SparqlCache
 
 # Ensure HTTPS requests trust the certifi bundle; this avoids local certificate issues.
 os.environ.setdefault("SSL_CERT_FILE", certifi.where())
 os.environ.setdefault("REQUESTS_CA_BUNDLE", certifi.where())
 
-oi = UbergraphImplementation()
+# A CURIE prefix is a name directly followed by ':' that is not itself part of a longer name, IRI or CURIE
+_CURIE_PREFIX = re.compile(r"(?<![\w.\-:/])(\w[\w.\-]*):")
+_backend: Optional[SparqlBackend] = None
+_backend_lock = threading.Lock()
+_sparql_cache: Optional[SparqlCache] = None
+_chunk_sizer: Optional[AdaptiveChunkSizer] = None
+_resilience_policy: Optional[ResiliencePolicy] = ResiliencePolicy()
+# Terms bound per VALUES block when no chunk size is given and no chunk sizer is installed
+DEFAULT_CHUNK_SIZE = 90
 T = TypeVar("T")
+R = TypeVar("R")
 
 
 def run_sparql_query(query: str) -> Iterator:
-    """Execute a SPARQL query against Ubergraph."""
-    return oi.query(query=query, prefixes=get_prefixes(query, oi.prefix_map().keys()))
+    """Execute a SPARQL query against the active backend (Ubergraph by default), serving it from the active result
+    cache when possible."""
+    backend = get_backend()
+    prefixes = get_prefixes(query, backend.known_prefixes())
+    cache = _sparql_cache
+    if cache is None:
+        return backend.query(query, prefixes)
+    rows = cache.get(query, prefixes)
+    if rows is None:
+        rows = list(backend.query(query, prefixes))
+        cache.set(query, prefixes, rows)
+    return iter(rows)
+
+
+def set_backend(backend: SparqlBackend) -> None:
+    """Select the backend that answers every `run_sparql_query` call.
+
+    Args:
+        backend: Backend instance, e.g. `HttpSparqlBackend("http://localhost:8080/sparql")` for a mirror,
+            `UbergraphBackend()` to go through oaklib, or a `SnapshotBackend` over a local ontology snapshot.
+
+    """
+    global _backend
+    _backend = backend
+
+
+def get_backend() -> SparqlBackend:
+    """Returns the backend that answers `run_sparql_query` calls, creating the default Ubergraph backend on first
+    use."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                from pandasaurus.backends.http_backend import HttpSparqlBackend
+
+                _backend = HttpSparqlBackend()
+    return _backend
+
+
+def set_sparql_cache(cache: Optional[SparqlCache]) -> None:
+    """Install a process-wide SPARQL result cache used by `run_sparql_query`.
+
+    Args:
+        cache: Cache instance, e.g. `SQLiteSparqlCache("ubergraph.sqlite", release="2024-03-01")`, or None to
+            disable caching.
+
+    """
+    global _sparql_cache
+    _sparql_cache = cache
+
+
+def get_sparql_cache() -> Optional[SparqlCache]:
+    """Returns the active SPARQL result cache, if any."""
+    return _sparql_cache
+
+
+def set_chunk_sizer(chunk_sizer: Optional[AdaptiveChunkSizer]) -> None:
+    """Install a process-wide chunk sizer that tunes the chunk size of every batched query without an explicit size.
+
+    Args:
+        chunk_sizer: Chunk sizer instance, e.g. `AdaptiveChunkSizer(target_latency=5)`, or None to go back to
+            chunks of `DEFAULT_CHUNK_SIZE` terms.
+
+    """
+    global _chunk_sizer
+    _chunk_sizer = chunk_sizer
+
+
+def get_chunk_sizer() -> Optional[AdaptiveChunkSizer]:
+    """Returns the active chunk sizer, if any."""
+    return _chunk_sizer
+
+
+def set_resilience_policy(policy: Optional[ResiliencePolicy]) -> None:
+    """Install the process-wide policy that retries, splits and guards every chunk run by `map_chunks`.
+
+    Args:
+        policy: Policy instance, e.g. `ResiliencePolicy(max_attempts=6, max_delay=60)`, or None to let the first
+            failed chunk abort the whole batch.
+
+    """
+    global _resilience_policy
+    _resilience_policy = policy
+
+
+def get_resilience_policy() -> Optional[ResiliencePolicy]:
+    """Returns the active resilience policy, if any."""
+    return _resilience_policy
 
 
 def chunks(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
@@ -23,6 +136,116 @@ def chunks(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
         yield items[i : i + size]
 
 
+def map_in_order(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = 1,
+    timeout: Optional[float] = None,
+) -> Iterator[R]:
+    """Apply `func` to every item on a bounded thread pool and yield the results in input order.
+
+    At most `max_workers` calls are in flight at any time. With a single worker the calls run serially in the
+    calling thread.
+
+    Args:
+        func: Callable applied to each item, typically a chunked SPARQL request.
+        items: Items to process.
+        max_workers: Upper bound on concurrent calls.
+        timeout: Seconds to wait for each individual result before raising `concurrent.futures.TimeoutError`.
+            Only enforced when `max_workers` is greater than one.
+
+    Returns:
+        Iterator over `func(item)` results, in the same order as `items`.
+
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be a positive integer")
+    if max_workers == 1:
+        for item in items:
+            yield func(item)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending: Deque[Future] = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= max_workers:
+                yield pending.popleft().result(timeout=timeout)
+        while pending:
+            yield pending.popleft().result(timeout=timeout)
+    finally:
+        # Do not block on outstanding requests when a chunk failed, timed out or the consumer stopped early.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def get_prefixes(text: str, prefix_map: Iterable[str]) -> List[str]:
-    """Return CURIE prefixes referenced in `text`."""
-    return [prefix for prefix in prefix_map if f"{prefix}:" in text]
+    """Return CURIE prefixes referenced in `text`, in order of first appearance.
+
+    The text is tokenized once and the candidate prefixes are looked up in `prefix_map`, instead of searching the
+    text once per known prefix.
+    """
+    known_prefixes = prefix_map if isinstance(prefix_map, (set, frozenset, dict)) else set(prefix_map)
+    return [prefix for prefix in dict.fromkeys(_CURIE_PREFIX.findall(text)) if prefix in known_prefixes]
+
+
+def map_chunks(
+    func: Callable[[Sequence[T]], R],
+    items: Sequence[T],
+    chunk_size: Optional[int] = None,
+    max_workers: int = 1,
+    timeout: Optional[float] = None,
+) -> Iterator[R]:
+    """Apply `func` to consecutive chunks of `items` with `map_in_order`.
+
+    Without an explicit `chunk_size`, chunks are sized by the installed chunk sizer, which is fed the latency, result
+    size and failures of every call, or hold `DEFAULT_CHUNK_SIZE` items when none is installed. Every chunk runs
+    under the installed resilience policy, so transient failures are retried and timed out chunks are split instead
+    of aborting the whole batch.
+
+    Args:
+        func: Callable applied to each chunk, typically a chunked SPARQL request.
+        items: Items to split into chunks.
+        chunk_size: Optional fixed chunk size.
+        max_workers: Upper bound on concurrent calls.
+        timeout: Seconds each attempt at a chunk may take before it fails with `TimeoutError`. The timeout is raised
+            inside the resilience policy, so a slow chunk is split and retried like a server side timeout. Enforced
+            for any number of workers.
+
+    Returns:
+        Iterator over `func(chunk)` results, in chunk order.
+
+    """
+    chunk_sizer = _chunk_sizer
+    policy = _resilience_policy
+    if timeout is not None:
+        func = _with_timeout(func, timeout)
+    if chunk_size is not None or chunk_sizer is None:
+        chunk_iterator = chunks(items, chunk_size or DEFAULT_CHUNK_SIZE)
+    else:
+        # Every attempt is measured, so timeouts shrink the following chunks as well as being split.
+        func = chunk_sizer.measure(func)
+        chunk_iterator = chunk_sizer.chunks(items)
+    if policy is not None:
+        func = policy.wrap(func)
+    return map_in_order(func, chunk_iterator, max_workers)
+
+
+def _with_timeout(func: Callable[[T], R], timeout: float) -> Callable[[T], R]:
+    """Wrap `func` so that calls taking longer than `timeout` seconds raise `TimeoutError`.
+
+    The call runs on its own thread, which is abandoned rather than interrupted on timeout, as a blocked request
+    cannot be cancelled from the outside.
+    """
+
+    def timed(item: T) -> R:
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            return executor.submit(func, item).result(timeout=timeout)
+        except FutureTimeoutError:
+            # Before Python 3.11 this is not the built-in TimeoutError the resilience policy recognizes.
+            raise TimeoutError(f"Query did not finish within {timeout} seconds") from None
+        finally:
+            executor.shutdown(wait=False)
+
+    return timed
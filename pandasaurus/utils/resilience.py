@@ -0,0 +1,202 @@
+import logging
+import random
+import threading
+import time
+from typing import Callable, Optional, Sequence, TypeVar
+
+from pandasaurus.utils.pandasaurus_exceptions import CircuitOpenError
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying; 408 and 504 additionally mean the query itself was too slow.
+_TRANSIENT_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+_TIMEOUT_STATUSES = frozenset({408, 504})
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Whether a failed SPARQL request is worth retrying.
+
+    Gateway errors, throttling and timeouts are transient, as are connection level errors (`OSError`, which covers
+    both `requests` and `urllib` network errors). HTTP errors with any other status, e.g. a 400 for a malformed
+    query, are not.
+    """
+    status = _status_code(error)
+    if status is not None:
+        return status in _TRANSIENT_STATUSES
+    return isinstance(error, OSError)
+
+
+def is_timeout_error(error: BaseException) -> bool:
+    """Whether a failed SPARQL request timed out, on the client or on a gateway, while the query was running.
+
+    Timeouts while connecting, e.g. `requests.ConnectTimeout`, are connection errors: the endpoint is unreachable
+    whatever the size of the query.
+    """
+    status = _status_code(error)
+    if status is not None:
+        return status in _TIMEOUT_STATUSES
+    if any(cls.__name__ == "ConnectionError" for cls in type(error).__mro__):
+        return False
+    return isinstance(error, TimeoutError) or "Timeout" in type(error).__name__
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    # requests.HTTPError carries the response, urllib.error.HTTPError the code itself
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None) if response is not None else getattr(error, "code", None)
+    return status if isinstance(status, int) else None
+
+
+class CircuitBreaker:
+    """Stops sending queries to an endpoint that keeps failing.
+
+    After `failure_threshold` consecutive transient failures the circuit opens and every call raises
+    `CircuitOpenError` without touching the endpoint. Once `reset_timeout` seconds have passed, calls are let
+    through again: the first success closes the circuit, while another failure opens it for a further
+    `reset_timeout` seconds.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the circuit.
+            reset_timeout: Seconds the circuit stays open before queries are tried again.
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be a positive integer")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """One of "closed", "open" or "half-open"."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            return "open" if self._remaining() > 0 else "half-open"
+
+    def before_call(self) -> None:
+        """Raises `CircuitOpenError` while the circuit is open."""
+        with self._lock:
+            if self._opened_at is not None:
+                remaining = self._remaining()
+                if remaining > 0:
+                    raise CircuitOpenError(remaining)
+
+    def record_success(self) -> None:
+        """Closes the circuit."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Counts a failure and opens the circuit once the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.warning(f"SPARQL endpoint failed {self._failures} times in a row, opening the circuit")
+                self._opened_at = time.monotonic()
+
+    def reset(self) -> None:
+        """Forgets all failures."""
+        self.record_success()
+
+    def _remaining(self) -> float:
+        return self.reset_timeout - (time.monotonic() - self._opened_at)
+
+
+class ResiliencePolicy:
+    """Retries, splits and guards the per-chunk calls made by `pandasaurus.utils.query_utils.map_chunks`.
+
+    A chunk that fails with a transient error is retried up to `max_attempts` times, waiting an exponentially growing,
+    jittered delay between attempts. A chunk that times out is split in two halves which are run (and retried) on
+    their own and whose results are concatenated, since a smaller VALUES block is the only way to make a too slow
+    query pass. All calls go through a shared `CircuitBreaker`, so once the endpoint is down the remaining chunks fail
+    fast instead of each waiting through their retries. Only failures that are retried count towards opening it:
+    connection errors, gateway errors and timeouts of single-item chunks, but not timeouts that are bisected.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        bisect_on_timeout: bool = True,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        """
+        Args:
+            max_attempts: Attempts per chunk, including the first one.
+            base_delay: Upper bound in seconds of the delay before the first retry; it doubles with each retry.
+            max_delay: Upper bound in seconds of any delay.
+            bisect_on_timeout: Whether chunks that time out are split in two instead of retried as they are.
+            circuit_breaker: Circuit breaker guarding the endpoint. Defaults to a new `CircuitBreaker()`.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be a positive integer")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.bisect_on_timeout = bisect_on_timeout
+        self.circuit_breaker = circuit_breaker if circuit_breaker is not None else CircuitBreaker()
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Seconds to wait after the given failed attempt (1-based), with equal jitter so that concurrent workers do
+        not retry in lockstep."""
+        cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(cap / 2, cap)
+
+    def call(self, func: Callable[[Sequence[T]], R], chunk: Sequence[T]) -> R:
+        """Applies `func` to `chunk` under this policy.
+
+        Args:
+            func: Callable applied to the chunk. Its results must support `+` (e.g. lists of rows) for timed out
+                chunks to be split.
+            chunk: Items passed to `func`.
+
+        Returns:
+            The result of `func(chunk)`, or the concatenated results of its halves.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open.
+
+        """
+        attempt = 1
+        while True:
+            self.circuit_breaker.before_call()
+            try:
+                result = func(chunk)
+            except Exception as error:
+                if not is_transient_error(error):
+                    raise
+                if self.bisect_on_timeout and is_timeout_error(error) and len(chunk) > 1:
+                    # A chunk that is too slow says nothing about the endpoint's health, so it does not count towards
+                    # opening the circuit; only failures that are retried as they are do.
+                    middle = len(chunk) // 2
+                    logger.info(f"Query over {len(chunk)} terms timed out, splitting it in two")
+                    return self.call(func, chunk[:middle]) + self.call(func, chunk[middle:])
+                self.circuit_breaker.record_failure()
+                if attempt >= self.max_attempts:
+                    raise
+                delay = self.backoff_delay(attempt)
+                logger.info(f"Query attempt {attempt} failed with {error!r}, retrying in {delay:.1f} seconds")
+                time.sleep(delay)
+                attempt += 1
+            else:
+                self.circuit_breaker.record_success()
+                return result
+
+    def wrap(self, func: Callable[[Sequence[T]], R]) -> Callable[[Sequence[T]], R]:
+        """Wrap a per-chunk callable so that each call goes through `call`."""
+
+        def resilient(chunk: Sequence[T]) -> R:
+            return self.call(func, chunk)
+
+        return resilient
@@ -0,0 +1,146 @@
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional
+
+_WHITESPACE_OUTSIDE_LITERALS = re.compile(r"('[^']*'|\"[^\"]*\")|\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace outside of string literals so formatting differences map to the same cache entry.
+
+    Args:
+        query: SPARQL query text
+
+    Returns:
+        Normalized query text
+
+    """
+    return _WHITESPACE_OUTSIDE_LITERALS.sub(lambda match: match.group(1) or " ", query).strip()
+
+
+class SparqlCache(ABC):
+    """Base class for SPARQL result caches used by `run_sparql_query`.
+
+    Entries are keyed by a hash of the normalized query, the prefixes sent with it and the Ubergraph release the
+    results came from. Subclasses only need to implement storage; keying and namespacing are handled here.
+    """
+
+    def __init__(self, release: str):
+        """
+        Args:
+            release: Ubergraph release (or any ontology snapshot identifier) the cached results belong to.
+                Entries stored under a different release are never returned.
+        """
+        self.release = release
+
+    def make_key(self, query: str, prefixes: Iterable[str]) -> str:
+        """Returns the cache key of a query.
+
+        Args:
+            query: SPARQL query text
+            prefixes: CURIE prefixes sent along with the query
+
+        Returns:
+            Hex digest identifying the query within the current release
+
+        """
+        payload = "\n".join([self.release, " ".join(sorted(prefixes)), normalize_query(query)])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, query: str, prefixes: Iterable[str]) -> Optional[List[Dict[str, str]]]:
+        """Returns cached result rows of a query, or None on a cache miss."""
+        return self._read(self.make_key(query, prefixes))
+
+    def set(self, query: str, prefixes: Iterable[str], rows: List[Dict[str, str]]) -> None:
+        """Stores the result rows of a query."""
+        self._write(self.make_key(query, prefixes), rows)
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes every entry from the cache."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _read(self, key: str) -> Optional[List[Dict[str, str]]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _write(self, key: str, rows: List[Dict[str, str]]) -> None:
+        raise NotImplementedError
+
+
+class SQLiteSparqlCache(SparqlCache):
+    """SPARQL result cache persisted in a SQLite database, shareable between processes and notebooks."""
+
+    def __init__(
+        self,
+        path: str,
+        release: str,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        """
+        Args:
+            path: Location of the SQLite database file. It is created if it does not exist.
+            release: Ubergraph release the cached results belong to. Entries of other releases are purged on open.
+            ttl: Optional lifetime of an entry in seconds.
+            max_entries: Optional upper bound on the number of entries; least recently used entries are evicted.
+        """
+        super().__init__(release)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS sparql_cache (key TEXT PRIMARY KEY, release TEXT NOT NULL, "
+                "rows TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._connection.execute("DELETE FROM sparql_cache WHERE release != ?", (release,))
+
+    def clear(self) -> None:
+        """Removes every entry from the cache."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM sparql_cache")
+
+    def close(self) -> None:
+        """Closes the underlying database connection."""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM sparql_cache").fetchone()[0]
+
+    def _read(self, key: str) -> Optional[List[Dict[str, str]]]:
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT rows, created FROM sparql_cache WHERE key = ? AND release = ?", (key, self.release)
+            ).fetchone()
+            if row is None:
+                return None
+            rows, created = row
+            if self.ttl is not None and now - created > self.ttl:
+                self._connection.execute("DELETE FROM sparql_cache WHERE key = ?", (key,))
+                return None
+            self._connection.execute("UPDATE sparql_cache SET accessed = ? WHERE key = ?", (now, key))
+        return json.loads(rows)
+
+    def _write(self, key: str, rows: List[Dict[str, str]]) -> None:
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sparql_cache (key, release, rows, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, self.release, json.dumps(rows), now, now),
+            )
+            if self.max_entries is not None:
+                self._connection.execute(
+                    "DELETE FROM sparql_cache WHERE key NOT IN "
+                    "(SELECT key FROM sparql_cache ORDER BY accessed DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
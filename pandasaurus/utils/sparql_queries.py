@@ -11,6 +11,15 @@ def get_simple_enrichment_query(s_iri_list: List[str], o_iri_list: List[str], pr
     )
 
 
+def get_outgoing_edges_query(s_iri_list: List[str], property_list: List[str]) -> str:
+    """Used for graph generation; objects are left unbound and filtered locally by the caller."""
+    return (
+        f"SELECT ?s ?s_label ?p ?o ?o_label WHERE {{ GRAPH <http://reasoner.renci.org/redundant> {{"
+        f"VALUES ?s {{ {' '.join(s_iri_list)} }} VALUES ?p {{ {' '.join(property_list)} }}"
+        f"?s ?p ?o. }} ?s rdfs:label ?s_label. ?o rdfs:label ?o_label. FILTER(?s != ?o)}}# LIMIT"
+    )
+
+
 def get_minimal_enrichment_query(seed_list: List[str]) -> str:
     # TODO Add missing implementation. Might not be needed
     raise NotImplementedError
@@ -121,6 +130,17 @@ def get_replaced_by_query(term_iri_list: List[str]) -> str:
     )
 
 
+def get_term_validation_query(term_iri_list: List[str]) -> str:
+    """Used for CURIE validation and obsoletion checks in a single round trip"""
+    # IAO:0100001, term replaced by .
+    return (
+        f"SELECT ?term ?label ?depr_status ?new_term ?new_term_label WHERE {{ ?term rdf:type owl:Class. "
+        f"OPTIONAL {{ ?term rdfs:label ?label. }} OPTIONAL {{ ?term owl:deprecated ?depr_status. "
+        f"?term IAO:0100001 ?new_term. ?new_term rdfs:label ?new_term_label. }} "
+        f"VALUES ?term {{ {' '.join(term_iri_list)}}} }}# LIMIT"
+    )
+
+
 # Might not be needed
 def get_slim_list_query(ontology: str) -> str:
     return (
@@ -137,6 +157,14 @@ def get_slim_members_query(slim_name: str) -> str:
     )
 
 
+def get_slim_members_batch_query(slim_list: List[str]) -> str:
+    slim_names = " ".join(f"'{slim_name}'" for slim_name in slim_list)
+    return (
+        f"SELECT ?slim_name ?term WHERE {{ VALUES ?slim_name {{ {slim_names} }} ?term oio:inSubset ?slim. "
+        f"?slim rdfs:label ?slim_label. FILTER(str(?slim_label) = ?slim_name) }}# LIMIT"
+    )
+
+
 def get_ontology_list_query() -> str:
     return (
         "SELECT ?title "
@@ -0,0 +1,72 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+class TermRegistry:
+    """Process-wide memo of term metadata (label, validity and obsoletion/replacement) keyed by CURIE.
+
+    Shared by every `CurieValidator.construct_term_list` call once installed with `CurieValidator.set_term_registry`,
+    so repeated `Query` constructions over overlapping seed lists only query Ubergraph for unseen CURIEs. Entries
+    are evicted least recently used first once `max_size` is reached, and expire after `ttl` seconds.
+    """
+
+    def __init__(self, max_size: int = 100_000, ttl: Optional[float] = 24 * 60 * 60):
+        """
+        Args:
+            max_size: Maximum number of CURIEs kept in memory.
+            ttl: Lifetime of an entry in seconds, or None to keep entries until they are evicted.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, curie_list: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Returns the cached metadata of the CURIEs that are known and not expired.
+
+        Args:
+            curie_list: List of CURIEs
+
+        Returns:
+            Metadata of each cached CURIE, as returned by `CurieValidator.validate_terms`
+
+        """
+        now = time.monotonic()
+        found: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for curie in curie_list:
+                cached = self._entries.get(curie)
+                if cached is None:
+                    continue
+                created, entry = cached
+                if self.ttl is not None and now - created > self.ttl:
+                    del self._entries[curie]
+                    continue
+                self._entries.move_to_end(curie)
+                found[curie] = dict(entry)
+        return found
+
+    def update(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Stores metadata of CURIEs, evicting the least recently used entries when the registry is full."""
+        now = time.monotonic()
+        with self._lock:
+            for curie, entry in entries.items():
+                self._entries[curie] = (now, dict(entry))
+                self._entries.move_to_end(curie)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes every entry from the registry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, curie: str) -> bool:
+        return bool(self.get_many([curie]))
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,104 @@
+import pytest
+import requests
+
+from pandasaurus.backends.http_backend import (
+    UBERGRAPH_SPARQL_ENDPOINT,
+    HttpSparqlBackend,
+)
+from pandasaurus.utils.query_utils import get_backend
+
+prefix_map = {
+    "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
+    "CL": "http://purl.obolibrary.org/obo/CL_",
+}
+
+
+@pytest.fixture
+def session(mocker):
+    session = mocker.Mock(spec=requests.Session)
+    session.post.return_value.json.return_value = {
+        "head": {"vars": ["term", "label"]},
+        "results": {
+            "bindings": [
+                {
+                    "term": {"type": "uri", "value": "http://purl.obolibrary.org/obo/CL_0000084"},
+                    "label": {"type": "literal", "value": "T cell"},
+                },
+                {"term": {"type": "uri", "value": "http://example.org/unknown"}},
+            ]
+        },
+    }
+    return session
+
+
+def test_query(session):
+    backend = HttpSparqlBackend(
+        "http://localhost:8080/sparql", prefix_map=prefix_map, timeout=5, session=session, result_format="json"
+    )
+
+    rows = list(backend.query("SELECT ?term ?label WHERE { ?term rdfs:label ?label } # LIMIT", ["rdfs"]))
+
+    assert rows == [{"term": "CL:0000084", "label": "T cell"}, {"term": "http://example.org/unknown"}]
+    session.post.assert_called_once_with(
+        "http://localhost:8080/sparql",
+        data={
+            "query": "PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>\n"
+            "SELECT ?term ?label WHERE { ?term rdfs:label ?label } # LIMIT"
+        },
+        headers={"Accept": "application/sparql-results+json"},
+        timeout=5,
+    )
+
+
+def test_query_parses_tsv_results(session):
+    session.post.return_value.text = (
+        "?term\t?label\t?count\n"
+        '<http://purl.obolibrary.org/obo/CL_0000084>\t"T cell"@en\t3\n'
+        '<http://purl.obolibrary.org/obo/CL_0000084>\t"T\\tcell \\"alpha\\""^^<http://www.w3.org/2001/XMLSchema#string>'
+        "\t\n"
+        "<http://example.org/unknown>\t\t_:b0\n"
+    )
+    backend = HttpSparqlBackend(prefix_map=prefix_map, session=session)
+
+    rows = list(backend.query("SELECT ?term ?label ?count WHERE { ?term rdfs:label ?label } # LIMIT", ["rdfs"]))
+
+    assert rows == [
+        {"term": "CL:0000084", "label": "T cell", "count": "3"},
+        {"term": "CL:0000084", "label": 'T\tcell "alpha"'},
+        {"term": "http://example.org/unknown", "count": "b0"},
+    ]
+    assert rows[0]["term"] is rows[1]["term"]
+    assert session.post.call_args.kwargs["headers"] == {"Accept": "text/tab-separated-values"}
+
+
+def test_query_parses_empty_tsv_results(session):
+    session.post.return_value.text = ""
+    backend = HttpSparqlBackend(prefix_map=prefix_map, session=session)
+    assert list(backend.query("SELECT * WHERE { ?s ?p ?o } # LIMIT")) == []
+
+
+def test_invalid_result_format():
+    with pytest.raises(ValueError):
+        HttpSparqlBackend(prefix_map=prefix_map, result_format="xml")
+
+
+def test_query_raises_http_errors(session):
+    session.post.return_value.raise_for_status.side_effect = requests.HTTPError("502 Server Error")
+    backend = HttpSparqlBackend(prefix_map=prefix_map, session=session)
+    with pytest.raises(requests.HTTPError):
+        backend.query("SELECT * WHERE { ?s ?p ?o } # LIMIT")
+
+
+def test_session_reuses_connections():
+    backend = HttpSparqlBackend(pool_size=4)
+    adapter = backend.session.get_adapter(UBERGRAPH_SPARQL_ENDPOINT)
+    assert adapter._pool_maxsize == 4
+    assert "gzip" in backend.session.headers["Accept-Encoding"]
+    assert backend.session.headers["Accept"] == "application/sparql-results+json"
+    backend.close()
+
+
+def test_default_backend():
+    backend = get_backend()
+    assert isinstance(backend, HttpSparqlBackend)
+    assert backend.prefix_map()["CL"] == "http://purl.obolibrary.org/obo/CL_"
@@ -0,0 +1,260 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from test.data.snapshot_backend_data import (
+    get_snapshot_edges,
+    get_snapshot_obo,
+    get_snapshot_subsets,
+    get_snapshot_synonyms,
+    get_snapshot_terms,
+)
+
+import pandas as pd
+import pytest
+
+from pandasaurus.backends.snapshot_backend import OntologySnapshot, SnapshotBackend
+from pandasaurus.curie_validator import CurieValidator
+from pandasaurus.query import Query
+from pandasaurus.slim_manager import SlimManager
+from pandasaurus.utils.query_utils import get_backend, run_sparql_query, set_backend
+from pandasaurus.utils.sparql_queries import get_slim_list_query
+
+seed_list = ["CL:0000084", "CL:0000624", "CL:0000625", "CL:0000236"]
+
+
+@pytest.fixture
+def snapshot():
+    return OntologySnapshot(
+        pd.DataFrame(get_snapshot_edges()),
+        pd.DataFrame(get_snapshot_terms()),
+        synonyms=pd.DataFrame(get_snapshot_synonyms()),
+        subsets=pd.DataFrame(get_snapshot_subsets()),
+    )
+
+
+@pytest.fixture
+def snapshot_backend(snapshot):
+    previous_backend = get_backend()
+    set_backend(SnapshotBackend(snapshot))
+    yield
+    set_backend(previous_backend)
+
+
+def edges(df):
+    return set(zip(df["s"], df["p"], df["o"]))
+
+
+def test_snapshot_closure(snapshot):
+    rows = snapshot.simple_enrichment(["CL:0000624"], None, ["rdfs:subClassOf", "BFO:0000050"])
+    assert {(row["p"], row["o"]) for row in rows} == {
+        ("rdfs:subClassOf", "CL:0000084"),
+        ("rdfs:subClassOf", "CL:0000542"),
+        ("rdfs:subClassOf", "CL:0000000"),
+        ("BFO:0000050", "UBERON:0002390"),
+        ("BFO:0000050", "UBERON:0000468"),
+    }
+
+
+def test_snapshot_from_files(tmp_path):
+    pd.DataFrame(get_snapshot_edges()).to_csv(tmp_path / "edges.tsv", sep="\t", index=False)
+    pd.DataFrame(get_snapshot_terms()).to_csv(tmp_path / "terms.csv", index=False)
+    snapshot = OntologySnapshot.from_files(str(tmp_path / "edges.tsv"), str(tmp_path / "terms.csv"))
+    assert len(snapshot) == 10
+    assert snapshot.label("CL:0000084") == "T cell"
+    assert "CL:1234567" not in snapshot
+
+
+def test_snapshot_from_oak(tmp_path):
+    obo_path = tmp_path / "cl.obo"
+    obo_path.write_text(get_snapshot_obo())
+    snapshot = OntologySnapshot.from_oak(f"pronto:{obo_path}")
+    assert snapshot.label("CL:0000084") == "T cell"
+    assert snapshot.replacements(["CL:0011107"])[0]["new_term"] == "CL:0000636"
+    assert snapshot.synonyms(["CL:0000084"]) == [{"s": "CL:0000084", "exact_synonym": "T lymphocyte"}]
+    assert snapshot.slim_members("blood_and_immune_upper_slim") == [{"term": "CL:0000084"}]
+    assert {row["o"] for row in snapshot.simple_enrichment(["CL:0000084"], None, ["BFO:0000050"])} == {"UBERON:0002390"}
+
+
+def test_construct_term_list(snapshot_backend):
+    terms = CurieValidator.construct_term_list(["CL:0000084", "CL:0011107", "CL:1234567"])
+    assert [str(term) for term in terms] == [
+        "IRI: CL:0000084, Label: T cell, Valid: True, Obsoleted: False",
+        "IRI: CL:0011107, Label: obsolete Muller cell, Valid: True, Obsoleted: True, New term label: Mueller cell, "
+        "New term IRI: CL:0000636",
+        "IRI: CL:1234567, Label: Unknown label, Valid: False",
+    ]
+
+
+def test_simple_enrichment(snapshot_backend):
+    df = Query(seed_list).simple_enrichment()
+    assert edges(df) == {
+        ("CL:0000624", "rdfs:subClassOf", "CL:0000084"),
+        ("CL:0000625", "rdfs:subClassOf", "CL:0000084"),
+    }
+
+
+def test_minimal_slim_enrichment(snapshot_backend):
+    df = Query(["CL:0000624", "CL:0000236"]).minimal_slim_enrichment(["blood_and_immune_upper_slim"])
+    assert edges(df) == {("CL:0000624", "rdfs:subClassOf", "CL:0000084")}
+
+
+def test_full_slim_enrichment(snapshot_backend):
+    df = Query(["CL:0000624"]).full_slim_enrichment(["blood_and_immune_upper_slim"])
+    assert set(zip(df["s"], df["o"])) == {("CL:0000624", "CL:0000084")}
+    assert set(df["p"]) == {"rdfs:subClassOf"}
+
+
+def test_contextual_slim_enrichment(snapshot_backend):
+    df = Query(["CL:0000084"]).contextual_slim_enrichment(["UBERON:0000468"])
+    assert edges(df) == {("CL:0000084", "rdfs:subClassOf", "CL:0000542")}
+
+
+def test_ancestor_enrichment(snapshot_backend):
+    df = Query(["CL:0000624", "CL:0000236"]).ancestor_enrichment(2)
+    # Two hops reach CL:0000084 and CL:0000542 from CL:0000624, and CL:0000542 and CL:0000000 from CL:0000236
+    assert edges(df) == {
+        ("CL:0000624", "rdfs:subClassOf", "CL:0000084"),
+        ("CL:0000624", "rdfs:subClassOf", "CL:0000542"),
+        ("CL:0000624", "rdfs:subClassOf", "CL:0000000"),
+        ("CL:0000236", "rdfs:subClassOf", "CL:0000542"),
+        ("CL:0000236", "rdfs:subClassOf", "CL:0000000"),
+    }
+
+
+@pytest.mark.parametrize(
+    "enrichment",
+    [
+        lambda q: q.simple_enrichment(),
+        lambda q: q.minimal_slim_enrichment(["blood_and_immune_upper_slim"]),
+        lambda q: q.full_slim_enrichment(["blood_and_immune_upper_slim"]),
+        lambda q: q.contextual_slim_enrichment(["UBERON:0000468"]),
+        lambda q: q.ancestor_enrichment(2),
+    ],
+)
+def test_add_seeds_matches_full_rerun(snapshot_backend, enrichment):
+    q = Query(["CL:0000624", "CL:0000236"])
+    enrichment(q)
+    q.graph_df
+    enriched_df = q.add_seeds(["CL:0000084", "CL:0000625", "CL:0000624"])
+
+    expected = Query(["CL:0000624", "CL:0000236", "CL:0000084", "CL:0000625"])
+    enrichment(expected)
+    assert edges(enriched_df) == edges(expected.enriched_df)
+    assert edges(q.graph_df) == edges(expected.graph_df)
+    assert set(q.graph) == set(expected.graph)
+
+
+@pytest.mark.parametrize("string_dtype", [None, "category", "auto"])
+@pytest.mark.parametrize("slims", [None, ["blood_and_immune_upper_slim"]])
+def test_batch_enrichment_matches_separate_queries(snapshot_backend, monkeypatch, slims, string_dtype):
+    # With "auto", the merged enrichment is categorical while the per seed list results are not.
+    monkeypatch.setattr(Query, "_CATEGORICAL_MIN_ROWS", 2)
+    seed_lists = {
+        "blood": ["CL:0000624", "CL:0000084", "CL:0000236"],
+        "t_cells": ["CL:0000625", "CL:0000084"],
+        "unknown": ["CL:9999999"],
+    }
+    results = Query.batch_enrichment(seed_lists, slim_list=slims, string_dtype=string_dtype)
+
+    assert list(results) == list(seed_lists)
+    for name, seeds in seed_lists.items():
+        expected = Query(seeds, string_dtype=string_dtype)
+        expected_df = expected.minimal_slim_enrichment(slims) if slims else expected.simple_enrichment()
+        pd.testing.assert_frame_equal(
+            results[name].sort_values(["s", "p", "o"]).reset_index(drop=True),
+            expected_df.sort_values(["s", "p", "o"]).reset_index(drop=True),
+        )
+
+
+RESUME_SCRIPT = """
+import json
+import sys
+
+import pandas as pd
+
+from pandasaurus.backends.snapshot_backend import OntologySnapshot, SnapshotBackend
+from pandasaurus.query import Query
+from pandasaurus.utils.chunk_sizer import AdaptiveChunkSizer
+from pandasaurus.utils.query_utils import set_backend, set_chunk_sizer
+from test.data.snapshot_backend_data import (
+    get_snapshot_edges,
+    get_snapshot_subsets,
+    get_snapshot_synonyms,
+    get_snapshot_terms,
+)
+
+
+class CountingBackend(SnapshotBackend):
+    enrichment_queries = 0
+
+    def query(self, query, prefixes=None):
+        if "nonredundant" in query:
+            CountingBackend.enrichment_queries += 1
+        return super().query(query, prefixes)
+
+
+snapshot = OntologySnapshot(
+    pd.DataFrame(get_snapshot_edges()),
+    pd.DataFrame(get_snapshot_terms()),
+    synonyms=pd.DataFrame(get_snapshot_synonyms()),
+    subsets=pd.DataFrame(get_snapshot_subsets()),
+)
+set_backend(CountingBackend(snapshot))
+chunk_size = int(sys.argv[2])
+set_chunk_sizer(AdaptiveChunkSizer(initial_size=chunk_size, min_size=chunk_size, max_size=chunk_size))
+df = Query(["CL:0000624", "CL:0000625", "CL:0000236"], checkpoint_dir=sys.argv[1]).full_slim_enrichment(
+    ["blood_and_immune_upper_slim"]
+)
+print(json.dumps({"queries": CountingBackend.enrichment_queries, "edges": sorted(map(list, zip(df["s"], df["o"])))}))
+"""
+
+
+def run_resume_script(checkpoint_dir, hash_seed, sizer_chunk_size):
+    root = Path(__file__).resolve().parents[2]
+    env = dict(os.environ, PYTHONHASHSEED=str(hash_seed), PYTHONPATH=str(root))
+    completed = subprocess.run(
+        [sys.executable, "-c", RESUME_SCRIPT, str(checkpoint_dir), str(sizer_chunk_size)],
+        cwd=root,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+def test_full_slim_enrichment_resumes_from_checkpoint_in_new_process(tmp_path):
+    first_run = run_resume_script(tmp_path, hash_seed=1, sizer_chunk_size=1)
+    resumed_run = run_resume_script(tmp_path, hash_seed=2, sizer_chunk_size=3)
+
+    assert first_run["queries"] > 0
+    assert first_run["edges"]
+    assert resumed_run["queries"] == 0
+    assert resumed_run["edges"] == first_run["edges"]
+
+
+def test_synonym_lookup(snapshot_backend):
+    df = Query(["CL:0000084", "CL:0000236"]).synonym_lookup()
+    assert set(zip(df["ID"], df["name"], df["type"])) == {
+        ("CL:0000084", "T lymphocyte", "exact_synonym"),
+        ("CL:0000084", "T-cell", "related_synonym"),
+        ("CL:0000236", "B lymphocyte", "exact_synonym"),
+    }
+
+
+def test_enrichment_graph(snapshot_backend):
+    query = Query(seed_list)
+    query.simple_enrichment()
+    assert len(query.graph_df) == 2
+    assert len(query.graph) > 0
+
+
+def test_slim_members(snapshot_backend):
+    assert sorted(SlimManager.get_slim_members(["blood_and_immune_upper_slim"])) == ["CL:0000084", "CL:0000236"]
+
+
+def test_unsupported_query(snapshot_backend):
+    with pytest.raises(NotImplementedError):
+        run_sparql_query(get_slim_list_query("Cell Ontology"))
@@ -0,0 +1,19 @@
+import pytest
+
+from pandasaurus.slim_manager import SlimManager
+from pandasaurus.utils.query_utils import get_resilience_policy
+
+
+@pytest.fixture(autouse=True)
+def clear_slim_manager_cache():
+    SlimManager.clear_cache()
+    yield
+    SlimManager.clear_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breaker():
+    yield
+    policy = get_resilience_policy()
+    if policy is not None:
+        policy.circuit_breaker.reset()
@@ -87,3 +87,33 @@ def get_expected_construct_term_list_missing_validation():
         Term("T cell", "CL:0000084", True),
         Term(None, "CL:9999999", False),
     ]
+
+
+def get_validate_terms_data():
+    return ["CL:0000084", "CL:0011107", "CL:1234567"]
+
+
+def get_validate_terms_result():
+    return [
+        {"label": "T cell", "term": "CL:0000084"},
+        {
+            "depr_status": "true",
+            "label": "obsolete Muller cell",
+            "new_term": "CL:0000636",
+            "new_term_label": "Mueller cell",
+            "term": "CL:0011107",
+        },
+    ]
+
+
+def get_expected_validate_terms():
+    return {
+        "CL:0000084": {"label": "T cell", "valid": True, "new_term": None, "new_term_label": None},
+        "CL:0011107": {
+            "label": "obsolete Muller cell",
+            "valid": True,
+            "new_term": "CL:0000636",
+            "new_term_label": "Mueller cell",
+        },
+        "CL:1234567": {"label": None, "valid": False, "new_term": None, "new_term_label": None},
+    }
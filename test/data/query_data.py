@@ -1539,10 +1539,6 @@ def get_enrichment_validate_curie_list_result():
     ]
 
 
-def get_enrichment_find_obsolete_terms_data():
-    return []
-
-
 def get_synonym_lookup_data():
     return [
         {"ID": "CL:0000084", "label": "T cell", "name": "mature T cell", "type": "related_synonym"},
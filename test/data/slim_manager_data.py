@@ -92,42 +92,42 @@ def get_slim_list():
 
 def get_slim_members_result():
     return [
-        {"term": "CL:0000037"},
-        {"term": "CL:0000038"},
-        {"term": "CL:0000097"},
-        {"term": "CL:0000145"},
-        {"term": "CL:0000232"},
-        {"term": "CL:0000233"},
-        {"term": "CL:0000235"},
-        {"term": "CL:0000236"},
-        {"term": "CL:0000547"},
-        {"term": "CL:0000556"},
-        {"term": "CL:0000558"},
-        {"term": "CL:0000576"},
-        {"term": "CL:0000647"},
-        {"term": "CL:0000762"},
-        {"term": "CL:0000765"},
-        {"term": "CL:0000767"},
-        {"term": "CL:0000771"},
-        {"term": "CL:0000775"},
-        {"term": "CL:0000784"},
-        {"term": "CL:0000786"},
-        {"term": "CL:0000789"},
-        {"term": "CL:0000798"},
-        {"term": "CL:0000816"},
-        {"term": "CL:0000837"},
-        {"term": "CL:0000842"},
-        {"term": "CL:0000889"},
-        {"term": "CL:0000990"},
-        {"term": "CL:0001065"},
-        {"term": "CL:0002031"},
-        {"term": "CL:0002032"},
-        {"term": "CL:0002087"},
-        {"term": "CL:0002420"},
-        {"term": "CL:0002679"},
-        {"term": "CL:0017005"},
-        {"term": "CL:0017006"},
-        {"term": "CL:4030029"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000037"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000038"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000097"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000145"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000232"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000233"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000235"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000236"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000547"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000556"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000558"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000576"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000647"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000762"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000765"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000767"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000771"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000775"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000784"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000786"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000789"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000798"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000816"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000837"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000842"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000889"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000990"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0001065"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0002031"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0002032"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0002087"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0002420"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0002679"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0017005"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0017006"},
+        {"slim_name": "blood_and_immune_upper_slim", "term": "CL:4030029"},
     ]
 
 
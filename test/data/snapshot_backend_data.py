@@ -0,0 +1,85 @@
+def get_snapshot_edges():
+    return [
+        {"s": "CL:0000542", "p": "rdfs:subClassOf", "o": "CL:0000000"},
+        {"s": "CL:0000084", "p": "rdfs:subClassOf", "o": "CL:0000542"},
+        {"s": "CL:0000624", "p": "rdfs:subClassOf", "o": "CL:0000084"},
+        {"s": "CL:0000625", "p": "rdfs:subClassOf", "o": "CL:0000084"},
+        {"s": "CL:0000236", "p": "rdfs:subClassOf", "o": "CL:0000542"},
+        {"s": "CL:0000636", "p": "rdfs:subClassOf", "o": "CL:0000000"},
+        {"s": "CL:0000542", "p": "BFO:0000050", "o": "UBERON:0002390"},
+        {"s": "UBERON:0002390", "p": "BFO:0000050", "o": "UBERON:0000468"},
+    ]
+
+
+def get_snapshot_terms():
+    return [
+        {"id": "CL:0000000", "label": "cell", "replaced_by": None},
+        {"id": "CL:0000542", "label": "lymphocyte", "replaced_by": None},
+        {"id": "CL:0000084", "label": "T cell", "replaced_by": None},
+        {"id": "CL:0000624", "label": "CD4-positive, alpha-beta T cell", "replaced_by": None},
+        {"id": "CL:0000625", "label": "CD8-positive, alpha-beta T cell", "replaced_by": None},
+        {"id": "CL:0000236", "label": "B cell", "replaced_by": None},
+        {"id": "CL:0000636", "label": "Mueller cell", "replaced_by": None},
+        {"id": "CL:0011107", "label": "obsolete Muller cell", "replaced_by": "CL:0000636"},
+        {"id": "UBERON:0002390", "label": "hematopoietic system", "replaced_by": None},
+        {"id": "UBERON:0000468", "label": "multicellular organism", "replaced_by": None},
+    ]
+
+
+def get_snapshot_synonyms():
+    return [
+        {"id": "CL:0000084", "type": "exact", "name": "T lymphocyte"},
+        {"id": "CL:0000084", "type": "related", "name": "T-cell"},
+        {"id": "CL:0000236", "type": "exact", "name": "B lymphocyte"},
+    ]
+
+
+def get_snapshot_subsets():
+    return [
+        {"id": "CL:0000084", "subset": "blood_and_immune_upper_slim"},
+        {"id": "CL:0000236", "subset": "blood_and_immune_upper_slim"},
+    ]
+
+
+def get_snapshot_obo():
+    return """format-version: 1.2
+ontology: cl
+subsetdef: blood_and_immune_upper_slim "blood and immune upper slim"
+
+[Term]
+id: CL:0000000
+name: cell
+
+[Term]
+id: CL:0000084
+name: T cell
+synonym: "T lymphocyte" EXACT []
+subset: blood_and_immune_upper_slim
+is_a: CL:0000542 ! lymphocyte
+
+[Term]
+id: CL:0000542
+name: lymphocyte
+is_a: CL:0000000 ! cell
+relationship: BFO:0000050 UBERON:0002390 ! part of hematopoietic system
+
+[Term]
+id: CL:0011107
+name: obsolete Muller cell
+is_obsolete: true
+replaced_by: CL:0000636
+
+[Term]
+id: CL:0000636
+name: Mueller cell
+is_a: CL:0000000 ! cell
+
+[Term]
+id: UBERON:0002390
+name: hematopoietic system
+
+[Typedef]
+id: BFO:0000050
+name: part of
+is_transitive: true
+"""
@@ -50,3 +50,28 @@ def test_apply_transitive_reduction_with_invalid_predicates(sample_test_df, samp
     # expected_triples = get_nonredundant_expected_triples()
     # for triple in graph:
     #     assert triple in expected_triples
+
+
+def test_generate_enrichment_graph_contains_every_expected_triple(sample_test_df, sample_rdf_graph):
+    nodes = set(sample_test_df["s"]) | set(sample_test_df["o"])
+    edges = set(zip(sample_test_df["s"], sample_test_df["o"]))
+    # One label and one type triple per node plus one subClassOf triple per edge
+    assert len(sample_rdf_graph) == 2 * len(nodes) + len(edges)
+    assert set(sample_rdf_graph) <= set(get_redundant_expected_triples())
+
+
+def test_generate_enrichment_graph_empty_df():
+    assert len(GraphGenerator.generate_enrichment_graph(pd.DataFrame())) == 0
+
+
+def test_predicate_exists(sample_rdf_graph):
+    assert GraphGenerator._predicate_exists(sample_rdf_graph, GraphGenerator._normalize_predicate("rdfs:subClassOf"))
+    assert not GraphGenerator._predicate_exists(sample_rdf_graph, GraphGenerator._normalize_predicate("BFO:0000050"))
+
+
+def test_apply_transitive_reduction_logs_timings(sample_test_df, sample_rdf_graph, caplog):
+    caplog.set_level(logging.DEBUG, logger="pandasaurus.utils.logging_config")
+
+    GraphGenerator.apply_transitive_reduction(sample_rdf_graph, sample_test_df["p"].unique().tolist())
+
+    assert "existence checks took" in caplog.text
@@ -0,0 +1,67 @@
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandasaurus.graph.transitive_reduction import (
+    redundant_edge_mask,
+    transitive_reduction_df,
+)
+
+
+def _random_dag(node_count, edge_count, seed):
+    rng = random.Random(seed)
+    edges = set()
+    while len(edges) < edge_count:
+        s, o = rng.sample(range(node_count), 2)
+        edges.add((max(s, o), min(s, o)))
+    return sorted(edges)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_redundant_edge_mask_matches_networkx(seed):
+    nx = pytest.importorskip("networkx")
+    edges = _random_dag(60, 300, seed)
+    sources, targets = (np.array(column) for column in zip(*edges))
+
+    redundant = redundant_edge_mask(sources, targets, 60)
+
+    reduced = nx.transitive_reduction(nx.DiGraph(edges))
+    assert {edge for edge, flag in zip(edges, redundant) if not flag} == set(reduced.edges)
+
+
+def test_redundant_edge_mask_chain():
+    # 0 -> 1 -> 2 -> 3 plus the shortcuts 0 -> 2 and 0 -> 3
+    sources = np.array([0, 1, 2, 0, 0])
+    targets = np.array([1, 2, 3, 2, 3])
+
+    assert redundant_edge_mask(sources, targets, 4).tolist() == [False, False, False, True, True]
+
+
+def test_redundant_edge_mask_empty():
+    assert len(redundant_edge_mask(np.array([], dtype=int), np.array([], dtype=int), 0)) == 0
+
+
+def test_redundant_edge_mask_rejects_cycles():
+    with pytest.raises(ValueError):
+        redundant_edge_mask(np.array([0, 1, 2]), np.array([1, 2, 0]), 3)
+
+
+def test_transitive_reduction_df():
+    edge_df = pd.DataFrame(
+        [
+            ["CL:0000813", "memory T cell", "rdfs:subClassOf", "CL:0000084", "T cell"],
+            ["CL:0000813", "memory T cell", "rdfs:subClassOf", "CL:0000084", "T cell"],
+            ["CL:0000084", "T cell", "rdfs:subClassOf", "CL:0000000", "cell"],
+            ["CL:0000813", "memory T cell", "rdfs:subClassOf", "CL:0000000", "cell"],
+        ],
+        columns=["s", "s_label", "p", "o", "o_label"],
+    ).astype("category")
+
+    reduced_df = transitive_reduction_df(edge_df)
+
+    assert list(zip(reduced_df["s"], reduced_df["o"])) == [
+        ("CL:0000813", "CL:0000084"),
+        ("CL:0000084", "CL:0000000"),
+    ]
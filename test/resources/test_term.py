@@ -57,3 +57,29 @@ def test_str():
         str(obsolete_term) == "IRI: CL:0011107, Label: obsolete Muller cell, Valid: True, Obsoleted: True, "
         "New term label: Muller cell, New term IRI: CL:0000636"
     )
+
+
+def test_term_has_no_instance_dict():
+    term = Term("T cell", "CL:0000084", True)
+    assert not hasattr(term, "__dict__")
+
+
+def test_from_validation():
+    term_validation = {
+        "CL:0000084": {"label": "T cell", "valid": True, "new_term": None, "new_term_label": None},
+        "CL:0011107": {
+            "label": "obsolete Muller cell",
+            "valid": True,
+            "new_term": "CL:0000636",
+            "new_term_label": "Mueller cell",
+        },
+        "CL:1234567": {"label": None, "valid": False, "new_term": None, "new_term_label": None},
+    }
+
+    term_list = Term.from_validation(["CL:1234567", "CL:0000084", "CL:0011107"], term_validation)
+
+    assert term_list == [
+        Term(None, "CL:1234567", False),
+        Term("T cell", "CL:0000084", True),
+        Term("obsolete Muller cell", "CL:0011107", True, "Mueller cell", "CL:0000636"),
+    ]
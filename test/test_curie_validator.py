@@ -7,10 +7,13 @@ from test.data.curie_validator_data import (
     get_expected_construct_term_list_missing_validation,
     get_expected_find_obsolete_terms,
     get_expected_validate_curie_list,
+    get_expected_validate_terms,
     get_find_obsolete_terms_data,
     get_find_obsolete_terms_result,
     get_validate_curie_list_data,
     get_validate_curie_list_result,
+    get_validate_terms_data,
+    get_validate_terms_result,
 )
 
 import pytest
@@ -18,6 +21,7 @@ import pytest
 from pandasaurus.curie_validator import CurieValidator
 from pandasaurus.resources.term import Term
 from pandasaurus.utils.pandasaurus_exceptions import InvalidTerm, ObsoletedTerm
+from pandasaurus.utils.term_registry import TermRegistry
 
 
 def test_validate_curie_prefixes():
@@ -106,6 +110,67 @@ def test_find_obsolete_terms_batches_requests(mocker):
     }
 
 
+def test_validate_terms(mocker):
+    mocker.patch(
+        "pandasaurus.curie_validator.run_sparql_query",
+        side_effect=[iter(get_validate_terms_result())],
+    )
+
+    assert CurieValidator.validate_terms(get_validate_terms_data()) == get_expected_validate_terms()
+
+
+def test_construct_term_list_uses_one_query_per_chunk(mocker):
+    mocker.patch.object(CurieValidator, "_CURIE_CHUNK_SIZE", 2)
+    run_query_mock = mocker.patch(
+        "pandasaurus.curie_validator.run_sparql_query",
+        side_effect=[iter(get_validate_terms_result()), iter([])],
+    )
+
+    term_list = CurieValidator.construct_term_list(get_validate_terms_data())
+
+    assert run_query_mock.call_count == 2
+    assert term_list == [
+        Term("T cell", "CL:0000084", True),
+        Term("obsolete Muller cell", "CL:0011107", True, "Mueller cell", "CL:0000636"),
+        Term(None, "CL:1234567", False),
+    ]
+
+
+def test_validate_terms_only_queries_unseen_curies(mocker):
+    mocker.patch.object(CurieValidator, "_term_registry", TermRegistry())
+    run_query_mock = mocker.patch(
+        "pandasaurus.curie_validator.run_sparql_query",
+        side_effect=[iter(get_validate_terms_result()), iter([{"term": "CL:0000787", "label": "memory B cell"}])],
+    )
+
+    assert CurieValidator.validate_terms(get_validate_terms_data()) == get_expected_validate_terms()
+    result = CurieValidator.validate_terms(["CL:0000084", "CL:0000787", "CL:1234567"])
+
+    assert run_query_mock.call_count == 2
+    assert "CL:0000787" in run_query_mock.call_args.args[0]
+    assert "CL:0000084" not in run_query_mock.call_args.args[0]
+    assert "CL:1234567" not in run_query_mock.call_args.args[0]
+    assert result == {
+        "CL:0000084": get_expected_validate_terms()["CL:0000084"],
+        "CL:0000787": {"label": "memory B cell", "valid": True, "new_term": None, "new_term_label": None},
+        "CL:1234567": get_expected_validate_terms()["CL:1234567"],
+    }
+
+
+def test_validate_terms_skips_query_when_all_curies_are_known(mocker):
+    mocker.patch.object(CurieValidator, "_term_registry", TermRegistry())
+    run_query_mock = mocker.patch(
+        "pandasaurus.curie_validator.run_sparql_query",
+        side_effect=[iter(get_validate_terms_result())],
+    )
+
+    CurieValidator.construct_term_list(get_validate_terms_data())
+    term_list = CurieValidator.construct_term_list(get_validate_terms_data())
+
+    assert run_query_mock.call_count == 1
+    assert Term("obsolete Muller cell", "CL:0011107", True, "Mueller cell", "CL:0000636") in term_list
+
+
 def test_find_obsolete_term_replacement():
     pass
 
@@ -138,7 +203,6 @@ def test_construct_term_list(mocker):
         "pandasaurus.curie_validator.run_sparql_query",
         side_effect=[
             iter(get_construct_term_list_result()),
-            iter([]),
         ],
     )
 
@@ -150,7 +214,6 @@ def test_construct_term_list_handles_missing_validation(mocker):
         "pandasaurus.curie_validator.run_sparql_query",
         side_effect=[
             iter(get_construct_term_list_missing_validation_result()),
-            iter([]),
         ],
     )
 
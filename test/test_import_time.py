@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["oaklib", "networkx", "requests", "rdflib.plugins.sparql"]
+
+
+def import_profile(module: str) -> dict:
+    """Runs `python -X importtime` in a fresh interpreter and returns cumulative import times in microseconds."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile = {}
+    for line in completed.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                profile[name.strip()] = int(cumulative)
+    return profile
+
+
+@pytest.mark.parametrize("module", ["pandasaurus.query", "pandasaurus.resources.term", "pandasaurus.slim_manager"])
+def test_import_defers_heavy_dependencies(module):
+    profile = import_profile(module)
+    assert module in profile
+    assert [heavy for heavy in HEAVY_MODULES if heavy in profile] == []
+
+
+def test_backend_is_created_on_first_use():
+    code = (
+        "import sys; from pandasaurus.utils import query_utils; "
+        "assert query_utils._backend is None; query_utils.get_backend(); "
+        "assert query_utils._backend is not None and 'requests' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
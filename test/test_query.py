@@ -1,3 +1,4 @@
+import re
 from test.data.query_data import (
     get_ancestor_enrichment_data,
     get_ancestor_enrichment_result,
@@ -7,7 +8,6 @@ from test.data.query_data import (
     get_context_members_result,
     get_contextual_enrichment_data,
     get_contextual_enrichment_result,
-    get_enrichment_find_obsolete_terms_data,
     get_enrichment_validate_curie_list_result,
     get_full_enrichment_data,
     get_full_enrichment_result,
@@ -27,6 +27,7 @@ import pandas as pd
 import pytest
 
 from pandasaurus.query import Query
+from pandasaurus.utils.query_utils import chunks
 
 blood_and_immune_test_data = get_blood_and_immune_test_data()
 
@@ -42,7 +43,6 @@ def test_query_constructor_with_valid_seed_list(mocker):
         "pandasaurus.curie_validator.run_sparql_query",
         side_effect=[
             iter([{"label": "T cell", "term": "CL:0000084"}, {"label": "memory B cell", "term": "CL:0000787"}]),
-            iter([]),
         ],
     )
     query = Query(seed_list)
@@ -55,7 +55,6 @@ def test_query_constructor_with_invalid_seed_list(mocker):
         "pandasaurus.curie_validator.run_sparql_query",
         side_effect=[
             iter([{"label": "T cell", "term": "CL:0000084"}]),
-            iter([]),
         ],
     )
     with pytest.raises(ValueError) as exc_info:
@@ -72,16 +71,16 @@ def test_query_constructor_with_obsoleted_seed_list(mocker):
     mocker.patch(
         "pandasaurus.curie_validator.run_sparql_query",
         side_effect=[
-            iter([{"label": "T cell", "term": "CL:0000084"}, {"label": "obsolete Muller cell", "term": "CL:0011107"}]),
             iter(
                 [
+                    {"label": "T cell", "term": "CL:0000084"},
                     {
                         "depr_status": "true",
                         "label": "obsolete Muller cell",
                         "new_term": "CL:0000636",
                         "new_term_label": "Mueller cell",
                         "term": "CL:0011107",
-                    }
+                    },
                 ]
             ),
         ],
@@ -107,7 +106,6 @@ def test_simple_enrichment(mocker):
         "pandasaurus.curie_validator.run_sparql_query",
         side_effect=[
             iter(get_enrichment_validate_curie_list_result()),
-            iter(get_enrichment_find_obsolete_terms_data()),
         ],
     )
     # TODO Second call has to be revised
@@ -135,7 +133,6 @@ def test_minimal_slim_enrichment(mocker):
         "pandasaurus.curie_validator.run_sparql_query",
         side_effect=[
             iter(get_enrichment_validate_curie_list_result()),
-            iter(get_enrichment_find_obsolete_terms_data()),
         ],
     )
     mocker.patch(
@@ -177,7 +174,6 @@ def test_full_slim_enrichment(mocker):
         "pandasaurus.curie_validator.run_sparql_query",
         side_effect=[
             iter(get_enrichment_validate_curie_list_result()),
-            iter(get_enrichment_find_obsolete_terms_data()),
         ],
     )
     mocker.patch(
@@ -219,7 +215,6 @@ def test_contextual_slim_enrichment(mocker):
         "pandasaurus.curie_validator.run_sparql_query",
         side_effect=[
             iter(get_enrichment_validate_curie_list_result()),
-            iter(get_enrichment_find_obsolete_terms_data()),
         ],
     )
     # TODO refactor needed!!!
@@ -264,7 +259,6 @@ def test_ancestor_enrichment(mocker):
         "pandasaurus.curie_validator.run_sparql_query",
         side_effect=[
             iter(get_enrichment_validate_curie_list_result()),
-            iter(get_enrichment_find_obsolete_terms_data()),
         ],
     )
     mocker.patch(
@@ -288,7 +282,6 @@ def test_ancestor_enrichment_requires_integer_step(mocker):
         "pandasaurus.curie_validator.run_sparql_query",
         side_effect=[
             iter(get_enrichment_validate_curie_list_result()),
-            iter(get_enrichment_find_obsolete_terms_data()),
         ],
     )
     q = Query(blood_and_immune_test_data)
@@ -301,7 +294,6 @@ def test_ancestor_enrichment_requires_positive_step(mocker):
         "pandasaurus.curie_validator.run_sparql_query",
         side_effect=[
             iter(get_enrichment_validate_curie_list_result()),
-            iter(get_enrichment_find_obsolete_terms_data()),
         ],
     )
     q = Query(blood_and_immune_test_data)
@@ -314,7 +306,6 @@ def test_synonym_lookup(mocker):
         "pandasaurus.curie_validator.run_sparql_query",
         side_effect=[
             iter(get_enrichment_validate_curie_list_result()),
-            iter(get_enrichment_find_obsolete_terms_data()),
         ],
     )
     q = Query(["CL:0000084", "CL:0000813", "CL:0000815", "CL:0000900"])
@@ -331,8 +322,59 @@ def test_synonym_lookup(mocker):
     pd.testing.assert_frame_equal(result_df, expected_df)
 
 
-def test_query():
-    pass
+def test_query(mocker):
+    mocker.patch(
+        "pandasaurus.curie_validator.run_sparql_query",
+        side_effect=[
+            iter(get_enrichment_validate_curie_list_result()),
+        ],
+    )
+    q = Query(["CL:0000084", "CL:0000813", "CL:0000815", "CL:0000900"])
+    run_query_mock = mocker.patch(
+        "pandasaurus.query.run_sparql_query",
+        side_effect=[
+            iter(get_synonym_lookup_result()),
+        ],
+    )
+    q.enriched_df = pd.DataFrame(
+        [
+            ["CL:0000813", "memory T cell", "rdfs:subClassOf", "CL:0000084", "T cell"],
+            ["CL:0000900", "naive T cell", "rdfs:subClassOf", "CL:0000084", "T cell"],
+            ["CL:0000815", "regulatory T cell", "rdfs:subClassOf", "CL:0000000", "cell"],
+        ],
+        columns=["s", "s_label", "p", "o", "o_label"],
+    )
+    annotation_df = pd.DataFrame(
+        {
+            "sample": ["a", "b", "c", "d", "e"],
+            "cell_type": ["CL:0000084", "CL:0000813", "CL:0000815", "CL:0000900", "CL:0000236"],
+        }
+    )
+
+    result_df = q.query("cell_type", "  t   LYMPHOCYTE ", annotation_df)
+    assert result_df["sample"].tolist() == ["a", "b", "d"]
+
+    result_df = q.query("s", "Cell")
+    assert result_df["s"].tolist() == ["CL:0000815"]
+
+    assert q.query("cell_type", "unknown cell", annotation_df).empty
+    assert run_query_mock.call_count == 1
+
+
+def test_query_requires_an_enrichment_or_a_dataframe(mocker):
+    mocker.patch(
+        "pandasaurus.curie_validator.run_sparql_query",
+        side_effect=[
+            iter(get_enrichment_validate_curie_list_result()),
+        ],
+    )
+    q = Query(["CL:0000084", "CL:0000813", "CL:0000815", "CL:0000900"])
+    run_query_mock = mocker.patch("pandasaurus.query.run_sparql_query")
+    with pytest.raises(ValueError, match="No enrichment has run yet"):
+        q.query("s", "T cell")
+    with pytest.raises(ValueError, match="'cell_type' not found"):
+        q.query("cell_type", "T cell", pd.DataFrame({"sample": ["a"]}))
+    run_query_mock.assert_not_called()
 
 
 def test_update_obsoleted_terms(mocker):
@@ -347,25 +389,22 @@ def test_update_obsoleted_terms(mocker):
             iter(
                 [
                     {"label": "T cell", "term": "CL:0000084"},
-                    {"label": "obsolete Muller cell", "term": "CL:0011107"},
-                ]
-            ),
-            iter(
-                [
                     {
                         "depr_status": "true",
                         "label": "obsolete Muller cell",
                         "new_term": "CL:0000636",
                         "new_term_label": "Mueller cell",
                         "term": "CL:0011107",
-                    }
+                    },
                 ]
             ),
         ],
     )
     q = Query(seed_list)
+    assert q._term_iri_list == seed_list
     q.update_obsoleted_terms()
     assert [str(term) for term in q._term_list] == expected_update_obsoleted_terms
+    assert q._term_iri_list == ["CL:0000084", "CL:0000636"]
 
 
 def test_get_most_specific_objects(mocker):
@@ -390,14 +429,12 @@ def test_get_most_specific_objects(mocker):
         "pandasaurus.curie_validator.run_sparql_query",
         side_effect=[
             iter(get_enrichment_validate_curie_list_result()),
-            iter(get_enrichment_find_obsolete_terms_data()),
         ],
     )
     mocker.patch(
         "pandasaurus.curie_validator.run_sparql_query",
         side_effect=[
             iter(get_enrichment_validate_curie_list_result()),
-            iter(get_enrichment_find_obsolete_terms_data()),
         ],
     )
 
@@ -430,7 +467,6 @@ def test_get_most_specific_subjects(mocker):
         "pandasaurus.curie_validator.run_sparql_query",
         side_effect=[
             iter(get_enrichment_validate_curie_list_result()),
-            iter(get_enrichment_find_obsolete_terms_data()),
         ],
     )
 
@@ -447,7 +483,6 @@ def enrichment_instance(mocker):
         "pandasaurus.curie_validator.run_sparql_query",
         side_effect=[
             iter(get_enrichment_validate_curie_list_result()),
-            iter(get_enrichment_find_obsolete_terms_data()),
         ],
     )
     return Query(blood_and_immune_test_data)
@@ -465,3 +500,237 @@ def test_parent_enrichment(enrichment_instance, mocker):
     ancestor_enrichment_spy = mocker.spy(enrichment_instance, "ancestor_enrichment")
     enrichment_instance.parent_enrichment()
     ancestor_enrichment_spy.assert_called_once_with(1)
+
+
+def test_batched_enrichment_results_concurrent(mocker):
+    mocker.patch(
+        "pandasaurus.curie_validator.run_sparql_query",
+        side_effect=[
+            iter(get_enrichment_validate_curie_list_result()),
+        ],
+    )
+    q = Query(blood_and_immune_test_data, max_workers=4, query_timeout=10)
+    mocker.patch("pandasaurus.query.run_sparql_query", side_effect=lambda query: iter([{"o": query}]))
+    object_list = [f"CL:{i:07d}" for i in range(10)]
+
+    results = q._batched_enrichment_results(object_list, lambda chunk: " ".join(chunk), chunk_size=3)
+
+    assert results == [{"o": " ".join(chunk)} for chunk in chunks(object_list, 3)]
+
+
+def test_batch_enrichment_chunks_subjects_and_objects(mocker):
+    mocker.patch(
+        "pandasaurus.curie_validator.run_sparql_query",
+        side_effect=[iter(get_enrichment_validate_curie_list_result())],
+    )
+    result = get_simple_enrichment_result()
+    queried = []
+
+    def run_query(query):
+        subjects = re.search(r"VALUES \?s \{([^}]*)\}", query).group(1).split()
+        objects = re.search(r"VALUES \?o \{([^}]*)\}", query).group(1).split()
+        queried.append((len(subjects), len(objects)))
+        return iter([row for row in result if row["s"] in subjects and row["o"] in objects])
+
+    mocker.patch("pandasaurus.query.run_sparql_query", side_effect=run_query)
+    half = len(blood_and_immune_test_data) // 2
+    seed_lists = {"first": blood_and_immune_test_data[:half], "second": blood_and_immune_test_data[half:]}
+
+    results = Query.batch_enrichment(seed_lists, chunk_size=5)
+
+    assert not results["first"].empty
+    union_size = len(set(blood_and_immune_test_data))
+    chunk_count = len(list(chunks(range(union_size), 5)))
+    assert len(queried) == chunk_count**2
+    assert all(subject_count <= 5 and object_count <= 5 for subject_count, object_count in queried)
+    expected_df = pd.DataFrame(result, columns=["s", "s_label", "p", "o", "o_label"])
+    for name, seeds in seed_lists.items():
+        expected = expected_df[expected_df["s"].isin(seeds) & expected_df["o"].isin(seeds)]
+        assert sorted(zip(results[name]["s"], results[name]["o"])) == sorted(zip(expected["s"], expected["o"]))
+        assert results[name]["s"].is_monotonic_increasing
+
+
+def test_query_constructor_rejects_invalid_max_workers(mocker):
+    mocker.patch(
+        "pandasaurus.curie_validator.run_sparql_query",
+        side_effect=[
+            iter(get_enrichment_validate_curie_list_result()),
+        ],
+    )
+    with pytest.raises(ValueError):
+        Query(blood_and_immune_test_data, max_workers=0)
+
+
+def test_mirror_enrichment_for_graph_generation(enrichment_instance, mocker):
+    term_list = [f"CL:{i:07d}" for i in range(100)]
+    run_query_mock = mocker.patch(
+        "pandasaurus.query.run_sparql_query",
+        side_effect=[
+            iter(
+                [
+                    {"s": "CL:0000001", "s_label": "a", "p": "rdfs:subClassOf", "o": "CL:0000000", "o_label": "b"},
+                    {"s": "CL:0000001", "s_label": "a", "p": "rdfs:subClassOf", "o": "BFO:0000002", "o_label": "c"},
+                ]
+            ),
+            iter([{"s": "CL:0000099", "s_label": "d", "p": "rdfs:subClassOf", "o": "CL:0000000", "o_label": "b"}]),
+        ],
+    )
+
+    enrichment_instance.mirror_enrichment_for_graph_generation(term_list)
+
+    # One request per 90 subjects instead of one per subject/object chunk pair
+    assert run_query_mock.call_count == 2
+    assert enrichment_instance.graph_df["s"].tolist() == ["CL:0000001", "CL:0000099"]
+    assert set(enrichment_instance.graph_df["o"]) == {"CL:0000000"}
+
+
+def test_enrichment_graph_is_built_lazily(enrichment_instance, mocker):
+    run_query_mock = mocker.patch(
+        "pandasaurus.query.run_sparql_query",
+        side_effect=[
+            iter(get_simple_enrichment_result()),
+            iter(get_simple_enrichment_result()),
+        ],
+    )
+    enrichment_instance.simple_enrichment()
+    assert run_query_mock.call_count == 1
+
+    graph = enrichment_instance.graph
+    assert run_query_mock.call_count == 2
+    assert len(graph) > 0
+    assert not enrichment_instance.graph_df.empty
+    assert enrichment_instance.graph is graph
+    assert run_query_mock.call_count == 2
+
+
+def test_iter_simple_enrichment_yields_one_df_per_chunk(enrichment_instance, mocker):
+    run_query_mock = mocker.patch(
+        "pandasaurus.query.run_sparql_query",
+        side_effect=lambda query: iter(get_simple_enrichment_result()),
+    )
+    chunk_size = 10
+
+    dfs = list(enrichment_instance.iter_simple_enrichment(chunk_size=chunk_size))
+
+    chunk_count = len(list(chunks(blood_and_immune_test_data, chunk_size)))
+    assert run_query_mock.call_count == chunk_count
+    assert len(dfs) == chunk_count
+    assert all(list(df.columns) == ["s", "s_label", "p", "o", "o_label"] for df in dfs)
+    assert all(len(df) == len(get_simple_enrichment_result()) for df in dfs)
+    assert enrichment_instance.enriched_df.empty
+
+
+def test_iter_full_slim_enrichment(enrichment_instance, mocker):
+    mocker.patch(
+        "pandasaurus.slim_manager.run_sparql_query",
+        side_effect=[iter(get_slim_members_result())],
+    )
+    mocker.patch(
+        "pandasaurus.query.run_sparql_query",
+        side_effect=[
+            iter(
+                [
+                    {"s": "CL:0000787", "s_label": "memory B cell", "x": "CL:0000785", "x_label": "mature B cell"},
+                    {
+                        "s": "CL:0000084",
+                        "s_label": "T cell",
+                        "p": "RO:0002202",
+                        "x": "CL:0000000",
+                        "x_label": "cell",
+                    },
+                ]
+            )
+        ],
+    )
+
+    dfs = enrichment_instance.iter_full_slim_enrichment(slim_list, chunk_size=1000)
+    df = next(dfs)
+
+    assert df.to_dict("records") == [
+        {"s": "CL:0000084", "s_label": "T cell", "p": "RO:0002202", "o": "CL:0000000", "o_label": "cell"},
+        {
+            "s": "CL:0000787",
+            "s_label": "memory B cell",
+            "p": "rdfs:subClassOf",
+            "o": "CL:0000785",
+            "o_label": "mature B cell",
+        },
+    ]
+    with pytest.raises(StopIteration):
+        next(dfs)
+
+
+def test_iter_ancestor_enrichment_validates_step_count_eagerly(enrichment_instance):
+    with pytest.raises(ValueError):
+        enrichment_instance.iter_ancestor_enrichment(0)
+
+
+def test_enrichment_string_dtype(mocker):
+    mocker.patch(
+        "pandasaurus.curie_validator.run_sparql_query",
+        side_effect=[iter(get_enrichment_validate_curie_list_result())],
+    )
+    mocker.patch(
+        "pandasaurus.query.run_sparql_query",
+        side_effect=lambda query: iter(get_simple_enrichment_result()),
+    )
+    q = Query(blood_and_immune_test_data, string_dtype="category")
+
+    df = q.simple_enrichment()
+
+    assert all(isinstance(df[column].dtype, pd.CategoricalDtype) for column in ["s", "s_label", "p", "o", "o_label"])
+    assert df["s"].astype(object).tolist() == sorted(res["s"] for res in get_simple_enrichment_result())
+    assert isinstance(q.graph_df["s"].dtype, pd.CategoricalDtype)
+    assert len(q.graph) > 0
+
+
+def test_enrichment_string_dtype_auto(enrichment_instance, mocker):
+    mocker.patch(
+        "pandasaurus.query.run_sparql_query",
+        side_effect=lambda query: iter(get_simple_enrichment_result()),
+    )
+
+    assert enrichment_instance.simple_enrichment()["s"].dtype == object
+
+    mocker.patch.object(Query, "_CATEGORICAL_MIN_ROWS", 1)
+    assert isinstance(enrichment_instance.simple_enrichment()["s"].dtype, pd.CategoricalDtype)
+
+
+def test_add_seeds_only_queries_new_rows(mocker):
+    mocker.patch(
+        "pandasaurus.curie_validator.run_sparql_query",
+        side_effect=[
+            iter([{"term": "CL:0000084", "label": "T cell"}, {"term": "CL:0000787", "label": "memory B cell"}]),
+            iter([{"term": "CL:0000813", "label": "memory T cell"}]),
+        ],
+    )
+    run_query_mock = mocker.patch(
+        "pandasaurus.query.run_sparql_query",
+        side_effect=[
+            iter([]),
+            iter(
+                [
+                    {
+                        "s": "CL:0000813",
+                        "s_label": "memory T cell",
+                        "p": "rdfs:subClassOf",
+                        "o": "CL:0000084",
+                        "o_label": "T cell",
+                    }
+                ]
+            ),
+            iter([]),
+        ],
+    )
+    q = Query(["CL:0000084", "CL:0000787"])
+    q.simple_enrichment()
+
+    enriched_df = q.add_seeds(["CL:0000813", "CL:0000084"])
+
+    new_subject_query, new_object_query = (call.args[0] for call in run_query_mock.call_args_list[1:])
+    assert "VALUES ?s { CL:0000813 }" in new_subject_query
+    assert "VALUES ?o { CL:0000084 CL:0000787 CL:0000813 }" in new_subject_query
+    assert "VALUES ?s { CL:0000084 CL:0000787 }" in new_object_query
+    assert "VALUES ?o { CL:0000813 }" in new_object_query
+    assert enriched_df["s"].tolist() == ["CL:0000813"]
+    assert q._term_iri_list == ["CL:0000084", "CL:0000787", "CL:0000813"]
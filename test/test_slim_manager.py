@@ -48,3 +48,92 @@ def test_get_slim_members(mocker):
     get_slim_members = SlimManager.get_slim_members(slim_list)
 
     assert get_slim_members == get_expected_slim_members()
+
+
+def test_get_slim_members_uses_one_query_for_all_slims(mocker):
+    run_query_mock = mocker.patch(
+        "pandasaurus.slim_manager.run_sparql_query",
+        side_effect=[
+            iter(
+                [
+                    {"slim_name": "kidney_upper_slim", "term": "CL:0002518"},
+                    {"slim_name": "blood_and_immune_upper_slim", "term": "CL:0000084"},
+                    {"slim_name": "kidney_upper_slim", "term": "CL:0002681"},
+                ]
+            )
+        ],
+    )
+
+    slim_members = SlimManager.get_slim_members(["blood_and_immune_upper_slim", "kidney_upper_slim", "unknown_slim"])
+
+    assert run_query_mock.call_count == 1
+    assert slim_members == ["CL:0000084", "CL:0002518", "CL:0002681"]
+
+
+def test_get_slim_members_is_memoized(mocker):
+    run_query_mock = mocker.patch(
+        "pandasaurus.slim_manager.run_sparql_query",
+        side_effect=[
+            iter(get_slim_members_result()),
+            iter([{"slim_name": "kidney_upper_slim", "term": "CL:0002518"}]),
+        ],
+    )
+
+    SlimManager.get_slim_members(get_slim_list())
+    slim_members = SlimManager.get_slim_members(["kidney_upper_slim"] + get_slim_list())
+
+    assert run_query_mock.call_count == 2
+    assert "blood_and_immune_upper_slim" not in run_query_mock.call_args.args[0]
+    assert slim_members == ["CL:0002518"] + get_expected_slim_members()
+
+    SlimManager.clear_cache()
+    with pytest.raises(StopIteration):
+        SlimManager.get_slim_members(get_slim_list())
+
+
+def test_get_slim_list_is_memoized(mocker):
+    run_query_mock = mocker.patch(
+        "pandasaurus.slim_manager.run_sparql_query",
+        side_effect=[
+            iter(get_ontology_list_result()),
+            iter(get_get_slim_list_result()),
+        ],
+    )
+
+    SlimManager.get_slim_list("Cell Ontology")
+    with pytest.raises(InvalidOntology):
+        SlimManager.get_slim_list("Call Ontology")
+
+    assert SlimManager.get_slim_list("Cell Ontology") == get_valid_ontology_expected_message()
+    assert run_query_mock.call_count == 2
+
+
+def test_slim_manager_cache_expires(mocker):
+    monotonic = mocker.patch("pandasaurus.slim_manager.time.monotonic", return_value=100.0)
+    mocker.patch.object(SlimManager, "cache_ttl", 10)
+    run_query_mock = mocker.patch(
+        "pandasaurus.slim_manager.run_sparql_query",
+        side_effect=[iter(get_ontology_list_result()), iter(get_ontology_list_result())],
+    )
+
+    SlimManager._get_ontology_list()
+    monotonic.return_value = 105.0
+    SlimManager._get_ontology_list()
+    assert run_query_mock.call_count == 1
+
+    monotonic.return_value = 111.0
+    SlimManager._get_ontology_list()
+    assert run_query_mock.call_count == 2
+
+
+def test_slim_manager_clear_cache_refreshes_ontology_list(mocker):
+    run_query_mock = mocker.patch(
+        "pandasaurus.slim_manager.run_sparql_query",
+        side_effect=[iter(get_ontology_list_result()), iter([{"title": "Cell Ontology"}])],
+    )
+
+    SlimManager._get_ontology_list()
+    SlimManager.clear_cache()
+
+    assert SlimManager._get_ontology_list() == ["Cell Ontology"]
+    assert run_query_mock.call_count == 2
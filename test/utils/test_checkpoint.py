@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from pandasaurus.utils.checkpoint import EnrichmentCheckpoint
+
+
+def test_rows_are_fetched_once_and_persisted(tmp_path, mocker):
+    fetch = mocker.Mock(return_value=[{"s": "CL:0000084", "o": "CL:0000000"}])
+    checkpoint = EnrichmentCheckpoint(tmp_path / "job")
+
+    assert checkpoint.rows("SELECT ?s WHERE { ?s ?p ?o }", fetch) == fetch.return_value
+    assert checkpoint.rows("SELECT ?s  WHERE {\n ?s ?p ?o }", fetch) == fetch.return_value
+    fetch.assert_called_once()
+
+    key = EnrichmentCheckpoint.chunk_hash("SELECT ?s WHERE { ?s ?p ?o }")
+    assert checkpoint.completed == {key}
+    assert (tmp_path / "job" / "manifest.journal").read_text() == f"{key}\n"
+    assert json.loads((tmp_path / "job" / "parts" / f"{key}.json").read_text()) == fetch.return_value
+
+
+def test_journal_is_compacted_into_the_manifest_on_load(tmp_path):
+    checkpoint = EnrichmentCheckpoint(tmp_path)
+    assert json.loads((tmp_path / "manifest.json").read_text()) == {"chunk_size": 90, "chunks": []}
+    checkpoint.rows("query 1", lambda: [])
+    checkpoint.rows("query 2", lambda: [])
+    keys = sorted(EnrichmentCheckpoint.chunk_hash(query) for query in ["query 1", "query 2"])
+    with (tmp_path / "manifest.journal").open("a") as journal:
+        journal.write(keys[0][:20])
+
+    assert EnrichmentCheckpoint(tmp_path).completed == set(keys)
+    assert json.loads((tmp_path / "manifest.json").read_text()) == {"chunk_size": 90, "chunks": keys}
+    assert not (tmp_path / "manifest.journal").exists()
+
+
+def test_checkpoint_resumes_from_manifest(tmp_path, mocker):
+    EnrichmentCheckpoint(tmp_path).rows("query 1", lambda: [{"o": "1"}])
+
+    resumed = EnrichmentCheckpoint(tmp_path)
+    fetch = mocker.Mock(return_value=[{"o": "2"}])
+    assert len(resumed) == 1
+    assert resumed.rows("query 1", fetch) == [{"o": "1"}]
+    assert resumed.rows("query 2", fetch) == [{"o": "2"}]
+    fetch.assert_called_once()
+
+
+def test_failed_fetch_is_not_recorded(tmp_path, mocker):
+    checkpoint = EnrichmentCheckpoint(tmp_path)
+    fetch = mocker.Mock(side_effect=[RuntimeError("timeout"), [{"o": "1"}]])
+    with pytest.raises(RuntimeError):
+        checkpoint.rows("query", fetch)
+    assert len(checkpoint) == 0
+    assert checkpoint.rows("query", fetch) == [{"o": "1"}]
+
+
+def test_clear(tmp_path):
+    checkpoint = EnrichmentCheckpoint(tmp_path)
+    checkpoint.rows("query", lambda: [])
+    checkpoint.clear()
+    assert len(checkpoint) == 0
+    assert list((tmp_path / "parts").iterdir()) == []
+    assert not (tmp_path / "manifest.json").exists()
+    assert not (tmp_path / "manifest.journal").exists()
+    assert len(EnrichmentCheckpoint(tmp_path)) == 0
+
+
+def test_resumed_job_keeps_its_chunk_size(tmp_path):
+    EnrichmentCheckpoint(tmp_path, chunk_size=25).rows("query", lambda: [])
+    assert EnrichmentCheckpoint(tmp_path, chunk_size=90).chunk_size == 25
+    assert EnrichmentCheckpoint(tmp_path / "new", chunk_size=40).chunk_size == 40
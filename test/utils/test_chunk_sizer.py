@@ -0,0 +1,59 @@
+import pytest
+
+from pandasaurus.utils.chunk_sizer import AdaptiveChunkSizer
+
+
+def test_chunk_size_grows_additively_on_fast_chunks():
+    sizer = AdaptiveChunkSizer(initial_size=50, max_size=65, increase_step=10)
+    sizer.record(50, latency=1.0)
+    assert sizer.chunk_size == 60
+    sizer.record(60, latency=1.0)
+    assert sizer.chunk_size == 65
+
+
+def test_tail_chunks_do_not_grow_chunk_size():
+    sizer = AdaptiveChunkSizer(initial_size=50)
+    sizer.record(7, latency=1.0)
+    assert sizer.chunk_size == 50
+
+
+@pytest.mark.parametrize(
+    "outcome",
+    [{"latency": 30.0}, {"latency": 1.0, "failed": True}, {"latency": 1.0, "row_count": 5000}],
+)
+def test_chunk_size_shrinks_multiplicatively(outcome):
+    sizer = AdaptiveChunkSizer(initial_size=80, min_size=30, target_latency=10.0, max_rows=1000)
+    sizer.record(80, **outcome)
+    assert sizer.chunk_size == 40
+    sizer.record(40, **outcome)
+    assert sizer.chunk_size == 30
+
+
+def test_chunks_follow_current_chunk_size():
+    sizer = AdaptiveChunkSizer(initial_size=10, min_size=1, increase_step=5)
+    items = list(range(40))
+    sizes = []
+    for chunk in sizer.chunks(items):
+        sizes.append(len(chunk))
+        sizer.record(len(chunk), latency=0.1)
+    assert sizes == [10, 15, 15]
+
+
+def test_measure_records_failures():
+    sizer = AdaptiveChunkSizer(initial_size=20, min_size=1)
+
+    def failing(chunk):
+        raise TimeoutError
+
+    with pytest.raises(TimeoutError):
+        sizer.measure(failing)(list(range(20)))
+    assert sizer.chunk_size == 10
+    assert sizer.measure(lambda chunk: list(chunk))(list(range(10))) == list(range(10))
+    assert sizer.chunk_size == 20
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        AdaptiveChunkSizer(initial_size=5, min_size=10)
+    with pytest.raises(ValueError):
+        AdaptiveChunkSizer(decrease_factor=1.5)
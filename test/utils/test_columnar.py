@@ -0,0 +1,39 @@
+import pandas as pd
+
+from pandasaurus.utils.columnar import ColumnarResultBuilder
+
+rows = [
+    {"s": "CL:0000236", "p": "rdfs:subClassOf", "o": "CL:0000000"},
+    {"s": "CL:0000084", "o": "CL:0000000"},
+    {"s": "CL:0000236", "p": "rdfs:subClassOf", "o": "CL:0000084"},
+]
+
+
+def test_to_frame_matches_row_dataframe():
+    builder = ColumnarResultBuilder(["s", "p", "o"])
+    builder.add_rows(iter(rows))
+    assert len(builder) == 3
+    pd.testing.assert_frame_equal(builder.to_frame(), pd.DataFrame(rows, columns=["s", "p", "o"]))
+
+
+def test_to_frame_with_categorical_columns():
+    builder = ColumnarResultBuilder(["s", "p", "o"])
+    builder.add_rows(rows)
+    df = builder.to_frame(categorical=True)
+    assert all(isinstance(dtype, pd.CategoricalDtype) for dtype in df.dtypes)
+    assert list(df["s"].cat.categories) == ["CL:0000084", "CL:0000236"]
+    pd.testing.assert_frame_equal(df, pd.DataFrame(rows, columns=["s", "p", "o"]).astype("category"))
+    assert df.sort_values("s")["s"].tolist() == ["CL:0000084", "CL:0000236", "CL:0000236"]
+
+
+def test_variables_and_fill_values():
+    builder = ColumnarResultBuilder(["s", "p", "o"], fill_values={"p": "rdfs:subClassOf"})
+    builder.add_rows([{"s": "CL:0000084", "x": "CL:0000000"}], variables=["s", "p", "x"])
+    assert builder.to_frame().to_dict("records") == [{"s": "CL:0000084", "p": "rdfs:subClassOf", "o": "CL:0000000"}]
+
+
+def test_empty_result():
+    builder = ColumnarResultBuilder(["s", "o"])
+    builder.add_rows([])
+    assert builder.to_frame().empty
+    assert list(builder.to_frame(categorical=True).columns) == ["s", "o"]
@@ -1,6 +1,22 @@
+import time
+from concurrent.futures import TimeoutError
+
 import pytest
+import requests
 
-from pandasaurus.utils.query_utils import chunks, get_prefixes, run_sparql_query
+from pandasaurus.backends.http_backend import HttpSparqlBackend
+from pandasaurus.utils.chunk_sizer import AdaptiveChunkSizer
+from pandasaurus.utils.query_utils import (
+    chunks,
+    get_chunk_sizer,
+    get_prefixes,
+    get_resilience_policy,
+    map_chunks,
+    map_in_order,
+    run_sparql_query,
+    set_chunk_sizer,
+    set_resilience_policy,
+)
 
 
 def test_run_sparql_query():
@@ -21,6 +37,29 @@ def test_chunks():
     assert result == [[1, 2], [3, 4], [5, 6]]
 
 
+def test_map_in_order_serial():
+    assert list(map_in_order(lambda x: x * 2, [1, 2, 3])) == [2, 4, 6]
+
+
+def test_map_in_order_concurrent_keeps_input_order():
+    def slow_identity(x):
+        # Earlier items finish last, so the result order must come from the input order.
+        time.sleep(0.01 * (5 - x))
+        return x
+
+    assert list(map_in_order(slow_identity, range(5), max_workers=3)) == [0, 1, 2, 3, 4]
+
+
+def test_map_in_order_timeout():
+    with pytest.raises(TimeoutError):
+        list(map_in_order(lambda x: time.sleep(0.5), [1, 2], max_workers=2, timeout=0.01))
+
+
+def test_map_in_order_invalid_max_workers():
+    with pytest.raises(ValueError):
+        list(map_in_order(lambda x: x, [1], max_workers=0))
+
+
 def test_get_prefixes():
     text = (
         "PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#> PREFIX CL: <http://purl.obolibrary.org/obo/CL_> "
@@ -36,3 +75,79 @@ def test_get_prefixes():
     }
     result = get_prefixes(text, prefix_map)
     assert result == ["rdfs", "CL", "owl", "UBERON", "BFO"]
+
+
+def test_get_prefixes_matches_whole_prefixes_only():
+    text = (
+        "SELECT * WHERE { VALUES ?s { CL:0000084 PCL:0000001 } ?s rdfs:label ?label. "
+        "?s rdfs:isDefinedBy <http://purl.obolibrary.org/obo/cl.owl> }"
+    )
+    result = get_prefixes(text, ["PCL", "CL", "rdfs", "obo", "owl"])
+    assert result == ["CL", "PCL", "rdfs"]
+
+
+def test_known_prefixes_memoized(mocker):
+    backend = HttpSparqlBackend(prefix_map={"CL": "http://purl.obolibrary.org/obo/CL_"})
+    prefix_map_spy = mocker.spy(backend, "prefix_map")
+    assert backend.known_prefixes() == {"CL"}
+    assert backend.known_prefixes() == {"CL"}
+    assert prefix_map_spy.call_count == 1
+
+
+def test_map_chunks_uses_default_or_fixed_chunk_size():
+    items = list(range(200))
+    assert [len(chunk) for chunk in map_chunks(list, items)] == [90, 90, 20]
+    assert [len(chunk) for chunk in map_chunks(list, items, chunk_size=150)] == [150, 50]
+
+
+def test_map_chunks_uses_installed_chunk_sizer():
+    chunk_sizer = AdaptiveChunkSizer(initial_size=20, min_size=1, increase_step=20)
+    set_chunk_sizer(chunk_sizer)
+    try:
+        assert [len(chunk) for chunk in map_chunks(list, list(range(100)))] == [20, 40, 40]
+        assert get_chunk_sizer() is chunk_sizer
+        assert [len(chunk) for chunk in map_chunks(list, list(range(100)), chunk_size=50)] == [50, 50]
+    finally:
+        set_chunk_sizer(None)
+    assert chunk_sizer.chunk_size == 60
+
+
+def test_map_chunks_retries_failed_chunks(mocker):
+    mocker.patch("pandasaurus.utils.resilience.time.sleep")
+    calls = []
+
+    def query(chunk):
+        calls.append(len(chunk))
+        if len(calls) == 2:
+            raise requests.ConnectionError()
+        return list(chunk)
+
+    assert list(map_chunks(query, list(range(200)))) == [list(range(90)), list(range(90, 180)), list(range(180, 200))]
+    assert calls == [90, 90, 90, 20]
+
+
+def test_map_chunks_without_resilience_policy_fails_fast(mocker):
+    query = mocker.Mock(side_effect=requests.ConnectionError())
+    policy = get_resilience_policy()
+    set_resilience_policy(None)
+    try:
+        with pytest.raises(requests.ConnectionError):
+            list(map_chunks(query, list(range(10))))
+    finally:
+        set_resilience_policy(policy)
+    assert query.call_count == 1
+
+
+def test_map_chunks_splits_chunks_that_time_out_on_a_worker():
+    calls = []
+
+    def query(chunk):
+        calls.append(len(chunk))
+        if 0 in chunk and len(chunk) > 5:
+            time.sleep(0.5)
+        return list(chunk)
+
+    results = list(map_chunks(query, list(range(40)), chunk_size=10, max_workers=2, timeout=0.2))
+    assert results == [list(range(10)), list(range(10, 20)), list(range(20, 30)), list(range(30, 40))]
+    assert sorted(calls) == [5, 5, 10, 10, 10, 10]
+    assert get_resilience_policy().circuit_breaker.state == "closed"
@@ -0,0 +1,147 @@
+import urllib.error
+
+import pytest
+import requests
+
+from pandasaurus.utils.pandasaurus_exceptions import CircuitOpenError
+from pandasaurus.utils.resilience import (
+    CircuitBreaker,
+    ResiliencePolicy,
+    is_timeout_error,
+    is_transient_error,
+)
+
+
+def http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(response=response)
+
+
+@pytest.fixture
+def sleep(mocker):
+    return mocker.patch("pandasaurus.utils.resilience.time.sleep")
+
+
+@pytest.mark.parametrize(
+    "error, transient, timeout",
+    [
+        (http_error(502), True, False),
+        (http_error(504), True, True),
+        (http_error(400), False, False),
+        (urllib.error.HTTPError("url", 503, "Service Unavailable", None, None), True, False),
+        (requests.ConnectionError(), True, False),
+        (requests.ReadTimeout(), True, True),
+        (requests.ConnectTimeout(), True, False),
+        (ConnectionRefusedError(), True, False),
+        (TimeoutError(), True, True),
+        (ValueError(), False, False),
+    ],
+)
+def test_error_classification(error, transient, timeout):
+    assert is_transient_error(error) is transient
+    assert is_timeout_error(error) is timeout
+
+
+def test_transient_failures_are_retried_with_growing_delays(mocker, sleep):
+    mocker.patch("pandasaurus.utils.resilience.random.uniform", side_effect=lambda low, high: high)
+    func = mocker.Mock(side_effect=[http_error(502), requests.ConnectionError(), ["row"]])
+    policy = ResiliencePolicy(max_attempts=3, base_delay=1.0)
+    assert policy.call(func, ["a", "b"]) == ["row"]
+    assert func.call_count == 3
+    assert [call.args[0] for call in sleep.call_args_list] == [1.0, 2.0]
+    assert policy.circuit_breaker.state == "closed"
+
+
+def test_backoff_delay_is_jittered_and_capped():
+    policy = ResiliencePolicy(base_delay=1.0, max_delay=5.0)
+    assert 0.5 <= policy.backoff_delay(1) <= 1.0
+    assert 2.5 <= policy.backoff_delay(10) <= 5.0
+
+
+def test_retries_give_up_after_max_attempts(mocker, sleep):
+    func = mocker.Mock(side_effect=http_error(503))
+    with pytest.raises(requests.HTTPError):
+        ResiliencePolicy(max_attempts=3).call(func, ["a"])
+    assert func.call_count == 3
+
+
+def test_permanent_failures_are_not_retried(mocker, sleep):
+    func = mocker.Mock(side_effect=http_error(400))
+    policy = ResiliencePolicy()
+    with pytest.raises(requests.HTTPError):
+        policy.call(func, ["a"])
+    assert func.call_count == 1
+    sleep.assert_not_called()
+    assert policy.circuit_breaker._failures == 0
+
+
+def test_timed_out_chunks_are_bisected(sleep):
+    def query(chunk):
+        if len(chunk) > 2:
+            raise requests.ReadTimeout()
+        return [f"row-{item}" for item in chunk]
+
+    policy = ResiliencePolicy(circuit_breaker=CircuitBreaker(failure_threshold=1))
+    assert policy.call(query, list("abcdefg")) == [f"row-{item}" for item in "abcdefg"]
+    sleep.assert_not_called()
+
+
+def test_single_item_timeouts_are_retried(mocker, sleep):
+    func = mocker.Mock(side_effect=[TimeoutError(), ["row"]])
+    assert ResiliencePolicy().call(func, ["a"]) == ["row"]
+    assert func.call_count == 2
+
+
+def test_connect_timeouts_are_retried_and_open_the_circuit(mocker, sleep):
+    breaker = CircuitBreaker(failure_threshold=10)
+    func = mocker.Mock(side_effect=requests.ConnectTimeout())
+    with pytest.raises(requests.ConnectTimeout):
+        ResiliencePolicy(max_attempts=3, circuit_breaker=breaker).call(func, list(range(90)))
+    assert [len(call.args[0]) for call in func.call_args_list] == [90, 90, 90]
+    assert breaker._failures == 3
+
+
+def test_circuit_opens_after_consecutive_failures(mocker, sleep):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60.0)
+    policy = ResiliencePolicy(max_attempts=5, circuit_breaker=breaker)
+    func = mocker.Mock(side_effect=requests.ConnectionError())
+    with pytest.raises(CircuitOpenError):
+        policy.call(func, ["a"])
+    assert func.call_count == 2
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        policy.call(func, ["b"])
+    assert func.call_count == 2
+
+
+def test_circuit_half_opens_after_reset_timeout(mocker):
+    clock = mocker.patch("pandasaurus.utils.resilience.time.monotonic", return_value=100.0)
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0)
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_call()
+    assert exc_info.value.retry_after == 30.0
+
+    clock.return_value = 131.0
+    assert breaker.state == "half-open"
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.return_value = 162.0
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_deep_bisection_does_not_open_the_circuit(sleep):
+    def query(chunk):
+        if len(chunk) > 20:
+            raise requests.ReadTimeout()
+        return list(chunk)
+
+    policy = ResiliencePolicy()
+    assert policy.call(query, list(range(700))) == list(range(700))
+    assert policy.circuit_breaker.state == "closed"
+    sleep.assert_not_called()
@@ -0,0 +1,76 @@
+import time
+
+import pytest
+
+from pandasaurus.utils import query_utils
+from pandasaurus.utils.query_utils import run_sparql_query, set_sparql_cache
+from pandasaurus.utils.sparql_cache import SQLiteSparqlCache, normalize_query
+
+rows = [{"term": "CL:0000084", "label": "T cell"}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    sqlite_cache = SQLiteSparqlCache(str(tmp_path / "cache.sqlite"), release="2024-01-01")
+    yield sqlite_cache
+    sqlite_cache.close()
+
+
+def test_normalize_query_keeps_literals():
+    query = "SELECT ?term\n  WHERE {  ?term rdfs:label 'T  cell' }"
+    assert normalize_query(query) == "SELECT ?term WHERE { ?term rdfs:label 'T  cell' }"
+
+
+def test_cache_hit_ignores_formatting(cache):
+    cache.set("SELECT * WHERE { ?s ?p ?o }", ["rdfs"], rows)
+    assert cache.get("SELECT *\n  WHERE {  ?s ?p ?o }", ["rdfs"]) == rows
+    assert cache.get("SELECT * WHERE { ?s ?p ?o }", ["CL"]) is None
+
+
+def test_cache_release_namespace(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    old_cache = SQLiteSparqlCache(path, release="2024-01-01")
+    old_cache.set("SELECT * WHERE { ?s ?p ?o }", [], rows)
+    old_cache.close()
+
+    new_cache = SQLiteSparqlCache(path, release="2024-06-01")
+    assert new_cache.get("SELECT * WHERE { ?s ?p ?o }", []) is None
+    assert len(new_cache) == 0
+    new_cache.close()
+
+
+def test_cache_ttl(tmp_path):
+    ttl_cache = SQLiteSparqlCache(str(tmp_path / "cache.sqlite"), release="2024-01-01", ttl=0.01)
+    ttl_cache.set("SELECT * WHERE { ?s ?p ?o }", [], rows)
+    time.sleep(0.02)
+    assert ttl_cache.get("SELECT * WHERE { ?s ?p ?o }", []) is None
+    assert len(ttl_cache) == 0
+    ttl_cache.close()
+
+
+def test_cache_max_entries_evicts_least_recently_used(tmp_path):
+    lru_cache = SQLiteSparqlCache(str(tmp_path / "cache.sqlite"), release="2024-01-01", max_entries=2)
+    lru_cache.set("query 1", [], rows)
+    lru_cache.set("query 2", [], rows)
+    time.sleep(0.01)
+    lru_cache.get("query 1", [])
+    lru_cache.set("query 3", [], rows)
+    assert lru_cache.get("query 1", []) == rows
+    assert lru_cache.get("query 2", []) is None
+    assert len(lru_cache) == 2
+    lru_cache.close()
+
+
+def test_run_sparql_query_uses_cache(cache, mocker):
+    backend_mock = mocker.patch.object(query_utils, "_backend")
+    backend_mock.prefix_map.return_value = {"rdfs": "http://www.w3.org/2000/01/rdf-schema#"}
+    backend_mock.query.return_value = iter(rows)
+    set_sparql_cache(cache)
+    try:
+        first = list(run_sparql_query("SELECT ?term ?label WHERE { ?term rdfs:label ?label }"))
+        second = list(run_sparql_query("SELECT ?term ?label WHERE { ?term  rdfs:label ?label }"))
+    finally:
+        set_sparql_cache(None)
+
+    assert first == second == rows
+    assert backend_mock.query.call_count == 1
@@ -9,11 +9,14 @@ from pandasaurus.utils.sparql_queries import (
     get_label_query,
     get_most_specific_objects_query,
     get_most_specific_subjects_query,
+    get_outgoing_edges_query,
     get_replaced_by_query,
     get_simple_enrichment_query,
     get_slim_list_query,
+    get_slim_members_batch_query,
     get_slim_members_query,
     get_synonym_query,
+    get_term_validation_query,
 )
 
 
@@ -33,6 +36,18 @@ def test_get_simple_enrichment_query():
     assert query == expected_query
 
 
+def test_get_outgoing_edges_query():
+    query = get_outgoing_edges_query(["CL:0000084", "CL:0000787"], ["rdfs:subClassOf"])
+
+    expected_query = (
+        "SELECT ?s ?s_label ?p ?o ?o_label WHERE { GRAPH <http://reasoner.renci.org/redundant> {"
+        "VALUES ?s { CL:0000084 CL:0000787 } VALUES ?p { rdfs:subClassOf }"
+        "?s ?p ?o. } ?s rdfs:label ?s_label. ?o rdfs:label ?o_label. FILTER(?s != ?o)}# LIMIT"
+    )
+
+    assert query == expected_query
+
+
 def test_get_minimal_enrichment_query():
     pass
 
@@ -161,6 +176,29 @@ def test_get_slim_members_query():
     assert query == expected_query
 
 
+def test_get_slim_members_batch_query():
+    query = get_slim_members_batch_query(["blood_and_immune_upper_slim", "kidney_upper_slim"])
+
+    expected_query = (
+        "SELECT ?slim_name ?term WHERE { VALUES ?slim_name { 'blood_and_immune_upper_slim' 'kidney_upper_slim' } "
+        "?term oio:inSubset ?slim. ?slim rdfs:label ?slim_label. FILTER(str(?slim_label) = ?slim_name) }# LIMIT"
+    )
+
+    assert query == expected_query
+
+
+def test_get_slim_members_batch_query_matches_labels_like_single_slim_query():
+    single_query = get_slim_members_query("slim_name")
+    batch_query = get_slim_members_batch_query(["slim_name"])
+
+    # Both compare the lexical form of the label, so language tagged or typed labels are matched as well
+    assert "?term oio:inSubset ?slim." in single_query
+    assert "?term oio:inSubset ?slim." in batch_query
+    assert "FILTER(str(?slim_name) = 'slim_name')" in single_query
+    assert "VALUES ?slim_name { 'slim_name' }" in batch_query
+    assert "FILTER(str(?slim_label) = ?slim_name)" in batch_query
+
+
 def test_get_most_specific_objects_query():
     assert (
         len(
@@ -181,3 +219,16 @@ def test_get_most_specific_subjects_query():
         )
         == 706
     )
+
+
+def test_get_term_validation_query():
+    query = get_term_validation_query(["CL:0000084", "CL:0011107"])
+
+    expected_query = (
+        "SELECT ?term ?label ?depr_status ?new_term ?new_term_label WHERE { ?term rdf:type owl:Class. "
+        "OPTIONAL { ?term rdfs:label ?label. } OPTIONAL { ?term owl:deprecated ?depr_status. "
+        "?term IAO:0100001 ?new_term. ?new_term rdfs:label ?new_term_label. } "
+        "VALUES ?term { CL:0000084 CL:0011107} }# LIMIT"
+    )
+
+    assert query == expected_query
@@ -0,0 +1,59 @@
+import pytest
+
+from pandasaurus.utils.term_registry import TermRegistry
+
+
+def _entry(label):
+    return {"label": label, "valid": True, "new_term": None, "new_term_label": None}
+
+
+def test_term_registry_get_many_returns_known_terms_only():
+    registry = TermRegistry()
+    registry.update({"CL:0000084": _entry("T cell")})
+
+    assert registry.get_many(["CL:0000084", "CL:0000787"]) == {"CL:0000084": _entry("T cell")}
+    assert "CL:0000084" in registry
+    assert "CL:0000787" not in registry
+
+
+def test_term_registry_evicts_least_recently_used():
+    registry = TermRegistry(max_size=2)
+    registry.update({"CL:0000084": _entry("T cell"), "CL:0000787": _entry("memory B cell")})
+    registry.get_many(["CL:0000084"])
+    registry.update({"CL:0000798": _entry("gamma-delta T cell")})
+
+    assert len(registry) == 2
+    assert set(registry.get_many(["CL:0000084", "CL:0000787", "CL:0000798"])) == {"CL:0000084", "CL:0000798"}
+
+
+def test_term_registry_expires_entries(mocker):
+    monotonic = mocker.patch("pandasaurus.utils.term_registry.time.monotonic", return_value=100.0)
+    registry = TermRegistry(ttl=10)
+    registry.update({"CL:0000084": _entry("T cell")})
+
+    monotonic.return_value = 105.0
+    assert "CL:0000084" in registry
+    monotonic.return_value = 111.0
+    assert "CL:0000084" not in registry
+    assert len(registry) == 0
+
+
+def test_term_registry_returns_copies():
+    registry = TermRegistry()
+    registry.update({"CL:0000084": _entry("T cell")})
+    registry.get_many(["CL:0000084"])["CL:0000084"]["label"] = "changed"
+
+    assert registry.get_many(["CL:0000084"])["CL:0000084"]["label"] == "T cell"
+
+
+def test_term_registry_clear():
+    registry = TermRegistry()
+    registry.update({"CL:0000084": _entry("T cell")})
+    registry.clear()
+
+    assert len(registry) == 0
+
+
+def test_term_registry_requires_positive_max_size():
+    with pytest.raises(ValueError):
+        TermRegistry(max_size=0)